@@ -1,57 +1,94 @@
 """Configuration settings for the MCP Visual Design Service."""
 
-import os
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import AliasChoices, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """Application settings."""
+    """Application settings.
 
-    # Service configuration
-    host: str = Field(default="0.0.0.0", env="MCP_VISUAL_SERVICE_HOST")
-    port: int = Field(default=8004, env="MCP_VISUAL_SERVICE_PORT")
-    environment: str = Field(default="development", env="ENVIRONMENT")
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
+    Fields are read from the environment variable of the same name
+    (case-insensitive); only the service host/port carry an alias because
+    their variable names diverge from the field names.
+    """
 
-    # Provider configuration
-    fal_api_key: Optional[str] = Field(default=None, env="FAL_API_KEY")
-    fal_text_to_image_model: str = Field(
-        default="fal-ai/flux/schnell", env="FAL_TEXT_TO_IMAGE_MODEL"
-    )
-    fal_image_to_image_model: str = Field(
-        default="fal-ai/flux/schnell", env="FAL_IMAGE_TO_IMAGE_MODEL"
+    model_config = SettingsConfigDict(
+        env_prefix="",
+        env_file=".env",
+        case_sensitive=False,
+        populate_by_name=True,
+        extra="ignore",
     )
 
-    openrouter_api_key: Optional[str] = Field(default=None, env="OPENROUTER_API_KEY")
-    openrouter_default_model: str = Field(
-        default="black-forest-labs/flux-1.1-pro", env="OPENROUTER_DEFAULT_MODEL"
+    # Service configuration
+    host: str = Field(
+        default="0.0.0.0",
+        validation_alias=AliasChoices("MCP_VISUAL_SERVICE_HOST", "host"),
     )
-    openrouter_backup_model: str = Field(
-        default="black-forest-labs/flux-1-schnell", env="OPENROUTER_BACKUP_MODEL"
+    port: int = Field(
+        default=8004,
+        validation_alias=AliasChoices("MCP_VISUAL_SERVICE_PORT", "port"),
     )
+    environment: str = "development"
+    log_level: str = "INFO"
+
+    # Provider configuration
+    fal_api_key: Optional[str] = None
+    fal_text_to_image_model: str = "fal-ai/flux/schnell"
+    fal_image_to_image_model: str = "fal-ai/flux/schnell"
+
+    openrouter_api_key: Optional[str] = None
+    openrouter_default_model: str = "black-forest-labs/flux-1.1-pro"
+    openrouter_backup_model: str = "black-forest-labs/flux-1-schnell"
+
+    # Maximum in-flight requests per provider; OpenRouter quota is shared
+    fal_max_concurrent: int = 16
+    openrouter_max_concurrent: int = 8
+    # Sustained generation/upscale requests per second sent to each provider
+    fal_requests_per_second: float = 10.0
+    openrouter_requests_per_second: float = 4.0
+    # Generations admitted at once per provider across all VisualService calls
+    generation_concurrency: int = 3
+    # PayloadCMS uploads in flight per storyboard; uploads overlap generations
+    upload_concurrency: int = 6
+    # Storyboard frames rendered concurrently per render-frames request
+    render_concurrency: int = 4
+
+    # Seconds to reuse provider health results between checks
+    health_cache_ttl: float = 5.0
+    # Seconds a single provider health check may take
+    health_check_timeout: float = 2.0
+    # Upper bound on provider health checks running at once
+    max_concurrent_health_checks: int = 8
+    # Seconds between background refreshes of /visual/providers
+    providers_refresh_interval: float = 30.0
 
     # PayloadCMS configuration
-    payloadcms_api_url: str = Field(
-        default="http://localhost:3000/api", env="PAYLOADCMS_API_URL"
-    )
-    payloadcms_api_key: Optional[str] = Field(default=None, env="PAYLOADCMS_API_KEY")
+    payloadcms_api_url: str = "http://localhost:3000/api"
+    payloadcms_api_key: Optional[str] = None
+    # Connection pool of the PayloadCMS client (CMS calls and image downloads)
+    payloadcms_max_connections: int = 64
+    payloadcms_max_keepalive_connections: int = 32
+    # Seconds an idle pooled connection is kept for reuse
+    payloadcms_keepalive_expiry: float = 60.0
 
     # Optional features
-    redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
-    websocket_enabled: bool = Field(default=True, env="WEBSOCKET_ENABLED")
-    payloadcms_websocket_url: Optional[str] = Field(
-        default=None, env="PAYLOADCMS_WEBSOCKET_URL"
-    )
+    redis_url: Optional[str] = None
+    websocket_enabled: bool = True
+    payloadcms_websocket_url: Optional[str] = None
 
-    class Config:
-        """Pydantic configuration."""
 
-        env_file = ".env"
-        case_sensitive = False
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, building it on first use."""
+    return Settings()
 
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``settings`` module attribute lazily (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
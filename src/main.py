@@ -2,25 +2,19 @@
 
 import asyncio
 import logging
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import AsyncGenerator, Tuple
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
 
-from .config import settings
-from .routers.spec_requests import router as spec_router
-from .routers.styles_stub import router as styles_stub_router
-from .services.provider_factory import ProviderFactory
+from .config import get_settings
+from .responses import ORJSONResponse
 
-from .routers.visual import router as visual_router
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -33,25 +27,80 @@ class HealthResponse(BaseModel):
     providers: dict[str, str]
 
 
+class OriginOnlyCORSMiddleware(CORSMiddleware):
+    """CORS middleware that only engages for requests carrying an Origin header.
+
+    Health probes and server-to-server calls never send ``Origin``, so they are
+    passed straight through without wrapping ``send`` for CORS headers.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not any(
+            name == b"origin" for name, _ in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan management."""
+    settings = get_settings()
+    app.state.settings = settings
+
+    # Configure logging
+    logging.basicConfig(
+        level=settings.log_level.upper(),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
     logger.info("Starting MCP Visual Design Service")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Service will run on {settings.host}:{settings.port}")
+    logger.info("Environment: %s", settings.environment)
+    logger.info("Service will run on %s:%s", settings.host, settings.port)
+
+    from .services.provider_factory import ProviderFactory
 
     # Initialize provider factory
     provider_factory = ProviderFactory(settings)
     app.state.provider_factory = provider_factory
 
-    # Test provider connections (skip in test environment)
+    # Build request-independent services and lookups once for all requests
+    from .routers.visual import build_style_cache, refresh_providers_snapshot
+    from .services.asset_service import AssetService
+    from .services.visual_service import VisualService
+    from .templates import TemplateManager
+
+    app.state.template_manager = TemplateManager()
+    app.state.asset_service = AssetService(settings)
+    app.state.visual_service = VisualService(
+        provider_factory,
+        app.state.asset_service,
+        settings,
+        template_manager=app.state.template_manager,
+    )
+    app.state.style_cache = build_style_cache(app.state.template_manager)
+
+    # Warm provider/CMS connections before serving (skip in test environment)
+    refresh_task = None
     if settings.environment != "test":
-        providers_status = await provider_factory.health_check()
-        logger.info(f"Provider status: {providers_status}")
+        providers_status = await app.state.visual_service.warmup()
+        logger.info("Provider status: %s", providers_status)
+        refresh_task = asyncio.create_task(
+            refresh_providers_snapshot(app, settings.providers_refresh_interval)
+        )
 
     yield
 
     logger.info("Shutting down MCP Visual Design Service")
+    if refresh_task is not None:
+        refresh_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresh_task
+    from .providers._http import close_client
+
+    await app.state.asset_service.aclose()
+    await close_client()
 
 
 app = FastAPI(
@@ -59,46 +108,75 @@ app = FastAPI(
     description="AI-powered visual design and asset generation service for movie production",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    OriginOnlyCORSMiddleware,
     allow_origins=["*"],  # In production, specify allowed origins
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(visual_router, prefix="/api/v1")
 
-app.include_router(spec_router, prefix="")
-app.include_router(styles_stub_router, prefix="/api/v1")
+def _register_routes(app: FastAPI) -> None:
+    """Import and mount the API routers.
 
+    Router modules pull in the provider and asset services, so their imports
+    are kept out of this module's header. Registration still happens before
+    startup because tests drive the app without running the lifespan.
+    """
+    from .routers.spec_requests import router as spec_router
+    from .routers.styles_stub import router as styles_stub_router
+    from .routers.visual import router as visual_router
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
-    """Health check endpoint."""
-    try:
-        provider_factory = app.state.provider_factory
-        providers_status = await provider_factory.health_check()
+    app.include_router(visual_router, prefix="/api/v1")
+    app.include_router(spec_router, prefix="")
+    app.include_router(styles_stub_router, prefix="/api/v1")
 
-        return HealthResponse(
-            status="healthy",
+
+_register_routes(app)
+
+
+@lru_cache(maxsize=32)
+def _health_body(status: str, providers: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Encode a health payload once per distinct status/providers combination."""
+    return orjson.dumps(
+        HealthResponse(
+            status=status,
             service="mcp-visual-design-service",
             version="0.1.0",
-            providers=providers_status,
-        )
+            providers=dict(providers),
+        ).model_dump()
+    )
+
+
+@app.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
+    """Health check endpoint.
+
+    Provider status is cached, so the encoded body is reused across probes.
+    The response is marked cacheable for as long as provider health results
+    are cached, so ingress proxies can answer repeated probes themselves.
+    """
+    try:
+        provider_factory = app.state.provider_factory
+        providers_status = await provider_factory.health_check()
+        body = _health_body("healthy", tuple(providers_status.items()))
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         # Return degraded but 200 to keep health readable during local/dev tests
-        return HealthResponse(
-            status="degraded",
-            service="mcp-visual-design-service",
-            version="0.1.0",
-            providers={},
-        )
+        body = _health_body("degraded", ())
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={
+            "Cache-Control": f"public, max-age={int(get_settings().health_cache_ttl)}"
+        },
+    )
 
 
 @app.get("/")
@@ -114,6 +192,7 @@ async def root() -> dict[str, str]:
 if __name__ == "__main__":
     import uvicorn
 
+    settings = get_settings()
     uvicorn.run(
         "src.main:app",
         host=settings.host,
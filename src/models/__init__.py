@@ -1,5 +1,14 @@
 """Data models for the MCP Visual Design Service."""
 
+from .render import (
+    CharacterProfile,
+    FailedFrame,
+    RenderedFrame,
+    RenderSettings,
+    RenderStoryboardFramesRequest,
+    RenderStoryboardFramesResponse,
+    StoryboardFrameInput,
+)
 from .visual import (
     ConceptGenerationRequest,
     ConceptGenerationResponse,
@@ -24,4 +33,11 @@ __all__ = [
     "VisualType",
     "UpscaleRequest",
     "UpscaleResponse",
-]
\ No newline at end of file
+    "CharacterProfile",
+    "StoryboardFrameInput",
+    "RenderSettings",
+    "RenderedFrame",
+    "FailedFrame",
+    "RenderStoryboardFramesRequest",
+    "RenderStoryboardFramesResponse",
+]
@@ -2,7 +2,9 @@
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field
+
+from .visual import HttpUrlStr
 
 
 class VisualDesignRequest(BaseModel):
@@ -23,7 +25,7 @@ class ConceptBoard(BaseModel):
     iteration: int
     summary: str
     conceptCount: int = 0
-    previewImageUrl: Optional[HttpUrl] = None
+    previewImageUrl: Optional[HttpUrlStr] = None
     status: str
 
 
@@ -32,7 +34,7 @@ class ConceptItem(BaseModel):
     boardId: str
     caption: str
     tags: List[str] = Field(default_factory=list)
-    imageUrls: List[HttpUrl] = Field(default_factory=list)
+    imageUrls: List[HttpUrlStr] = Field(default_factory=list)
     provenance: Optional[str] = None
 
 
@@ -1,9 +1,35 @@
 """Visual generation data models."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Union
 from enum import Enum
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, HttpUrl, SkipValidation
+
+
+def _require_http_url(value: str) -> str:
+    """Cheap scheme check used instead of full URL parsing on outbound models."""
+    if not value.startswith(("http://", "https://")):
+        raise ValueError("URL must start with http:// or https://")
+    return value
+
+
+# Plain-string URL for response models; inbound requests keep ``HttpUrl``.
+HttpUrlStr = Annotated[str, AfterValidator(_require_http_url)]
+
+# Free-form dicts the service builds itself; skips the validation-time copy.
+_TrustedDict = SkipValidation[Dict[str, Any]]
+
+# Field declarations shared by several request/response models
+_Metadata = Annotated[
+    Dict[str, Any], Field(default_factory=dict, description="Additional metadata")
+]
+_TrustedMetadata = Annotated[
+    _TrustedDict, Field(default_factory=dict, description="Additional metadata")
+]
+_GenerationId = Annotated[str, Field(description="Generation ID")]
+_OptionalProjectId = Annotated[Optional[str], Field(description="Project ID")]
+_ProviderPreference = Annotated[Optional[str], Field(description="Preferred provider")]
+_ErrorMessage = Annotated[Optional[str], Field(description="Error message if failed")]
 
 
 class VisualType(str, Enum):
@@ -31,14 +57,16 @@ class Scene(BaseModel):
     mood: Optional[str] = Field(None, description="Scene mood or tone")
     camera_angle: Optional[str] = Field(None, description="Camera angle or shot type")
     lighting: Optional[str] = Field(None, description="Lighting description")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    metadata: _Metadata
 
 
 class VisualAsset(BaseModel):
     """Generated visual asset."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(..., description="Asset ID")
-    url: HttpUrl = Field(..., description="Asset URL")
+    url: HttpUrlStr = Field(..., description="Asset URL")
     type: VisualType = Field(..., description="Asset type")
     width: int = Field(..., description="Image width in pixels")
     height: int = Field(..., description="Image height in pixels")
@@ -46,61 +74,64 @@ class VisualAsset(BaseModel):
     provider: str = Field(..., description="Generation provider")
     model: str = Field(..., description="AI model used")
     prompt: str = Field(..., description="Generation prompt")
-    generation_params: Dict[str, Any] = Field(default_factory=dict, description="Generation parameters")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    generation_params: _TrustedDict = Field(default_factory=dict, description="Generation parameters")
+    metadata: _TrustedMetadata
 
 
 class StoryboardGenerationRequest(BaseModel):
     """Request for storyboard generation."""
 
+    model_config = ConfigDict(frozen=True)
+
     project_id: str = Field(..., description="Project ID")
     scenes: List[Scene] = Field(..., description="List of scenes to generate")
     style_preset: str = Field(default="cinematic", description="Visual style preset")
     seed: Optional[int] = Field(None, description="Random seed for consistent results")
     aspect_ratio: str = Field(default="16:9", description="Aspect ratio")
     quality: str = Field(default="standard", description="Generation quality")
-    provider_preference: Optional[str] = Field(None, description="Preferred provider")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    provider_preference: _ProviderPreference = None
+    metadata: _Metadata
 
 
 class StoryboardGenerationResponse(BaseModel):
     """Response for storyboard generation."""
 
-    generation_id: str = Field(..., description="Generation ID")
+    generation_id: _GenerationId
     project_id: str = Field(..., description="Project ID")
     status: GenerationStatus = Field(..., description="Generation status")
     assets: List[VisualAsset] = Field(default_factory=list, description="Generated assets")
     progress: float = Field(default=0.0, description="Generation progress (0.0-1.0)")
-    error_message: Optional[str] = Field(None, description="Error message if failed")
+    error_message: _ErrorMessage = None
     total_scenes: int = Field(..., description="Total number of scenes")
     completed_scenes: int = Field(default=0, description="Number of completed scenes")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    metadata: _TrustedMetadata
 
 
 class ConceptGenerationRequest(BaseModel):
     """Request for concept art generation."""
 
     prompt: str = Field(..., description="Concept description")
-    project_id: Optional[str] = Field(None, description="Project ID")
+    project_id: _OptionalProjectId = None
     reference_images: List[HttpUrl] = Field(default_factory=list, description="Reference image URLs")
     style_preset: str = Field(default="concept-art", description="Visual style preset")
     variations: int = Field(default=1, description="Number of variations to generate")
+    seed: Optional[int] = Field(None, description="Base seed; variation i uses seed + i")
     aspect_ratio: str = Field(default="16:9", description="Aspect ratio")
     quality: str = Field(default="standard", description="Generation quality")
-    provider_preference: Optional[str] = Field(None, description="Preferred provider")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    provider_preference: _ProviderPreference = None
+    metadata: _Metadata
 
 
 class ConceptGenerationResponse(BaseModel):
     """Response for concept art generation."""
 
-    generation_id: str = Field(..., description="Generation ID")
-    project_id: Optional[str] = Field(None, description="Project ID")
+    generation_id: _GenerationId
+    project_id: _OptionalProjectId = None
     status: GenerationStatus = Field(..., description="Generation status")
     assets: List[VisualAsset] = Field(default_factory=list, description="Generated assets")
     progress: float = Field(default=0.0, description="Generation progress (0.0-1.0)")
-    error_message: Optional[str] = Field(None, description="Error message if failed")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    error_message: _ErrorMessage = None
+    metadata: _TrustedMetadata
 
 
 class UpscaleRequest(BaseModel):
@@ -108,71 +139,21 @@ class UpscaleRequest(BaseModel):
 
     media_id: str = Field(..., description="Media asset ID to upscale")
     factor: int = Field(default=2, description="Upscaling factor (2x, 4x, etc.)")
-    project_id: Optional[str] = Field(None, description="Project ID")
+    project_id: _OptionalProjectId = None
     quality: str = Field(default="standard", description="Upscaling quality")
-    provider_preference: Optional[str] = Field(None, description="Preferred provider")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    provider_preference: _ProviderPreference = None
+    metadata: _Metadata
 
 
 class UpscaleResponse(BaseModel):
     """Response for image upscaling."""
 
-    generation_id: str = Field(..., description="Generation ID")
-    project_id: Optional[str] = Field(None, description="Project ID")
+    generation_id: _GenerationId
+    project_id: _OptionalProjectId = None
     status: GenerationStatus = Field(..., description="Generation status")
     original_asset_id: str = Field(..., description="Original asset ID")
     upscaled_asset: Optional[VisualAsset] = Field(None, description="Upscaled asset")
     progress: float = Field(default=0.0, description="Upscaling progress (0.0-1.0)")
-    error_message: Optional[str] = Field(None, description="Error message if failed")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
-
-
-# --- Image Generation (Storyboard Frames) Models ---
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
-
-
-class CharacterProfile(BaseModel):
-    name: str
-    visual_signature: str
-
-
-class StoryboardFrameInput(BaseModel):
-    frame_id: str
-    description: str
-    camera_notes: Optional[str] = None
-    lighting_mood: Optional[str] = None
-    prompt_seed: Optional[int] = None
-
-
-class RenderSettings(BaseModel):
-    provider: str = Field(default="fal_ai")
-    model: str = Field(default="fal-ai/flux-pro")
-    aspect_ratio: str = Field(default="16:9")
-    guidance_scale: float = Field(default=4.5)
-    steps: int = Field(default=24)
-    seed: Optional[int] = None
-
-
-class RenderedFrame(BaseModel):
-    frame_id: str
-    image_url: str
-    negative_prompts: Optional[List[str]] = None
-    provider_metadata: Dict[str, Any] = {}
-    quality_score: Optional[float] = None
-
-
-class FailedFrame(BaseModel):
-    frame_id: str
-    error: str
-
-
-class RenderStoryboardFramesRequest(BaseModel):
-    storyboard_frames: List[StoryboardFrameInput]
-    character_profiles: List[CharacterProfile] = []
-    render_settings: RenderSettings = RenderSettings()
-
+    error_message: _ErrorMessage = None
+    metadata: _TrustedMetadata
 
-class RenderStoryboardFramesResponse(BaseModel):
-    generated_frames: List[RenderedFrame] = []
-    failed_frames: List[FailedFrame] = []
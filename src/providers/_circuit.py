@@ -0,0 +1,144 @@
+"""Per-provider circuit breaker for outbound API calls."""
+
+import logging
+import time
+from typing import Awaitable, Callable, Dict
+
+import httpx
+
+from .base import ProviderError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast while a provider keeps failing.
+
+    After ``fail_threshold`` consecutive failures the circuit opens and calls
+    are rejected without touching the network. Once ``reset_after`` seconds
+    have passed a single trial call is let through (half-open); its outcome
+    closes or re-opens the circuit. State changes have no await points, so
+    one breaker can be shared by concurrent coroutines.
+    """
+
+    def __init__(
+        self, name: str, fail_threshold: int = 5, reset_after: float = 30.0
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            name: Provider name, used in errors and logs
+            fail_threshold: Consecutive failures before the circuit opens
+            reset_after: Seconds to stay open before allowing a trial call
+        """
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self.state = CLOSED
+        self.fail_count = 0
+        self.opened_at = 0.0
+        # Set while the half-open trial call is outstanding
+        self.trial_in_flight = False
+
+    def is_open(self) -> bool:
+        """Check whether calls should currently be rejected.
+
+        While half-open, the first caller is let through as the trial and
+        claims it; everyone else is rejected until that trial is recorded.
+
+        Returns:
+            True while open or while a trial is in flight; False when closed
+            or for the caller that takes the trial
+        """
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.reset_after:
+                return True
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self.trial_in_flight:
+                return True
+            self.trial_in_flight = True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self.state != CLOSED:
+            logger.info("Circuit for %s closed", self.name)
+        self.state = CLOSED
+        self.fail_count = 0
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit when the threshold is hit."""
+        self.trial_in_flight = False
+        self.fail_count += 1
+        if self.state == HALF_OPEN or self.fail_count >= self.fail_threshold:
+            if self.state != OPEN:
+                logger.warning(
+                    "Circuit for %s opened after %d failures",
+                    self.name,
+                    self.fail_count,
+                )
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    async def call(
+        self, fn: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Issue a request through the breaker.
+
+        Transport errors and 5xx responses count as failures; any other
+        response means the provider is reachable and counts as a success.
+
+        Args:
+            fn: Zero-argument coroutine factory issuing the request
+
+        Returns:
+            The provider response
+
+        Raises:
+            ProviderError: With code CIRCUIT_OPEN if the circuit is open
+        """
+        if self.is_open():
+            raise ProviderError(
+                f"{self.name} circuit open",
+                provider=self.name,
+                error_code="CIRCUIT_OPEN",
+            )
+        try:
+            response = await fn()
+        except httpx.TransportError:
+            self.record_failure()
+            raise
+        except BaseException:
+            # Says nothing about the provider (e.g. cancellation); hand the
+            # trial to the next caller
+            self.trial_in_flight = False
+            raise
+        if response.status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+        return response
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a provider, creating it on first use.
+
+    Args:
+        name: Provider name
+
+    Returns:
+        Circuit breaker shared by all instances of that provider
+    """
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name)
+    return breaker
@@ -0,0 +1,65 @@
+"""Shared HTTP client for provider API calls."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+import orjson
+
+_TIMEOUT = httpx.Timeout(connect=5.0, read=120.0, write=30.0, pool=10.0)
+_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=300,
+)
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the process-wide provider HTTP client, creating it on first use.
+
+    The client keeps connections alive across calls so repeated requests to
+    the same provider host skip the TCP and TLS handshakes. A client bound to
+    a different (e.g. closed test) event loop is replaced. The check-and-create
+    below has no await point, so concurrent callers cannot race on it.
+
+    Returns:
+        Shared async HTTP client
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(timeout=_TIMEOUT, limits=_LIMITS, http2=True)
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client; called from the application shutdown hook."""
+    global _client, _client_loop
+
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def error_details(response: httpx.Response) -> Dict[str, Any]:
+    """Decode an error response body for ProviderError details.
+
+    Args:
+        response: Failed provider response
+
+    Returns:
+        Parsed JSON body, the raw text under "body" if it is not JSON, or an
+        empty dict when there is no body
+    """
+    if not response.content:
+        return {}
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return {"body": response.text}
+    return data if isinstance(data, dict) else {"body": data}
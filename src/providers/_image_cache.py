@@ -0,0 +1,101 @@
+"""In-process cache of generated images keyed by their generation parameters."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .base import ImageGenerationParams, ImageResult
+
+
+def request_key(params: ImageGenerationParams) -> str:
+    """Hash generation parameters into a stable request identifier.
+
+    Args:
+        params: Image generation parameters
+
+    Returns:
+        Hex digest identifying the request
+    """
+    raw = json.dumps(
+        [
+            params.model,
+            params.prompt,
+            params.seed,
+            params.width,
+            params.height,
+            params.steps,
+            params.guidance_scale,
+            params.negative_prompt,
+            sorted(params.additional_params.items()),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def cache_key(params: ImageGenerationParams) -> Optional[str]:
+    """Build a cache key for deterministic (seeded) generation parameters.
+
+    Args:
+        params: Image generation parameters
+
+    Returns:
+        Hex digest identifying the request, or None when the request is not
+        seeded and therefore not reproducible
+    """
+    if params.seed is None:
+        return None
+    return request_key(params)
+
+
+class ImageResultCache:
+    """Bounded LRU cache with per-entry expiry.
+
+    All operations are synchronous dict updates with no await points, so it
+    is safe to share between coroutines on the same event loop.
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 3600.0) -> None:
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            ttl: Seconds a cached result stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, ImageResult]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[ImageResult]:
+        """Return a cached result, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def set(self, key: str, result: ImageResult) -> None:
+        """Store a successful result, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+
+image_cache = ImageResultCache()
+
+# Queue submissions that have not been collected yet, keyed by request_key().
+# A caller that times out leaves its entry here so the next identical request
+# resumes polling instead of paying for a second generation.
+pending_requests: Dict[str, Dict[str, Any]] = {}
@@ -0,0 +1,148 @@
+"""Retry helper for transient provider HTTP failures."""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, Tuple, Type, TypeVar
+
+import httpx
+
+from .base import ProviderError
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS: Tuple[int, ...] = (429, 500, 502, 503, 504)
+# Transport errors raised before the request reached the provider; providers
+# report them as ProviderError code CONNECT.
+CONNECT_ERRORS: Tuple[Type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+# ProviderError codes that guarantee the provider did not accept the request,
+# so another attempt cannot start a second paid generation. TIMEOUT and
+# gateway 5xx are absent because the request may already be running;
+# CIRCUIT_OPEN is absent because retrying would defeat the breaker.
+_TRANSIENT_CODES = frozenset({"CONNECT", "429", "503"})
+_TRANSIENT_HINTS = ("rate limit", "quota")
+
+
+async def retry(
+    fn: Callable[[], Awaitable[httpx.Response]],
+    *,
+    max_tries: int = 4,
+    base: float = 0.25,
+    cap: float = 8.0,
+    retry_on: Tuple[int, ...] = RETRYABLE_STATUS,
+) -> httpx.Response:
+    """Call ``fn`` until it returns a non-transient response.
+
+    Timeouts and responses whose status is in ``retry_on`` are retried with
+    exponential backoff and full jitter. Any other response, including
+    4xx auth and validation errors, is returned to the caller unchanged.
+    Only use it for idempotent requests; provider calls that start a
+    generation are retried once, by ``retry_provider_call``.
+
+    Args:
+        fn: Zero-argument coroutine factory issuing the request
+        max_tries: Total number of attempts
+        base: Backoff base delay in seconds
+        cap: Upper bound for a single delay in seconds
+        retry_on: HTTP status codes treated as transient
+
+    Returns:
+        The last response received
+
+    Raises:
+        httpx.TimeoutException: If the final attempt times out
+    """
+    for attempt in range(max_tries):
+        last_attempt = attempt == max_tries - 1
+        try:
+            response = await fn()
+        except httpx.TimeoutException:
+            if last_attempt:
+                raise
+            reason = "timeout"
+        else:
+            if response.status_code not in retry_on or last_attempt:
+                return response
+            reason = str(response.status_code)
+
+        delay = random.uniform(0, min(cap, base * 2**attempt))
+        logger.warning(
+            "Transient provider failure (%s), retry %d/%d in %.2fs",
+            reason,
+            attempt + 1,
+            max_tries - 1,
+            delay,
+        )
+        await asyncio.sleep(delay)
+
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Classify a provider failure as worth retrying.
+
+    Args:
+        exc: Exception raised by a provider call
+
+    Returns:
+        True for connect failures, rate limits and unavailable responses,
+        and for timeouts the provider can resume without resubmitting
+    """
+    if not isinstance(exc, ProviderError):
+        return False
+    if exc.error_code in _TRANSIENT_CODES or exc.details.get("resumable"):
+        return True
+    message = str(exc).lower()
+    return any(hint in message for hint in _TRANSIENT_HINTS)
+
+
+async def retry_provider_call(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    max_tries: int = 3,
+    base: float = 0.5,
+    cap: float = 8.0,
+) -> T:
+    """Call a provider operation again when it fails transiently.
+
+    This is the only retry around calls that start a generation or upscale
+    (providers send those requests once), so every attempt goes through the
+    caller's rate limiter. A seeded FAL request that timed out resumes
+    polling its pending queue entry instead of paying for a new generation.
+
+    Args:
+        fn: Zero-argument coroutine factory performing the provider call
+        max_tries: Total number of attempts
+        base: Backoff base delay in seconds
+        cap: Upper bound for a single delay in seconds
+
+    Returns:
+        The provider call's result
+
+    Raises:
+        ProviderError: The last error, or the first non-transient one
+    """
+    for attempt in range(max_tries):
+        try:
+            return await fn()
+        except ProviderError as e:
+            if attempt == max_tries - 1 or not is_transient(e):
+                raise
+            delay = min(cap, base * 2**attempt) * (0.5 + random.random())
+            logger.warning(
+                "Transient %s failure (%s), attempt %d/%d, retrying in %.2fs",
+                e.provider,
+                e.error_code,
+                attempt + 1,
+                max_tries,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    raise AssertionError("unreachable")  # pragma: no cover
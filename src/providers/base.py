@@ -1,10 +1,16 @@
 """Base provider interface for image generation services."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from enum import Enum
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, SkipValidation
+
+
+# Free-form dicts built by providers themselves; skips the validation-time copy.
+_TrustedDict = SkipValidation[Dict[str, Any]]
 
 
 class ProviderStatus(str, Enum):
@@ -18,6 +24,8 @@ class ProviderStatus(str, Enum):
 class ImageGenerationParams(BaseModel):
     """Parameters for image generation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     prompt: str
     model: str
     width: int = 1024
@@ -29,13 +37,19 @@ class ImageGenerationParams(BaseModel):
     style: Optional[str] = None
     quality: str = "standard"
     aspect_ratio: str = "1:1"
-    additional_params: Dict[str, Any] = {}
+    additional_params: _TrustedDict = {}
 
 
 class ImageResult(BaseModel):
-    """Result from image generation."""
+    """Result from image generation.
 
-    url: HttpUrl
+    Internal DTO passed from providers to services; the URL comes straight
+    from the provider response and is kept as a plain string.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    url: str
     width: int
     height: int
     file_size: Optional[int] = None
@@ -44,7 +58,7 @@ class ImageResult(BaseModel):
     model: str
     provider: str
     generation_time: float
-    metadata: Dict[str, Any] = {}
+    metadata: _TrustedDict = {}
 
 
 class ProviderHealth(BaseModel):
@@ -54,12 +68,15 @@ class ProviderHealth(BaseModel):
     message: str
     response_time: Optional[float] = None
     last_check: str
-    metadata: Dict[str, Any] = {}
+    metadata: _TrustedDict = {}
 
 
 class BaseProvider(ABC):
     """Base class for image generation providers."""
 
+    # True when generate_images_batch returns several images from one call
+    supports_batch_generation: bool = False
+
     def __init__(self, api_key: Optional[str] = None, **kwargs: Any) -> None:
         """Initialize provider.
 
@@ -70,6 +87,12 @@ class BaseProvider(ABC):
         self.api_key = api_key
         self.config = kwargs
         self.name = self.__class__.__name__.replace("Provider", "").lower()
+        # ProviderFactory passes settings.health_cache_ttl so this cache never
+        # serves results older than the factory's own health cache
+        self._health_ttl: float = kwargs.get("health_ttl", 5.0)
+        self._last_health: Optional[ProviderHealth] = None
+        self._last_health_ts = 0.0
+        self._health_lock = asyncio.Lock()
 
     @abstractmethod
     async def generate_image(
@@ -107,6 +130,29 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def generate_images_batch(
+        self, params: ImageGenerationParams, n: int
+    ) -> List[ImageResult]:
+        """Generate several images from one set of parameters in a single call.
+
+        Only used when ``supports_batch_generation`` is True.
+
+        Args:
+            params: Image generation parameters
+            n: Number of images
+
+        Returns:
+            Generated image results
+
+        Raises:
+            ProviderError: With code NOT_IMPLEMENTED unless overridden
+        """
+        raise ProviderError(
+            "Batch generation not supported",
+            provider=self.name,
+            error_code="NOT_IMPLEMENTED",
+        )
+
     @abstractmethod
     async def check_health(self) -> ProviderHealth:
         """Check provider health status.
@@ -116,21 +162,54 @@ class BaseProvider(ABC):
         """
         pass
 
-    def get_supported_models(self) -> list[str]:
-        """Get list of supported models.
+    async def _cached_health(
+        self, probe: Callable[[], Awaitable[ProviderHealth]]
+    ) -> ProviderHealth:
+        """Return the last health result if fresh, otherwise run ``probe``.
+
+        Concurrent callers on a miss wait for the single in-flight probe
+        instead of each hitting the provider's status endpoint.
+
+        Args:
+            probe: Coroutine factory performing the real health check
+
+        Returns:
+            Provider health status
+        """
+        cached = self._fresh_health()
+        if cached is not None:
+            return cached
+        async with self._health_lock:
+            cached = self._fresh_health()
+            if cached is None:
+                cached = self._last_health = await probe()
+                self._last_health_ts = time.monotonic()
+            return cached
+
+    def _fresh_health(self) -> Optional[ProviderHealth]:
+        """Return the cached health result if it is within the TTL."""
+        if (
+            self._last_health is not None
+            and time.monotonic() - self._last_health_ts < self._health_ttl
+        ):
+            return self._last_health
+        return None
+
+    def get_supported_models(self) -> tuple[str, ...]:
+        """Get supported models.
 
         Returns:
-            List of model names
+            Immutable tuple of model names
         """
-        return []
+        return ()
 
-    def get_supported_styles(self) -> list[str]:
-        """Get list of supported styles.
+    def get_supported_styles(self) -> tuple[str, ...]:
+        """Get supported styles.
 
         Returns:
-            List of style names
+            Immutable tuple of style names
         """
-        return []
+        return ()
 
 
 class ProviderError(Exception):
@@ -1,13 +1,17 @@
 """OpenRouter provider implementation for image generation."""
 
 import asyncio
+import re
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 import httpx
-from pydantic import HttpUrl
+import orjson
 
+from ._circuit import get_breaker
+from ._http import error_details, get_client
+from ._retry import CONNECT_ERRORS
 from .base import (
     BaseProvider,
     ImageGenerationParams,
@@ -17,6 +21,15 @@ from .base import (
     ProviderStatus,
 )
 
+_MSG_HEALTHY = "OpenRouter API is accessible"
+_HEALTH_TIMEOUT = httpx.Timeout(10.0)
+
+# Simple URL extraction - improve this for production. Note that "$-_" is a
+# character range (it covers "/", ":", "?" and "="), which keeps URL paths.
+_IMAGE_URL_RE = re.compile(
+    r"https?://(?:[a-zA-Z0-9]|[$-_@.&+]|[!*(),]|%[0-9a-fA-F]{2})+"
+)
+
 
 class OpenRouterProvider(BaseProvider):
     """OpenRouter image generation provider."""
@@ -31,9 +44,21 @@ class OpenRouterProvider(BaseProvider):
         super().__init__(api_key, **kwargs)
         self.base_url = "https://openrouter.ai/api/v1"
         self.timeout = kwargs.get("timeout", 60)
+        self.breaker = get_breaker("openrouter")
+        # Built once and shared by every request from this provider
+        self._headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://mcp-visual-design-service.local",
+            "X-Title": "MCP Visual Design Service",
+        }
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+        self._health_meta_base: Dict[str, Any] = {"has_api_key": bool(api_key)}
+        # Bulkhead: the OpenRouter quota is shared, so keep this lower than FAL
+        self._sem = asyncio.Semaphore(kwargs.get("max_concurrent", 8))
         
         # Supported models (image generation models available on OpenRouter)
-        self._supported_models = [
+        self._supported_models: tuple[str, ...] = (
             "black-forest-labs/flux-1.1-pro",
             "black-forest-labs/flux-1-schnell",
             "black-forest-labs/flux-1-dev",
@@ -41,17 +66,17 @@ class OpenRouterProvider(BaseProvider):
             "stability-ai/stable-diffusion-3.5-large",
             "stability-ai/stable-diffusion-3.5-large-turbo",
             "dataautogpt3/opendalle",
-        ]
+        )
         
         # Supported styles
-        self._supported_styles = [
+        self._supported_styles: tuple[str, ...] = (
             "photorealistic",
             "cinematic",
             "concept-art",
             "anime",
             "artistic",
             "digital-art",
-        ]
+        )
 
     async def generate_image(self, params: ImageGenerationParams) -> ImageResult:
         """Generate image using OpenRouter API.
@@ -74,6 +99,110 @@ class OpenRouterProvider(BaseProvider):
 
         start_time = time.time()
         
+        payload = self._build_payload(params)
+
+        try:
+            client = await get_client()
+            
+            # For image generation, we might need to use different endpoints
+            # depending on the model. This is a simplified implementation.
+            async with self._sem:
+                # Sent once; VisualService retries only failures that prove
+                # the request was not accepted
+                response = await self.breaker.call(
+                    lambda: client.post(
+                        f"{self.base_url}/chat/completions",
+                        json=payload,
+                        headers=self._headers,
+                        timeout=self.timeout,
+                    )
+                )
+            
+            response.raise_for_status()
+            
+            result_data = orjson.loads(response.content)
+            generation_time = time.time() - start_time
+            
+            # Extract image URL from response
+            # Note: This is a simplified parsing - actual OpenRouter response
+            # format may vary by model
+            if "choices" not in result_data or not result_data["choices"]:
+                raise ProviderError(
+                    "No choices returned from OpenRouter API",
+                    provider="openrouter",
+                    error_code="NO_CHOICES",
+                )
+            
+            choice = result_data["choices"][0]
+            message_content = choice.get("message", {}).get("content", "")
+            
+            # For actual implementation, you'd parse the image URL from the response
+            # This is a placeholder implementation
+            image_url = self._extract_image_url_from_response(message_content)
+            
+            if not image_url:
+                raise ProviderError(
+                    "No image URL found in OpenRouter response",
+                    provider="openrouter",
+                    error_code="NO_IMAGE_URL",
+                )
+            
+            return ImageResult(
+                url=image_url,
+                width=params.width,
+                height=params.height,
+                file_size=None,  # OpenRouter may not provide file size
+                format="png",
+                seed=params.seed,
+                model=params.model,
+                provider="openrouter",
+                generation_time=generation_time,
+                metadata={
+                    "prompt": params.prompt,
+                    "steps": params.steps,
+                    "guidance_scale": params.guidance_scale,
+                    "usage": result_data.get("usage", {}),
+                    "model_used": result_data.get("model"),
+                },
+            )
+            
+        except ProviderError:
+            raise
+        except CONNECT_ERRORS as e:
+            raise ProviderError(
+                f"OpenRouter API connection failed: {str(e)}",
+                provider="openrouter",
+                error_code="CONNECT",
+            )
+        except httpx.TimeoutException:
+            raise ProviderError(
+                "OpenRouter API request timeout",
+                provider="openrouter",
+                error_code="TIMEOUT",
+            )
+        except httpx.HTTPStatusError as e:
+            raise ProviderError(
+                f"OpenRouter API error: {e.response.status_code}",
+                provider="openrouter",
+                error_code=str(e.response.status_code),
+                details=error_details(e.response),
+            )
+        except Exception as e:
+            raise ProviderError(
+                f"Unexpected OpenRouter API error: {str(e)}",
+                provider="openrouter",
+                error_code="UNEXPECTED",
+            )
+
+    def _build_payload(self, params: ImageGenerationParams) -> Dict[str, Any]:
+        """Build the chat completions payload for an image generation.
+
+        Args:
+            params: Image generation parameters
+
+        Returns:
+            Request payload
+        """
         # Prepare request payload for OpenRouter image generation
         # Note: OpenRouter may use different API format depending on the model
         payload = {
@@ -100,97 +229,7 @@ class OpenRouterProvider(BaseProvider):
             
         # Add additional parameters
         payload["extra"]["image_generation"].update(params.additional_params)
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://mcp-visual-design-service.local",
-                    "X-Title": "MCP Visual Design Service",
-                }
-                
-                # For image generation, we might need to use different endpoints
-                # depending on the model. This is a simplified implementation.
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers=headers,
-                )
-                
-                if response.status_code != 200:
-                    error_data = response.json() if response.content else {}
-                    raise ProviderError(
-                        f"OpenRouter API error: {response.status_code}",
-                        provider="openrouter",
-                        error_code=str(response.status_code),
-                        details=error_data,
-                    )
-                
-                result_data = response.json()
-                generation_time = time.time() - start_time
-                
-                # Extract image URL from response
-                # Note: This is a simplified parsing - actual OpenRouter response
-                # format may vary by model
-                if "choices" not in result_data or not result_data["choices"]:
-                    raise ProviderError(
-                        "No choices returned from OpenRouter API",
-                        provider="openrouter",
-                        error_code="NO_CHOICES",
-                    )
-                
-                choice = result_data["choices"][0]
-                message_content = choice.get("message", {}).get("content", "")
-                
-                # For actual implementation, you'd parse the image URL from the response
-                # This is a placeholder implementation
-                image_url = self._extract_image_url_from_response(message_content)
-                
-                if not image_url:
-                    raise ProviderError(
-                        "No image URL found in OpenRouter response",
-                        provider="openrouter",
-                        error_code="NO_IMAGE_URL",
-                    )
-                
-                return ImageResult(
-                    url=HttpUrl(image_url),
-                    width=params.width,
-                    height=params.height,
-                    file_size=None,  # OpenRouter may not provide file size
-                    format="png",
-                    seed=params.seed,
-                    model=params.model,
-                    provider="openrouter",
-                    generation_time=generation_time,
-                    metadata={
-                        "prompt": params.prompt,
-                        "steps": params.steps,
-                        "guidance_scale": params.guidance_scale,
-                        "usage": result_data.get("usage", {}),
-                        "model_used": result_data.get("model"),
-                    },
-                )
-                
-        except httpx.TimeoutException:
-            raise ProviderError(
-                "OpenRouter API request timeout",
-                provider="openrouter",
-                error_code="TIMEOUT",
-            )
-        except httpx.HTTPStatusError as e:
-            raise ProviderError(
-                f"OpenRouter API HTTP error: {e.response.status_code}",
-                provider="openrouter",
-                error_code=str(e.response.status_code),
-            )
-        except Exception as e:
-            raise ProviderError(
-                f"Unexpected OpenRouter API error: {str(e)}",
-                provider="openrouter",
-                error_code="UNEXPECTED",
-            )
+        return payload
 
     def _extract_image_url_from_response(self, content: str) -> Optional[str]:
         """Extract image URL from OpenRouter response content.
@@ -205,13 +244,8 @@ class OpenRouterProvider(BaseProvider):
             Extracted image URL or None
         """
         # In a real implementation, you'd parse the content to extract the image URL
-        # For now, return a placeholder URL for testing
-        if "http" in content:
-            # Simple URL extraction - improve this for production
-            import re
-            urls = re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', content)
-            return urls[0] if urls else None
-        return None
+        match = _IMAGE_URL_RE.search(content)
+        return match.group(0) if match else None
 
     async def upscale_image(
         self, image_url: str, factor: int = 2, **kwargs: Any
@@ -239,7 +273,15 @@ class OpenRouterProvider(BaseProvider):
         )
 
     async def check_health(self) -> ProviderHealth:
-        """Check OpenRouter API health.
+        """Check OpenRouter API health, reusing a recent result.
+
+        Returns:
+            Provider health status
+        """
+        return await self._cached_health(self._probe_health)
+
+    async def _probe_health(self) -> ProviderHealth:
+        """Probe the OpenRouter API.
 
         Returns:
             Provider health status
@@ -247,63 +289,64 @@ class OpenRouterProvider(BaseProvider):
         start_time = time.time()
         
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                headers = {}
-                if self.api_key:
-                    headers["Authorization"] = f"Bearer {self.api_key}"
-                
-                # Check models endpoint
-                response = await client.get(
+            client = await get_client()
+            # Check models endpoint
+            response = await self.breaker.call(
+                lambda: client.get(
                     f"{self.base_url}/models",
-                    headers=headers,
+                    headers=self._headers,
+                    timeout=_HEALTH_TIMEOUT,
                 )
+            )
+            
+            response_time = time.time() - start_time
+            
+            if response.status_code == 200:
+                models_data = orjson.loads(response.content)
+                available_models = len(models_data.get("data", []))
                 
-                response_time = time.time() - start_time
+                return ProviderHealth(
+                    status=ProviderStatus.HEALTHY,
+                    message=_MSG_HEALTHY,
+                    response_time=response_time,
+                    last_check=datetime.now(timezone.utc).isoformat(),
+                    metadata={
+                        **self._health_meta_base,
+                        "available_models": available_models,
+                    },
+                )
+            else:
+                return ProviderHealth(
+                    status=ProviderStatus.DEGRADED,
+                    message=f"OpenRouter API returned status {response.status_code}",
+                    response_time=response_time,
+                    last_check=datetime.now(timezone.utc).isoformat(),
+                    metadata={"status_code": response.status_code},
+                )
                 
-                if response.status_code == 200:
-                    models_data = response.json()
-                    available_models = len(models_data.get("data", []))
-                    
-                    return ProviderHealth(
-                        status=ProviderStatus.HEALTHY,
-                        message="OpenRouter API is accessible",
-                        response_time=response_time,
-                        last_check=datetime.utcnow().isoformat(),
-                        metadata={
-                            "has_api_key": bool(self.api_key),
-                            "available_models": available_models,
-                        },
-                    )
-                else:
-                    return ProviderHealth(
-                        status=ProviderStatus.DEGRADED,
-                        message=f"OpenRouter API returned status {response.status_code}",
-                        response_time=response_time,
-                        last_check=datetime.utcnow().isoformat(),
-                        metadata={"status_code": response.status_code},
-                    )
-                    
         except Exception as e:
             return ProviderHealth(
                 status=ProviderStatus.UNHEALTHY,
                 message=f"OpenRouter API health check failed: {str(e)}",
                 response_time=None,
-                last_check=datetime.utcnow().isoformat(),
+                last_check=datetime.now(timezone.utc).isoformat(),
                 metadata={"error": str(e)},
             )
 
-    def get_supported_models(self) -> list[str]:
+    def get_supported_models(self) -> tuple[str, ...]:
         """Get supported OpenRouter models.
 
         Returns:
-            List of supported model names
+            Tuple of supported model names
         """
-        return self._supported_models.copy()
+        # Immutable, so it is safe to hand out without copying
+        return self._supported_models
 
-    def get_supported_styles(self) -> list[str]:
+    def get_supported_styles(self) -> tuple[str, ...]:
         """Get supported styles.
 
         Returns:
-            List of supported style names
+            Tuple of supported style names
         """
-        return self._supported_styles.copy()
\ No newline at end of file
+        # Immutable, so it is safe to hand out without copying
+        return self._supported_styles
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""Response classes shared by the application and its routers."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize objects orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            # Already-validated model: serialize once in pydantic's own encoder
+            return content.model_dump_json().encode()
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=_orjson_default,
+        )
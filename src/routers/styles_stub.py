@@ -1,18 +1,22 @@
 """Test-only router to expose /api/v1/visual/styles without importing heavy services."""
 
+from functools import lru_cache
 from typing import Any, Dict
 from fastapi import APIRouter
 
+from ..responses import ORJSONResponse
+
 try:
     from ..templates import TemplateManager
 except Exception:
     TemplateManager = None  # type: ignore
 
-router = APIRouter(tags=["visual-test-stub"])
+router = APIRouter(tags=["visual-test-stub"], default_response_class=ORJSONResponse)
 
 
-@router.get("/visual/styles", response_model=Dict[str, Any])
-async def get_styles_stub() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def _styles_payload() -> Dict[str, Any]:
+    """Build the styles response once; built-in templates never change."""
     if TemplateManager is None:
         # Minimal fallback
         return {"styles": ["cinematic", "concept-art"], "details": {}}
@@ -30,3 +34,6 @@ async def get_styles_stub() -> Dict[str, Any]:
     return {"styles": styles, "details": details}
 
 
+@router.get("/visual/styles")
+async def get_styles_stub() -> ORJSONResponse:
+    return ORJSONResponse(_styles_payload())
@@ -1,10 +1,18 @@
 """Visual generation API endpoints."""
 
+import asyncio
 import logging
-from typing import Any, Dict
-
-from fastapi import APIRouter, Depends, HTTPException, Request
-from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_500_INTERNAL_SERVER_ERROR
+import re
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Final
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+)
 
 from ..models import (
     ConceptGenerationRequest,
@@ -14,20 +22,119 @@ from ..models import (
     UpscaleRequest,
     UpscaleResponse,
 )
+from ..models.render import (
+    FailedFrame,
+    RenderedFrame,
+    RenderStoryboardFramesRequest,
+    RenderStoryboardFramesResponse,
+    StoryboardFrameInput,
+)
+from ..providers._image_cache import cache_key
+from ..providers.base import ImageGenerationParams, ImageResult, ProviderError
+from ..responses import ORJSONResponse
 from ..services.asset_service import AssetService
 from ..services.provider_factory import ProviderFactory
 from ..services.visual_service import VisualService
+from ..templates import TemplateManager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["visual"])
+router = APIRouter(tags=["visual"], default_response_class=ORJSONResponse)
+
+
+async def get_visual_service(request: Request) -> VisualService:
+    """Get the shared visual service from app state, building it on first use."""
+    state = request.app.state
+    visual_service = getattr(state, "visual_service", None)
+    if visual_service is None:
+        provider_factory = state.provider_factory
+        asset_service = getattr(state, "asset_service", None)
+        if asset_service is None:
+            asset_service = state.asset_service = AssetService(provider_factory.settings)
+        visual_service = state.visual_service = VisualService(
+            provider_factory,
+            asset_service,
+            provider_factory.settings,
+            template_manager=_get_template_manager(state),
+        )
+    return visual_service
+
+
+def _get_template_manager(state: Any) -> TemplateManager:
+    """Get the shared template manager from app state, creating it on first use."""
+    template_manager = getattr(state, "template_manager", None)
+    if template_manager is None:
+        template_manager = state.template_manager = TemplateManager()
+    return template_manager
 
 
-def get_visual_service(request: Request) -> VisualService:
-    """Get visual service from app state."""
-    provider_factory = request.app.state.provider_factory
-    asset_service = AssetService(request.app.state.provider_factory.settings)
-    return VisualService(provider_factory, asset_service, provider_factory.settings)
+async def build_providers_snapshot(
+    provider_factory: ProviderFactory, max_age: float
+) -> Dict[str, Any]:
+    """Collect provider capabilities and health.
+
+    Args:
+        provider_factory: Provider factory to query
+        max_age: Seconds until the snapshot is considered stale
+
+    Returns:
+        Provider information with a ``stale_after`` epoch timestamp
+    """
+    providers = provider_factory.get_available_providers()
+    return {
+        "providers": providers,
+        "models": {
+            provider: provider_factory.get_supported_models(provider)
+            for provider in providers
+        },
+        "styles": provider_factory.get_supported_styles(),
+        "health": await provider_factory.health_check(),
+        "stale_after": time.time() + max_age,
+    }
+
+
+async def refresh_providers_snapshot(app: Any, interval: float) -> None:
+    """Keep ``app.state.providers_snapshot`` fresh; runs as a background task.
+
+    Args:
+        app: FastAPI application
+        interval: Seconds between refreshes
+    """
+    while True:
+        try:
+            app.state.providers_snapshot = await build_providers_snapshot(
+                app.state.provider_factory, interval * 2
+            )
+        except Exception as e:
+            logger.warning("Provider snapshot refresh failed: %s", e)
+        await asyncio.sleep(interval)
+
+
+def build_style_cache(template_manager: TemplateManager) -> Dict[str, Any]:
+    """Collect style presets and their template details.
+
+    Args:
+        template_manager: Shared template manager
+
+    Returns:
+        Dictionary with style names and per-style details
+    """
+    available_styles = template_manager.get_available_styles()
+
+    # Get template details for each style
+    style_details = {}
+    for style in available_styles:
+        template = template_manager.get_template(style)
+        style_details[style] = {
+            "name": template.name,
+            "description": template.base_prompt,
+            "recommended_settings": template.recommended_settings,
+        }
+
+    return {
+        "styles": available_styles,
+        "details": style_details,
+    }
 
 
 @router.post(
@@ -40,7 +147,7 @@ def get_visual_service(request: Request) -> VisualService:
 async def generate_storyboard(
     request: StoryboardGenerationRequest,
     visual_service: VisualService = Depends(get_visual_service),
-) -> StoryboardGenerationResponse:
+) -> Response:
     """Generate storyboard frames for scenes.
 
     Args:
@@ -54,18 +161,20 @@ async def generate_storyboard(
         HTTPException: If generation fails
     """
     try:
-        logger.info(f"Generating storyboard for project {request.project_id}")
+        logger.info("Generating storyboard for project %s", request.project_id)
         response = await visual_service.generate_storyboard(request)
-        return response
+        # Returning a Response skips FastAPI's re-validation of the built model;
+        # response_model still documents the schema
+        return ORJSONResponse(response)
 
     except ValueError as e:
-        logger.error(f"Invalid storyboard request: {e}")
+        logger.error("Invalid storyboard request: %s", e)
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
             detail=f"Invalid request: {str(e)}",
         )
     except Exception as e:
-        logger.error(f"Storyboard generation failed: {e}")
+        logger.error("Storyboard generation failed: %s", e)
         raise HTTPException(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during storyboard generation",
@@ -82,7 +191,7 @@ async def generate_storyboard(
 async def generate_concept(
     request: ConceptGenerationRequest,
     visual_service: VisualService = Depends(get_visual_service),
-) -> ConceptGenerationResponse:
+) -> Response:
     """Generate concept art.
 
     Args:
@@ -96,18 +205,18 @@ async def generate_concept(
         HTTPException: If generation fails
     """
     try:
-        logger.info(f"Generating concept art: {request.prompt[:50]}...")
+        logger.info("Generating concept art: %.50s...", request.prompt)
         response = await visual_service.generate_concept(request)
-        return response
+        return ORJSONResponse(response)
 
     except ValueError as e:
-        logger.error(f"Invalid concept request: {e}")
+        logger.error("Invalid concept request: %s", e)
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
             detail=f"Invalid request: {str(e)}",
         )
     except Exception as e:
-        logger.error(f"Concept generation failed: {e}")
+        logger.error("Concept generation failed: %s", e)
         raise HTTPException(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during concept generation",
@@ -124,7 +233,7 @@ async def generate_concept(
 async def upscale_image(
     request: UpscaleRequest,
     visual_service: VisualService = Depends(get_visual_service),
-) -> UpscaleResponse:
+) -> Response:
     """Upscale an existing image.
 
     Args:
@@ -138,18 +247,18 @@ async def upscale_image(
         HTTPException: If upscaling fails
     """
     try:
-        logger.info(f"Upscaling image {request.media_id} by {request.factor}x")
+        logger.info("Upscaling image %s by %sx", request.media_id, request.factor)
         response = await visual_service.upscale_image(request)
-        return response
+        return ORJSONResponse(response)
 
     except ValueError as e:
-        logger.error(f"Invalid upscale request: {e}")
+        logger.error("Invalid upscale request: %s", e)
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
             detail=f"Invalid request: {str(e)}",
         )
     except Exception as e:
-        logger.error(f"Image upscaling failed: {e}")
+        logger.error("Image upscaling failed: %s", e)
         raise HTTPException(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during image upscaling",
@@ -175,20 +284,23 @@ async def get_providers(
         Dictionary with provider information
     """
     try:
-        provider_factory: ProviderFactory = request.app.state.provider_factory
-
-        return {
-            "providers": provider_factory.get_available_providers(),
-            "models": {
-                provider: provider_factory.get_supported_models(provider)
-                for provider in provider_factory.get_available_providers()
-            },
-            "styles": provider_factory.get_supported_styles(),
-            "health": await provider_factory.health_check(),
-        }
+        state = request.app.state
+        snapshot = getattr(state, "providers_snapshot", None)
+        if snapshot is None or snapshot["stale_after"] <= time.time():
+            lock = getattr(state, "providers_snapshot_lock", None)
+            if lock is None:
+                lock = state.providers_snapshot_lock = asyncio.Lock()
+            async with lock:
+                snapshot = getattr(state, "providers_snapshot", None)
+                if snapshot is None or snapshot["stale_after"] <= time.time():
+                    snapshot = state.providers_snapshot = await build_providers_snapshot(
+                        state.provider_factory,
+                        state.provider_factory.settings.providers_refresh_interval,
+                    )
+        return ORJSONResponse(snapshot)
 
     except Exception as e:
-        logger.error(f"Failed to get provider info: {e}")
+        logger.error("Failed to get provider info: %s", e)
         raise HTTPException(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve provider information",
@@ -202,35 +314,25 @@ async def get_providers(
     summary="Get available styles",
     description="Get list of available visual style presets and templates",
 )
-async def get_styles() -> Dict[str, Any]:
+async def get_styles(request: Request) -> Dict[str, Any]:
     """Get available style presets.
 
+    Args:
+        request: FastAPI request
+
     Returns:
         Dictionary with style information
     """
-    from ..templates import TemplateManager
-
     try:
-        template_manager = TemplateManager()
-        available_styles = template_manager.get_available_styles()
-
-        # Get template details for each style
-        style_details = {}
-        for style in available_styles:
-            template = template_manager.get_template(style)
-            style_details[style] = {
-                "name": template.name,
-                "description": template.base_prompt,
-                "recommended_settings": template.recommended_settings,
-            }
-
-        return {
-            "styles": available_styles,
-            "details": style_details,
-        }
+        style_cache = getattr(request.app.state, "style_cache", None)
+        if style_cache is None:
+            style_cache = request.app.state.style_cache = build_style_cache(
+                _get_template_manager(request.app.state)
+            )
+        return ORJSONResponse(style_cache)
 
     except Exception as e:
-        logger.error(f"Failed to get style info: {e}")
+        logger.error("Failed to get style info: %s", e)
         raise HTTPException(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve style information",
@@ -238,49 +340,127 @@ async def get_styles() -> Dict[str, Any]:
 
 
 # --- Image Generation (Storyboard Frames) Endpoint ---
-from fastapi import Request
-from ..models.visual import (
-    RenderStoryboardFramesRequest,
-    RenderStoryboardFramesResponse,
-    RenderedFrame,
-    FailedFrame,
-)
-from ..providers.base import ImageGenerationParams, ProviderError
+
+_ASPECT_SIZES: Final[Dict[str, tuple[int, int]]] = {
+    "16:9": (1280, 720),
+    "4:3": (1024, 768),
+    "1:1": (1024, 1024),
+}
+_RATIO_RE = re.compile(r"^(\d+):(\d+)$")
+_NEGATIVE_PROMPT_DEFAULT = "blurry, low quality, distorted, extra limbs, watermark"
 
 
+@lru_cache(maxsize=64)
 def _size_from_aspect_ratio(ratio: str) -> tuple[int, int]:
-    mapping = {
-        "16:9": (1280, 720),
-        "4:3": (1024, 768),
-        "1:1": (1024, 1024),
-    }
-    if ratio in mapping:
-        return mapping[ratio]
-    try:
-        w, h = ratio.split(":")
-        w_i, h_i = int(w), int(h)
-        # scale to max width=1280 while preserving ratio
-        max_w = 1280
-        scaled_h = int(max_w * h_i / w_i)
-        if scaled_h > 720:
-            # fallback to max height 720
-            max_h = 720
-            scaled_w = int(max_h * w_i / h_i)
-            return (scaled_w, max_h)
-        return (max_w, scaled_h)
-    except Exception:
+    size = _ASPECT_SIZES.get(ratio)
+    if size is not None:
+        return size
+    match = _RATIO_RE.match(ratio)
+    if match is None:
+        return (1280, 720)
+    w_i, h_i = int(match.group(1)), int(match.group(2))
+    if w_i == 0 or h_i == 0:
         return (1280, 720)
+    # scale to max width=1280 while preserving ratio
+    max_w = 1280
+    scaled_h = int(max_w * h_i / w_i)
+    if scaled_h > 720:
+        # fallback to max height 720
+        max_h = 720
+        scaled_w = int(max_h * w_i / h_i)
+        return (scaled_w, max_h)
+    return (max_w, scaled_h)
+
+
+def _signature_suffix(signatures: list[str]) -> str:
+    if not signatures:
+        return ""
+    return "Character signatures: " + "; ".join(s.strip() for s in signatures)
+
+
+def _build_prompt(
+    desc: str,
+    cam: str | None,
+    light: str | None,
+    signatures: list[str] | None = None,
+    sig_suffix: str | None = None,
+) -> str:
+    # Callers rendering many frames pass the shared sig_suffix precomputed
+    if sig_suffix is None:
+        sig_suffix = _signature_suffix(signatures or [])
+    parts = (
+        desc.strip(),
+        f"Camera: {cam.strip()}." if cam else "",
+        f"Lighting: {light.strip()}." if light else "",
+        sig_suffix,
+    )
+    return " ".join(p for p in parts if p)
 
 
-def _build_prompt(desc: str, cam: str | None, light: str | None, signatures: list[str]) -> str:
-    parts = [desc.strip()]
-    if cam:
-        parts.append(f"Camera: {cam.strip()}.")
-    if light:
-        parts.append(f"Lighting: {light.strip()}.")
-    if signatures:
-        parts.append("Character signatures: " + "; ".join(s.strip() for s in signatures))
-    return " ".join(p for p in parts if p)
+def _start_frame_tasks(
+    params_list: list[ImageGenerationParams],
+    render: Callable[[ImageGenerationParams], Awaitable[ImageResult]],
+) -> list[asyncio.Task]:
+    # Seeded frames with identical generation parameters share one provider
+    # call; unseeded frames always render on their own
+    tasks_by_key: dict[str, asyncio.Task] = {}
+    tasks = []
+    for params in params_list:
+        key = cache_key(params)
+        if key is None:
+            tasks.append(asyncio.create_task(render(params)))
+            continue
+        if key not in tasks_by_key:
+            tasks_by_key[key] = asyncio.create_task(render(params))
+        tasks.append(tasks_by_key[key])
+    return tasks
+
+
+async def _collect_frames(
+    frames: list[StoryboardFrameInput], tasks: list[asyncio.Task]
+) -> tuple[list[RenderedFrame], list[FailedFrame]]:
+    # Clarification: stop on first failure, no retries/fallbacks. Results are
+    # taken in frame order, as when frames rendered one by one: everything
+    # after the first failing frame is cancelled and left out of the response,
+    # even frames that already finished.
+    generated: list[RenderedFrame] = []
+    failed: list[FailedFrame] = []
+    try:
+        for frame, task in zip(frames, tasks):
+            try:
+                result = await task
+            except ProviderError as e:
+                failed.append(
+                    FailedFrame(
+                        frame_id=frame.frame_id, error=e.error_code or "provider_error"
+                    )
+                )
+                break
+            except Exception:
+                failed.append(
+                    FailedFrame(frame_id=frame.frame_id, error="unexpected_error")
+                )
+                break
+            generated.append(
+                RenderedFrame(
+                    frame_id=frame.frame_id,
+                    image_url=result.url,
+                    negative_prompts=[_NEGATIVE_PROMPT_DEFAULT],
+                    provider_metadata={
+                        "seed": result.seed,
+                        "model": result.model,
+                        "provider": result.provider,
+                        "generation_time_ms": int(result.generation_time * 1000),
+                    },
+                    quality_score=None,  # Optional scoring can be plugged later
+                )
+            )
+    finally:
+        pending = [task for task in set(tasks) if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return generated, failed
 
 
 @router.post(
@@ -293,71 +473,61 @@ def _build_prompt(desc: str, cam: str | None, light: str | None, signatures: lis
 async def render_storyboard_frames(
     payload: RenderStoryboardFramesRequest,
     request: Request,
-) -> RenderStoryboardFramesResponse:
+) -> Response:
     try:
         provider_factory: ProviderFactory = request.app.state.provider_factory
         # Clarification: only fal.ai for MVP
         provider = provider_factory.get_provider("fal")
 
-        signatures = [cp.visual_signature for cp in payload.character_profiles]
-        width, height = _size_from_aspect_ratio(payload.render_settings.aspect_ratio)
-
-        generated: list[RenderedFrame] = []
-        failed: list[FailedFrame] = []
-
-        negative_prompt_default = "blurry, low quality, distorted, extra limbs, watermark"
-
-        for frame in payload.storyboard_frames:
-            prompt = _build_prompt(
-                frame.description,
-                frame.camera_notes,
-                frame.lighting_mood,
-                signatures,
+        sig_suffix = _signature_suffix(
+            [cp.visual_signature for cp in payload.character_profiles]
+        )
+        rs = payload.render_settings
+        width, height = _size_from_aspect_ratio(rs.aspect_ratio)
+
+        # Shared by every frame; the request model has already validated them
+        base_params = {
+            "model": rs.model or "fal-ai/flux-pro",
+            "width": width,
+            "height": height,
+            "steps": rs.steps,
+            "guidance_scale": rs.guidance_scale,
+            "negative_prompt": _NEGATIVE_PROMPT_DEFAULT,
+            "aspect_ratio": rs.aspect_ratio,
+        }
+        params_list = [
+            ImageGenerationParams.model_construct(
+                **base_params,
+                prompt=_build_prompt(
+                    frame.description,
+                    frame.camera_notes,
+                    frame.lighting_mood,
+                    sig_suffix=sig_suffix,
+                ),
+                seed=frame.prompt_seed if frame.prompt_seed is not None else rs.seed,
             )
+            for frame in payload.storyboard_frames
+        ]
 
-            params = ImageGenerationParams(
-                prompt=prompt,
-                model=payload.render_settings.model or "fal-ai/flux-pro",
-                width=width,
-                height=height,
-                seed=frame.prompt_seed if frame.prompt_seed is not None else payload.render_settings.seed,
-                steps=payload.render_settings.steps,
-                guidance_scale=payload.render_settings.guidance_scale,
-                negative_prompt=negative_prompt_default,
-                aspect_ratio=payload.render_settings.aspect_ratio,
-            )
+        # Frames are independent, so render them concurrently (bounded)
+        semaphore = asyncio.Semaphore(provider_factory.settings.render_concurrency)
 
-            try:
-                result = await provider.generate_image(params)
-                generated.append(
-                    RenderedFrame(
-                        frame_id=frame.frame_id,
-                        image_url=str(result.url),
-                        negative_prompts=[negative_prompt_default],
-                        provider_metadata={
-                            "seed": result.seed,
-                            "model": result.model,
-                            "provider": result.provider,
-                            "generation_time_ms": int(result.generation_time * 1000),
-                        },
-                        quality_score=None,  # Optional scoring can be plugged later
-                    )
-                )
-            except ProviderError as e:
-                failed.append(FailedFrame(frame_id=frame.frame_id, error=e.error_code or "provider_error"))
-                # Clarification: stop on first failure, no retries/fallbacks
-                break
-            except Exception as e:
-                failed.append(FailedFrame(frame_id=frame.frame_id, error="unexpected_error"))
-                break
+        async def render(params: ImageGenerationParams) -> ImageResult:
+            async with semaphore:
+                return await provider.generate_image(params)
 
-        return RenderStoryboardFramesResponse(generated_frames=generated, failed_frames=failed)
+        tasks = _start_frame_tasks(params_list, render)
+        generated, failed = await _collect_frames(payload.storyboard_frames, tasks)
+
+        return ORJSONResponse(
+            RenderStoryboardFramesResponse(generated_frames=generated, failed_frames=failed)
+        )
 
     except ValueError as e:
-        logger.error(f"Invalid render request: {e}")
+        logger.error("Invalid render request: %s", e)
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=f"Invalid request: {str(e)}")
     except Exception as e:
-        logger.error(f"Render frames failed: {e}")
+        logger.error("Render frames failed: %s", e)
         raise HTTPException(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during frame rendering",
@@ -2,13 +2,47 @@
 
 import asyncio
 import io
-from typing import Any, Dict, Optional
+import logging
+import secrets
+import tempfile
+from collections import OrderedDict
+from typing import Any, AsyncIterator, BinaryIO, Dict, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import httpx
-from PIL import Image
+import orjson
+from PIL import Image, UnidentifiedImageError
 
 from ..config import Settings
+from ..providers._retry import retry
+
+logger = logging.getLogger(__name__)
+
+# Downloads larger than this spill from memory to a temporary file
+_SPOOL_MAX_SIZE = 4 * 1024 * 1024
+# Read size when streaming a spilled download back out of its temporary file
+_FILE_CHUNK_SIZE = 256 * 1024
+# Bytes handed to PIL when only the image header is needed
+_HEADER_READ_SIZE = 64 * 1024
+# Uploaded media records remembered per (image_url, project_id)
+_UPLOAD_CACHE_SIZE = 256
+
+_UploadKey = Tuple[str, Optional[str]]
+
+
+def _encode_payload(metadata: Dict[str, Any]) -> bytes:
+    """Encode upload metadata for the PayloadCMS "_payload" form field.
+
+    Values orjson cannot serialize natively fall back to ``str`` so arbitrary
+    scene metadata never fails an upload.
+
+    Args:
+        metadata: Metadata to attach
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return orjson.dumps(metadata, default=str, option=orjson.OPT_NON_STR_KEYS)
 
 
 class AssetService:
@@ -24,6 +58,38 @@ class AssetService:
         self.base_url = settings.payloadcms_api_url
         self.api_key = settings.payloadcms_api_key
         self.timeout = 30
+        # Auth goes on CMS calls only; the client also downloads provider images
+        self._headers: Dict[str, str] = {}
+        if self.api_key:
+            self._headers["Authorization"] = f"API-Key {self.api_key}"
+        self._client: Optional[httpx.AsyncClient] = None
+        # Media records of recent uploads, so a re-used source URL is not
+        # downloaded and uploaded again
+        self._upload_cache: "OrderedDict[_UploadKey, Dict[str, Any]]" = OrderedDict()
+        self._uploads_in_flight: Dict[_UploadKey, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use.
+
+        Returns:
+            Async HTTP client shared by all calls from this service
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.settings.payloadcms_max_connections,
+                    max_keepalive_connections=self.settings.payloadcms_max_keepalive_connections,
+                    keepalive_expiry=self.settings.payloadcms_keepalive_expiry,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client; called from the application shutdown hook."""
+        client, self._client = self._client, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
 
     async def upload_image(
         self,
@@ -41,62 +107,238 @@ class AssetService:
             metadata: Additional metadata to attach
 
         Returns:
-            PayloadCMS media record
+            PayloadCMS media record; a URL already uploaded for the project
+            returns the existing record, whatever ``filename`` is passed
 
         Raises:
             Exception: If upload fails
         """
+        # Filenames carry a fresh generation id, so they are not part of the key
+        key = (image_url, project_id)
+        cached = self._upload_cache.get(key)
+        if cached is not None:
+            self._upload_cache.move_to_end(key)
+            return cached
+
+        # Concurrent uploads of the same image share one in-flight task
+        task = self._uploads_in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._upload_image(image_url, filename, project_id, metadata)
+            )
+            self._uploads_in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish_upload(key, done))
+        # Shielded so one cancelled caller does not cancel the shared upload
+        return await asyncio.shield(task)
+
+    def _finish_upload(
+        self, key: _UploadKey, task: "asyncio.Future[Dict[str, Any]]"
+    ) -> None:
+        """Record a finished upload task in the URL cache."""
+        self._uploads_in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._upload_cache[key] = task.result()
+        while len(self._upload_cache) > _UPLOAD_CACHE_SIZE:
+            self._upload_cache.popitem(last=False)
+
+    async def _upload_image(
+        self,
+        image_url: str,
+        filename: str,
+        project_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Download an image and upload it to PayloadCMS; see upload_image."""
         try:
-            # Download the image
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(image_url)
+            async with self._get_client().stream("GET", image_url) as response:
                 response.raise_for_status()
-                image_data = response.content
-
-            # Get image dimensions and format
-            image_info = self._get_image_info(image_data)
-
-            # Prepare metadata
-            upload_metadata = {
-                "visual": {
-                    "source_url": image_url,
-                    "width": image_info["width"],
-                    "height": image_info["height"],
-                    "format": image_info["format"],
-                    "file_size": len(image_data),
-                    **(metadata or {}),
-                }
-            }
+                chunks = response.aiter_bytes()
+                length = response.headers.get("Content-Length")
+                encoded = response.headers.get("Content-Encoding", "identity") != "identity"
+                if length is None or encoded:
+                    # Size unknown up front: buffer the body to measure it
+                    return await self._upload_spooled(
+                        chunks, image_url, filename, project_id, metadata
+                    )
+
+                # Known size: sniff the header from the first chunks, then pipe
+                # the rest of the download straight into the CMS request
+                prefix = bytearray()
+                async for chunk in chunks:
+                    prefix += chunk
+                    if len(prefix) >= _HEADER_READ_SIZE:
+                        break
+                image_info = await asyncio.to_thread(self._get_image_info, bytes(prefix))
+                upload_metadata = self._build_upload_metadata(
+                    image_url, image_info, int(length), project_id, metadata
+                )
+                return await self._stream_to_cms(
+                    bytes(prefix),
+                    chunks,
+                    int(length),
+                    filename,
+                    upload_metadata,
+                    content_type=f"image/{image_info['format']}",
+                )
+
+        except Exception as e:
+            raise Exception(f"Failed to upload image to PayloadCMS: {str(e)}")
+
+    async def _upload_spooled(
+        self,
+        chunks: AsyncIterator[bytes],
+        image_url: str,
+        filename: str,
+        project_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Buffer a download of unknown size, then upload it to PayloadCMS."""
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buffer:
+            async for chunk in chunks:
+                # Past the spool limit writes hit the disk, so they leave the loop
+                if buffer.tell() >= _SPOOL_MAX_SIZE:
+                    await asyncio.to_thread(buffer.write, chunk)
+                else:
+                    buffer.write(chunk)
+            file_size = buffer.tell()
+
+            # Get image dimensions and format; PIL parsing (and reads from a
+            # spilled temp file) run off the event loop
+            buffer.seek(0)
+            image_info = await asyncio.to_thread(self._get_image_info, buffer)
+            buffer.seek(0)
+
+            upload_metadata = self._build_upload_metadata(
+                image_url, image_info, file_size, project_id, metadata
+            )
 
-            if project_id:
-                upload_metadata["project_id"] = project_id
+            content_type = f"image/{image_info['format']}"
+            if file_size <= _SPOOL_MAX_SIZE:
+                # Still in memory; httpx reads the buffer directly
+                return await self._upload_to_cms(
+                    buffer, filename, upload_metadata, content_type=content_type
+                )
 
-            # Upload to PayloadCMS
-            return await self._upload_to_cms(
-                image_data,
+            # Spilled to disk: stream it back with file reads off the event loop
+            return await self._stream_to_cms(
+                b"",
+                self._read_file_chunks(buffer),
+                file_size,
                 filename,
                 upload_metadata,
+                content_type,
             )
 
-        except Exception as e:
-            raise Exception(f"Failed to upload image to PayloadCMS: {str(e)}")
+    @staticmethod
+    async def _read_file_chunks(fp: BinaryIO) -> AsyncIterator[bytes]:
+        """Yield a file's contents, reading each chunk in a worker thread."""
+        while chunk := await asyncio.to_thread(fp.read, _FILE_CHUNK_SIZE):
+            yield chunk
 
-    def _get_image_info(self, image_data: bytes) -> Dict[str, Any]:
+    @staticmethod
+    def _build_upload_metadata(
+        image_url: str,
+        image_info: Dict[str, Any],
+        file_size: int,
+        project_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the PayloadCMS document fields for an uploaded image."""
+        upload_metadata: Dict[str, Any] = {
+            "visual": {
+                "source_url": image_url,
+                "width": image_info["width"],
+                "height": image_info["height"],
+                "format": image_info["format"],
+                "file_size": file_size,
+                **(metadata or {}),
+            }
+        }
+        if project_id:
+            upload_metadata["project_id"] = project_id
+        return upload_metadata
+
+    async def _stream_to_cms(
+        self,
+        prefix: bytes,
+        rest: AsyncIterator[bytes],
+        file_size: int,
+        filename: str,
+        metadata: Dict[str, Any],
+        content_type: str = "image/png",
+    ) -> Dict[str, Any]:
+        """Upload an image to PayloadCMS while it is still being downloaded.
+
+        The multipart body is written by hand because httpx only accepts
+        synchronous file objects for multipart parts; peak memory is the
+        header prefix plus one download chunk.
+
+        Args:
+            prefix: Bytes already read from the download
+            rest: Remaining download chunks
+            file_size: Total image size in bytes
+            filename: Filename for the asset
+            metadata: Metadata to attach
+            content_type: MIME type of the image
+
+        Returns:
+            PayloadCMS response data
+        """
+        boundary = secrets.token_hex(16)
+        head = b"".join(
+            (
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="_payload"\r\n\r\n'.encode(),
+                _encode_payload(metadata),
+                f"\r\n--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+                f"Content-Type: {content_type}\r\n\r\n".encode(),
+            )
+        )
+        tail = f"\r\n--{boundary}--\r\n".encode()
+
+        async def body() -> AsyncIterator[bytes]:
+            yield head
+            yield prefix
+            async for chunk in rest:
+                yield chunk
+            yield tail
+
+        response = await self._get_client().post(
+            f"{self.base_url}/media",
+            headers={
+                **self._headers,
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Length": str(len(head) + file_size + len(tail)),
+            },
+            content=body(),
+        )
+
+        response.raise_for_status()
+        return response.json()
+
+    def _get_image_info(self, image_data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """Get image information from binary data.
 
         Args:
-            image_data: Image binary data
+            image_data: Image binary data or a readable file positioned at
+                its start; PIL only reads the header from a file
 
         Returns:
             Dictionary with image info
         """
         try:
-            with Image.open(io.BytesIO(image_data)) as img:
-                return {
-                    "width": img.width,
-                    "height": img.height,
-                    "format": img.format.lower() if img.format else "png",
-                }
+            if isinstance(image_data, bytes):
+                # Headers of common formats fit in the first 64 KiB; only fall
+                # back to the whole buffer for formats with larger headers
+                try:
+                    return self._read_image_header(
+                        io.BytesIO(image_data[:_HEADER_READ_SIZE])
+                    )
+                except (UnidentifiedImageError, OSError, SyntaxError):
+                    image_data = io.BytesIO(image_data)
+            return self._read_image_header(image_data)
         except Exception:
             # Return defaults if image analysis fails
             return {
@@ -105,51 +347,59 @@ class AssetService:
                 "format": "png",
             }
 
+    @staticmethod
+    def _read_image_header(fp: BinaryIO) -> Dict[str, Any]:
+        """Read size and format from an image file without decoding pixels.
+
+        Args:
+            fp: Readable binary file positioned at the image start
+
+        Returns:
+            Dictionary with image info
+        """
+        with Image.open(fp) as img:
+            return {
+                "width": img.width,
+                "height": img.height,
+                "format": img.format.lower() if img.format else "png",
+            }
+
     async def _upload_to_cms(
         self,
-        image_data: bytes,
+        image_data: Union[bytes, BinaryIO],
         filename: str,
         metadata: Dict[str, Any],
+        content_type: str = "image/png",
     ) -> Dict[str, Any]:
         """Upload image data to PayloadCMS.
 
         Args:
-            image_data: Image binary data
+            image_data: Image binary data or a readable file
             filename: Filename for the asset
             metadata: Metadata to attach
+            content_type: MIME type of the image
 
         Returns:
             PayloadCMS response data
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"API-Key {self.api_key}"
-
-            # Prepare multipart upload
-            files = {
-                "file": (filename, image_data, "image/png"),
-            }
-            
-            # Add metadata as form data
-            data = {}
-            for key, value in metadata.items():
-                if isinstance(value, dict):
-                    # Handle nested objects
-                    for nested_key, nested_value in value.items():
-                        data[f"{key}.{nested_key}"] = str(nested_value)
-                else:
-                    data[key] = str(value)
+        # Prepare multipart upload
+        files = {
+            "file": (filename, image_data, content_type),
+        }
 
-            response = await client.post(
-                f"{self.base_url}/media",
-                headers=headers,
-                files=files,
-                data=data,
-            )
+        # PayloadCMS reads document fields from a JSON "_payload" form field,
+        # which keeps nested metadata intact instead of flattening it to reprs
+        data = {"_payload": _encode_payload(metadata)}
 
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(
+            f"{self.base_url}/media",
+            headers=self._headers,
+            files=files,
+            data=data,
+        )
+
+        response.raise_for_status()
+        return response.json()
 
     async def get_media_by_id(self, media_id: str) -> Optional[Dict[str, Any]]:
         """Get media record by ID.
@@ -160,24 +410,24 @@ class AssetService:
         Returns:
             Media record or None if not found
         """
+        client = self._get_client()
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                headers = {}
-                if self.api_key:
-                    headers["Authorization"] = f"API-Key {self.api_key}"
-
-                response = await client.get(
+            response = await retry(
+                lambda: client.get(
                     f"{self.base_url}/media/{media_id}",
-                    headers=headers,
-                )
+                    headers=self._headers,
+                ),
+                max_tries=3,
+            )
 
-                if response.status_code == 404:
-                    return None
+            if response.status_code == 404:
+                return None
 
-                response.raise_for_status()
-                return response.json()
+            response.raise_for_status()
+            return response.json()
 
-        except Exception:
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            logger.warning("Failed to fetch media %s: %s", media_id, e)
             return None
 
     async def update_media_metadata(
@@ -194,29 +444,39 @@ class AssetService:
         Returns:
             Updated media record or None if failed
         """
+        client = self._get_client()
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                headers = {
-                    "Content-Type": "application/json",
-                }
-                if self.api_key:
-                    headers["Authorization"] = f"API-Key {self.api_key}"
-
-                response = await client.patch(
+            # httpx sets the JSON content type for json= bodies
+            response = await retry(
+                lambda: client.patch(
                     f"{self.base_url}/media/{media_id}",
-                    headers=headers,
+                    headers=self._headers,
                     json=metadata,
-                )
+                ),
+                max_tries=3,
+            )
 
-                if response.status_code == 404:
-                    return None
+            if response.status_code == 404:
+                return None
 
-                response.raise_for_status()
-                return response.json()
+            response.raise_for_status()
+            self._invalidate_upload(media_id)
+            return response.json()
 
-        except Exception:
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            logger.warning("Failed to update media %s: %s", media_id, e)
             return None
 
+    def _invalidate_upload(self, media_id: str) -> None:
+        """Drop cached upload records for a media ID that has changed."""
+        stale = [
+            key
+            for key, record in self._upload_cache.items()
+            if record.get("id") == media_id
+        ]
+        for key in stale:
+            del self._upload_cache[key]
+
     async def check_connection(self) -> bool:
         """Check if PayloadCMS is accessible.
 
@@ -224,18 +484,14 @@ class AssetService:
             True if accessible, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                headers = {}
-                if self.api_key:
-                    headers["Authorization"] = f"API-Key {self.api_key}"
-
-                response = await client.get(
-                    f"{self.base_url}/media",
-                    headers=headers,
-                    params={"limit": 1},  # Just check accessibility
-                )
+            # HEAD transfers no body; 401/405 still prove the CMS is reachable
+            response = await self._get_client().head(
+                f"{self.base_url}/media",
+                headers=self._headers,
+                timeout=2,
+            )
 
-                return response.status_code in [200, 401]  # 401 means accessible but auth issue
+            return response.status_code in (200, 401, 405)
 
         except Exception:
             return False
\ No newline at end of file
@@ -1,10 +1,13 @@
 """Provider factory for managing image generation providers."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from ..config import Settings
 from ..providers import BaseProvider, FalProvider, OpenRouterProvider
+from ..providers.base import ProviderHealth, ProviderStatus
 
 
 class ProviderFactory:
@@ -18,6 +21,9 @@ class ProviderFactory:
         """
         self.settings = settings
         self._providers: Dict[str, BaseProvider] = {}
+        self._health_cache: Optional[Tuple[float, Dict[str, str]]] = None
+        self._health_lock = asyncio.Lock()
+        self._health_sem = asyncio.Semaphore(settings.max_concurrent_health_checks)
         self._initialize_providers()
 
     def _initialize_providers(self) -> None:
@@ -28,6 +34,8 @@ class ProviderFactory:
                 api_key=self.settings.fal_api_key,
                 default_model=self.settings.fal_text_to_image_model,
                 timeout=60,
+                max_concurrent=self.settings.fal_max_concurrent,
+                health_ttl=self.settings.health_cache_ttl,
             )
 
         # Initialize OpenRouter provider if API key is available
@@ -37,8 +45,44 @@ class ProviderFactory:
                 default_model=self.settings.openrouter_default_model,
                 backup_model=self.settings.openrouter_backup_model,
                 timeout=60,
+                max_concurrent=self.settings.openrouter_max_concurrent,
+                health_ttl=self.settings.health_cache_ttl,
             )
 
+        # Preference order is fixed: FAL, then OpenRouter, then anything else
+        self._default_provider: Optional[BaseProvider] = (
+            self._providers.get("fal")
+            or self._providers.get("openrouter")
+            or next(iter(self._providers.values()), None)
+        )
+        self._index_capabilities()
+
+    def _index_capabilities(self) -> None:
+        """Precompute supported models and styles per provider and overall.
+
+        Provider capabilities are fixed for the lifetime of the factory, so
+        the lookups below become plain attribute reads.
+        """
+        self._models_by_provider: Dict[str, Tuple[str, ...]] = {
+            name: tuple(provider.get_supported_models())
+            for name, provider in self._providers.items()
+        }
+        self._styles_by_provider: Dict[str, Tuple[str, ...]] = {
+            name: tuple(provider.get_supported_styles())
+            for name, provider in self._providers.items()
+        }
+        # dict.fromkeys dedups while preserving provider order
+        self._models_all: Tuple[str, ...] = tuple(
+            dict.fromkeys(
+                model for models in self._models_by_provider.values() for model in models
+            )
+        )
+        self._styles_all: Tuple[str, ...] = tuple(
+            dict.fromkeys(
+                style for styles in self._styles_by_provider.values() for style in styles
+            )
+        )
+
     def get_provider(self, name: Optional[str] = None) -> BaseProvider:
         """Get a provider by name or return the best available.
 
@@ -51,23 +95,18 @@ class ProviderFactory:
         Raises:
             ValueError: If no providers are available or named provider not found
         """
-        if not self._providers:
+        if self._default_provider is None:
             raise ValueError("No image generation providers are configured")
 
         # Return specific provider if requested
         if name:
-            if name not in self._providers:
+            provider = self._providers.get(name)
+            if provider is None:
                 raise ValueError(f"Provider '{name}' not available")
-            return self._providers[name]
+            return provider
 
         # Return best available provider (prefer FAL, fallback to OpenRouter)
-        if "fal" in self._providers:
-            return self._providers["fal"]
-        elif "openrouter" in self._providers:
-            return self._providers["openrouter"]
-        else:
-            # Return first available provider
-            return next(iter(self._providers.values()))
+        return self._default_provider
 
     def get_available_providers(self) -> List[str]:
         """Get list of available provider names.
@@ -80,31 +119,55 @@ class ProviderFactory:
     async def health_check(self) -> Dict[str, str]:
         """Check health of all providers.
 
+        Results are cached for ``settings.health_cache_ttl`` seconds so that
+        frequent probes of ``/health`` do not fan out to the providers on
+        every hit.
+
         Returns:
             Dictionary mapping provider names to health status
         """
-        health_status = {}
-        
-        # Run health checks in parallel
-        health_tasks = [
-            self._check_provider_health(name, provider)
-            for name, provider in self._providers.items()
-        ]
-        
-        if health_tasks:
-            results = await asyncio.gather(*health_tasks, return_exceptions=True)
-            
-            for (name, _), result in zip(self._providers.items(), results):
-                if isinstance(result, Exception):
-                    health_status[name] = "error"
-                else:
-                    health_status[name] = result.status.value
-        
-        return health_status
-
-    async def _check_provider_health(self, name: str, provider: BaseProvider) -> Any:
+        cached = self._health_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return dict(cached[1])
+
+        async with self._health_lock:
+            # Another caller may have refreshed the cache while we waited
+            cached = self._health_cache
+            if cached is not None and time.monotonic() < cached[0]:
+                return dict(cached[1])
+
+            health_status = await self._collect_health()
+            self._health_cache = (
+                time.monotonic() + self.settings.health_cache_ttl,
+                health_status,
+            )
+            return dict(health_status)
+
+    async def _collect_health(self) -> Dict[str, str]:
+        """Run health checks against every configured provider.
+
+        Returns:
+            Dictionary mapping provider names to health status
+        """
+        # _check_provider_health turns every failure into an unhealthy result,
+        # so no task can raise and cancel its siblings in the group
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                name: tg.create_task(self._check_provider_health(name, provider))
+                for name, provider in self._providers.items()
+            }
+
+        return {name: task.result().status.value for name, task in tasks.items()}
+
+    async def _check_provider_health(
+        self, name: str, provider: BaseProvider
+    ) -> ProviderHealth:
         """Check health of a single provider.
 
+        A provider that does not answer within ``settings.health_check_timeout``
+        seconds is reported as unhealthy so it cannot stall the others. At most
+        ``settings.max_concurrent_health_checks`` probes run at once.
+
         Args:
             name: Provider name
             provider: Provider instance
@@ -113,74 +176,47 @@ class ProviderFactory:
             Provider health status
         """
         try:
-            return await provider.check_health()
-        except Exception:
-            # Return unhealthy status on exception
-            from ..providers.base import ProviderHealth, ProviderStatus
-            from datetime import datetime
-            
+            async with self._health_sem:
+                return await asyncio.wait_for(
+                    provider.check_health(), timeout=self.settings.health_check_timeout
+                )
+        except Exception as e:
+            # Return unhealthy status on exception, including timeouts
+            error = str(e) or type(e).__name__
             return ProviderHealth(
                 status=ProviderStatus.UNHEALTHY,
-                message=f"Health check failed for {name}",
+                message=f"Health check failed for {name}: {error}",
                 response_time=None,
-                last_check=datetime.utcnow().isoformat(),
-                metadata={"provider": name},
+                last_check=datetime.now(timezone.utc).isoformat(),
+                metadata={"provider": name, "error": error},
             )
 
-    def get_supported_models(self, provider_name: Optional[str] = None) -> List[str]:
+    def get_supported_models(
+        self, provider_name: Optional[str] = None
+    ) -> Sequence[str]:
         """Get supported models for a provider or all providers.
 
         Args:
             provider_name: Optional provider name
 
         Returns:
-            List of supported models
+            Tuple of supported models, empty for an unknown provider
         """
         if provider_name:
-            if provider_name not in self._providers:
-                return []
-            return self._providers[provider_name].get_supported_models()
-        
-        # Return models from all providers
-        all_models = []
-        for provider in self._providers.values():
-            all_models.extend(provider.get_supported_models())
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_models = []
-        for model in all_models:
-            if model not in seen:
-                seen.add(model)
-                unique_models.append(model)
-        
-        return unique_models
-
-    def get_supported_styles(self, provider_name: Optional[str] = None) -> List[str]:
+            return self._models_by_provider.get(provider_name, ())
+        return self._models_all
+
+    def get_supported_styles(
+        self, provider_name: Optional[str] = None
+    ) -> Sequence[str]:
         """Get supported styles for a provider or all providers.
 
         Args:
             provider_name: Optional provider name
 
         Returns:
-            List of supported styles
+            Tuple of supported styles, empty for an unknown provider
         """
         if provider_name:
-            if provider_name not in self._providers:
-                return []
-            return self._providers[provider_name].get_supported_styles()
-        
-        # Return styles from all providers
-        all_styles = []
-        for provider in self._providers.values():
-            all_styles.extend(provider.get_supported_styles())
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_styles = []
-        for style in all_styles:
-            if style not in seen:
-                seen.add(style)
-                unique_styles.append(style)
-        
-        return unique_styles
\ No newline at end of file
+            return self._styles_by_provider.get(provider_name, ())
+        return self._styles_all
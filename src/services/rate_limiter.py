@@ -0,0 +1,33 @@
+"""Request-rate limiting for outbound provider calls."""
+
+import asyncio
+
+
+class AsyncRateLimiter:
+    """Space calls at least ``1 / rps`` seconds apart.
+
+    Each caller reserves the next free time slot under a lock and then sleeps
+    outside it until that slot arrives, so waiting callers do not serialize on
+    the lock itself.
+    """
+
+    def __init__(self, rps: float) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            rps: Maximum sustained requests per second
+        """
+        self.rps = rps
+        self._interval = 1.0 / rps
+        self._next_ts = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the caller may issue its next request."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            wait = max(0.0, self._next_ts - now)
+            self._next_ts = max(now, self._next_ts) + self._interval
+        if wait:
+            await asyncio.sleep(wait)
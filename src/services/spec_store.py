@@ -8,23 +8,93 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from bisect import bisect_left
+from itertools import chain
 from typing import Any, Dict, List, Optional, Tuple
+import base64
+import binascii
+import hashlib
+import json
+import os
+import threading
 import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class _Record:
+    """Slotted record base; dicts are only built at the API boundary."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class _RequestRecord(_Record):
+    id: str
+    projectId: str
+    title: str
+    description: str
+    tags: List[str]
+    references: List[Dict[str, Any]]
+    status: str
+    createdAt: str
+    updatedAt: str
+
+
+@dataclass(slots=True)
+class _BoardRecord(_Record):
+    id: str
+    requestId: str
+    iteration: int
+    summary: str
+    conceptCount: int
+    status: str
+
+
+@dataclass(slots=True)
+class _ConceptRecord(_Record):
+    id: str
+    boardId: str
+    caption: str
+    tags: List[str]
+    imageUrls: List[str]
+    provenance: Any
+
+
 @dataclass
 class _State:
-    requests: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    boards: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Request ids in the order lists below are kept in creation order (oldest
+    # first) and each carries a monotonic sequence number, so a page is a
+    # bisect on the cursor plus a slice rather than a sort.
+    requests: Dict[str, _RequestRecord] = field(default_factory=dict)
+    request_seq: Dict[str, int] = field(default_factory=dict)
+    next_seq: int = 0
+    request_order: List[str] = field(default_factory=list)
+    requests_by_project: Dict[str, List[str]] = field(default_factory=dict)
+    requests_by_status: Dict[str, List[str]] = field(default_factory=dict)
+    boards: Dict[str, _BoardRecord] = field(default_factory=dict)
     board_by_request: Dict[str, List[str]] = field(default_factory=dict)
-    concepts_by_board: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    concepts_by_board: Dict[str, List[_ConceptRecord]] = field(default_factory=dict)
+    # Per-board content hash -> stored concept, so resubmitted concepts are not duplicated
+    concept_by_hash: Dict[str, Dict[bytes, _ConceptRecord]] = field(default_factory=dict)
 
 
 class SpecStore:
     state = _State()
+    # Guards multi-structure updates (records plus their indexes) so threaded
+    # callers never observe or create half-applied changes.
+    _lock = threading.RLock()
+
+    @classmethod
+    def _reset_state(cls) -> None:
+        # Swap in a fresh state object so readers see either the old or the
+        # new store, never one with only some indexes cleared
+        with cls._lock:
+            cls.state = _State()
 
     @staticmethod
     def _now() -> str:
@@ -33,119 +103,195 @@ class SpecStore:
     @classmethod
     def create_request(cls, data: Dict[str, Any]) -> Dict[str, Any]:
         rid = str(uuid.uuid4())
-        item = {
-            "id": rid,
-            "projectId": data["projectId"],
-            "title": data["title"],
-            "description": data["description"],
-            "tags": data.get("tags") or [],
-            "references": data.get("references") or [],
-            "status": "Submitted",
-            "createdAt": cls._now(),
-            "updatedAt": cls._now(),
-        }
-        cls.state.requests[rid] = item
-        cls.state.board_by_request.setdefault(rid, [])
+        now = cls._now()
+        item = _RequestRecord(
+            id=rid,
+            projectId=data["projectId"],
+            title=data["title"],
+            description=data["description"],
+            tags=data.get("tags") or [],
+            references=data.get("references") or [],
+            status="Submitted",
+            createdAt=now,
+            updatedAt=now,
+        )
+        with cls._lock:
+            cls.state.requests[rid] = item
+            cls.state.request_seq[rid] = cls.state.next_seq
+            cls.state.next_seq += 1
+            cls.state.request_order.append(rid)
+            cls.state.requests_by_project.setdefault(item.projectId, []).append(rid)
+            cls.state.requests_by_status.setdefault(item.status, []).append(rid)
+            cls.state.board_by_request.setdefault(rid, [])
         logger.info("Created request %s for project %s", rid, data["projectId"])
-        return item
+        return item.to_dict()
 
     @classmethod
     def list_requests(
         cls, project_id: Optional[str], status: Optional[str], limit: int, cursor: Optional[str]
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-        items = sorted(cls.state.requests.values(), key=lambda i: i.get("createdAt", ""), reverse=True)
-        if project_id:
-            items = [i for i in items if i.get("projectId") == project_id]
-        if status:
-            items = [i for i in items if i.get("status") == status]
-        try:
-            offset = int(cursor) if cursor is not None else 0
-        except ValueError:
-            offset = 0
+        before = cls._decode_cursor(cursor)
         page_limit = max(1, min(limit, 200))
-        page = items[offset : offset + page_limit]
-        next_cursor = str(offset + page_limit) if offset + page_limit < len(items) else None
-        logger.debug("List requests offset=%s limit=%s returned=%s", offset, page_limit, len(page))
+        with cls._lock:
+            # Narrow candidates through the project/status indexes
+            ids: List[str]
+            if project_id:
+                ids = cls.state.requests_by_project.get(project_id, [])
+                if status:
+                    ids = [rid for rid in ids if cls.state.requests[rid].status == status]
+            elif status:
+                ids = cls.state.requests_by_status.get(status, [])
+            else:
+                ids = cls.state.request_order
+            # Keyset pagination: the page ends just before the cursor's sequence
+            # number, so deep pages cost the same as the first one
+            end = len(ids)
+            if before is not None:
+                end = bisect_left(ids, before, key=cls.state.request_seq.__getitem__)
+            start = max(0, end - page_limit)
+            page = [cls.state.requests[rid].to_dict() for rid in reversed(ids[start:end])]
+            next_cursor = cls._encode_cursor(cls.state.request_seq[ids[start]]) if start > 0 else None
+        logger.debug("List requests cursor=%s limit=%s returned=%s", cursor, page_limit, len(page))
         return page, next_cursor
 
+    @staticmethod
+    def _encode_cursor(seq: int) -> str:
+        return base64.urlsafe_b64encode(str(seq).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Optional[int]:
+        # Unknown or malformed cursors restart from the newest request
+        if not cursor:
+            return None
+        try:
+            return int(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError):
+            return None
+
     @classmethod
     def get_request(cls, rid: str) -> Optional[Dict[str, Any]]:
-        return cls.state.requests.get(rid)
+        item = cls.state.requests.get(rid)
+        return item.to_dict() if item is not None else None
 
     @classmethod
     def delete_request(cls, rid: str) -> None:
-        if rid in cls.state.requests:
-            for bid in cls.state.board_by_request.get(rid, []):
-                cls.state.boards.pop(bid, None)
-                cls.state.concepts_by_board.pop(bid, None)
-            cls.state.board_by_request.pop(rid, None)
-            cls.state.requests.pop(rid, None)
-            logger.info("Deleted request %s with cascade", rid)
+        with cls._lock:
+            item = cls.state.requests.pop(rid, None)
+            if item is not None:
+                # create_request/create_board register every index entry, so the
+                # cascade can delete them without existence checks.
+                for bid in cls.state.board_by_request.pop(rid):
+                    del cls.state.boards[bid]
+                    del cls.state.concepts_by_board[bid]
+                    del cls.state.concept_by_hash[bid]
+                del cls.state.request_seq[rid]
+                cls.state.request_order.remove(rid)
+                project_ids = cls.state.requests_by_project[item.projectId]
+                project_ids.remove(rid)
+                if not project_ids:
+                    del cls.state.requests_by_project[item.projectId]
+                cls.state.requests_by_status[item.status].remove(rid)
+                logger.info("Deleted request %s with cascade", rid)
 
     @classmethod
     def create_board(cls, rid: str, summary: str) -> Dict[str, Any]:
-        iteration = len(cls.state.board_by_request.get(rid, [])) + 1
-        bid = str(uuid.uuid4())
-        board = {
-            "id": bid,
-            "requestId": rid,
-            "iteration": iteration,
-            "summary": summary,
-            "conceptCount": 0,
-            "status": "Initial" if iteration == 1 else "Revised",
-        }
-        cls.state.boards[bid] = board
-        cls.state.board_by_request.setdefault(rid, []).append(bid)
-        cls.state.concepts_by_board.setdefault(bid, [])
+        with cls._lock:
+            iteration = len(cls.state.board_by_request.get(rid, [])) + 1
+            bid = str(uuid.uuid4())
+            board = _BoardRecord(
+                id=bid,
+                requestId=rid,
+                iteration=iteration,
+                summary=summary,
+                conceptCount=0,
+                status="Initial" if iteration == 1 else "Revised",
+            )
+            cls.state.boards[bid] = board
+            cls.state.board_by_request.setdefault(rid, []).append(bid)
+            cls.state.concepts_by_board[bid] = []
+            cls.state.concept_by_hash[bid] = {}
         logger.info("Created board %s for request %s (iteration %s)", bid, rid, iteration)
-        return board
+        return board.to_dict()
 
     @classmethod
     def list_boards(cls, rid: str) -> List[Dict[str, Any]]:
-        return [cls.state.boards[bid] for bid in cls.state.board_by_request.get(rid, []) if bid in cls.state.boards]
+        return [cls.state.boards[bid].to_dict() for bid in cls.state.board_by_request.get(rid, []) if bid in cls.state.boards]
 
     @classmethod
     def add_concepts(cls, board_id: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        concepts = cls.state.concepts_by_board.setdefault(board_id, [])
-        for item in items:
-            concepts.append(
-                {
-                    "id": str(uuid.uuid4()),
-                    "boardId": board_id,
-                    "caption": item.get("caption", ""),
-                    "tags": item.get("tags", []),
-                    "imageUrls": item.get("imageUrls", []),
-                    "provenance": item.get("provenance"),
-                }
-            )
-        if board_id in cls.state.boards:
-            cls.state.boards[board_id]["conceptCount"] = len(concepts)
-        logger.info("Added %s concept(s) to board %s", len(items), board_id)
-        return concepts
+        with cls._lock:
+            concepts = cls.state.concepts_by_board.setdefault(board_id, [])
+            by_hash = cls.state.concept_by_hash.setdefault(board_id, {})
+            before = len(concepts)
+            # One urandom read for the whole batch instead of one per uuid4()
+            raw = os.urandom(16 * len(items))
+            for n, item in enumerate(items):
+                caption = item.get("caption", "")
+                tags = item.get("tags", [])
+                image_urls = item.get("imageUrls", [])
+                provenance = item.get("provenance")
+                digest = cls._concept_hash(caption, tags, image_urls, provenance)
+                if digest in by_hash:
+                    continue
+                concept = _ConceptRecord(
+                    id=str(uuid.UUID(bytes=raw[16 * n : 16 * n + 16], version=4)),
+                    boardId=board_id,
+                    caption=caption,
+                    tags=tags,
+                    imageUrls=image_urls,
+                    provenance=provenance,
+                )
+                by_hash[digest] = concept
+                concepts.append(concept)
+            if board_id in cls.state.boards:
+                cls.state.boards[board_id].conceptCount = len(concepts)
+            result = [concept.to_dict() for concept in concepts]
+        logger.info("Added %s concept(s) to board %s", len(result) - before, board_id)
+        return result
+
+    @staticmethod
+    def _concept_hash(
+        caption: str, tags: List[str], image_urls: List[str], provenance: Any
+    ) -> bytes:
+        raw = json.dumps([caption, sorted(tags), image_urls, provenance], sort_keys=True, default=str)
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+    @classmethod
+    async def add_concepts_batch(
+        cls, board_id: str, items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # Async entry point for bulk inserts. The dict backend inserts the whole
+        # batch in one step; a persistent backend should use its native batch
+        # write (executemany, MSET) here rather than one round-trip per item.
+        return cls.add_concepts(board_id, items)
 
     @classmethod
     def approve_board(cls, board_id: str) -> Dict[str, Any]:
-        board = cls.state.boards.get(board_id)
-        assert board is not None
-        board["status"] = "Approved"
+        with cls._lock:
+            board = cls.state.boards.get(board_id)
+            if board is None:
+                raise KeyError(board_id)
+            board.status = "Approved"
         rec = {
             "id": str(uuid.uuid4()),
-            "requestId": board["requestId"],
-            "iterationApproved": board["iteration"],
+            "requestId": board.requestId,
+            "iterationApproved": board.iteration,
             "approver": "system",
             "approvedAt": cls._now(),
         }
-        logger.info("Approved board %s for request %s", board_id, board["requestId"])
+        logger.info("Approved board %s for request %s", board_id, board.requestId)
         return rec
 
     @classmethod
     def export_request(cls, rid: str) -> Dict[str, Any]:
-        boards = [cls.state.boards[bid] for bid in cls.state.board_by_request.get(rid, []) if bid in cls.state.boards]
-        concepts: List[Dict[str, Any]] = []
-        for bid in cls.state.board_by_request.get(rid, []):
-            concepts.extend(cls.state.concepts_by_board.get(bid, []))
+        board_ids = cls.state.board_by_request.get(rid, [])
+        boards = [cls.state.boards[bid].to_dict() for bid in board_ids if bid in cls.state.boards]
+        concepts = [
+            c.to_dict()
+            for c in chain.from_iterable(cls.state.concepts_by_board.get(bid, ()) for bid in board_ids)
+        ]
         return {
-            "request": cls.state.requests[rid],
+            "request": cls.state.requests[rid].to_dict(),
             "boards": boards,
             "concepts": concepts,
         }
@@ -2,8 +2,14 @@
 
 import asyncio
 import logging
+import random
+import secrets
+import time
 import uuid
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar
 
 from ..config import Settings
 from ..models import (
@@ -18,13 +24,100 @@ from ..models import (
     VisualAsset,
     VisualType,
 )
-from ..providers import BaseProvider, ImageGenerationParams, ProviderError
-from ..templates import TemplateManager
+from ..providers import BaseProvider, ImageGenerationParams, ImageResult, ProviderError
+from ..providers._image_cache import cache_key
+from ..providers._retry import retry_provider_call
+from ..templates import StyleTemplate, TemplateManager
 from .asset_service import AssetService
 from .provider_factory import ProviderFactory
+from .rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Generation ids only need to be unique, not unguessable, so they come from a
+# PRNG seeded once from the OS instead of an os.urandom read per id
+_id_random = random.Random(secrets.randbits(128))
+
+# Precomputed (width, height) for the aspect ratios requests almost always use
+_COMMON_SIZES: Dict[tuple[str, int], tuple[int, int]] = {
+    ("16:9", 1024): (1024, 576),
+    ("1:1", 1024): (1024, 1024),
+    ("9:16", 1024): (576, 1024),
+    ("3:2", 1024): (1024, 680),
+    ("2:3", 1024): (680, 1024),
+    ("4:3", 1024): (1024, 768),
+    ("21:9", 1024): (1024, 432),
+}
+
+
+@lru_cache(maxsize=64)
+def _parse_aspect_ratio(aspect_ratio: str, base_size: int = 1024) -> tuple[int, int]:
+    """Parse aspect ratio string to width and height.
+
+    Args:
+        aspect_ratio: Aspect ratio string (e.g., "16:9", "1:1")
+        base_size: Base size for calculations
+
+    Returns:
+        Tuple of (width, height)
+    """
+    size = _COMMON_SIZES.get((aspect_ratio, base_size))
+    if size is not None:
+        return size
+
+    try:
+        width_ratio, height_ratio = map(int, aspect_ratio.split(":"))
+
+        # Calculate dimensions maintaining aspect ratio
+        if width_ratio >= height_ratio:
+            width = base_size
+            height = int(base_size * height_ratio / width_ratio)
+        else:
+            height = base_size
+            width = int(base_size * width_ratio / height_ratio)
+
+        # Ensure dimensions are multiples of 8 (common requirement)
+        width = (width // 8) * 8
+        height = (height // 8) * 8
+
+        return width, height
+
+    except (ValueError, ZeroDivisionError):
+        # Default to square if parsing fails
+        return base_size, base_size
+
+
+def _generation_id() -> str:
+    """Return a time-ordered generation id in UUIDv7 layout.
+
+    The leading 48 bits are the Unix time in milliseconds, so ids (and the
+    asset filenames that embed them) sort by creation time.
+
+    Returns:
+        Canonical UUID string
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | _id_random.getrandbits(80)
+    # Set version 7 and the RFC 4122 variant
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return str(uuid.UUID(int=value))
+
+
+@dataclass(frozen=True, slots=True)
+class _StoryboardJob:
+    """Values shared by every scene of one storyboard, resolved once."""
+
+    provider: BaseProvider
+    request: StoryboardGenerationRequest
+    generation_id: str
+    template: StyleTemplate
+    # Validated once; scenes copy it with their own prompt
+    base_params: ImageGenerationParams
+    upload_semaphore: asyncio.Semaphore
+    base_metadata: Dict[str, Any]
+
 
 class VisualService:
     """Main service for visual generation workflows."""
@@ -34,6 +127,7 @@ class VisualService:
         provider_factory: ProviderFactory,
         asset_service: AssetService,
         settings: Settings,
+        template_manager: Optional[TemplateManager] = None,
     ) -> None:
         """Initialize visual service.
 
@@ -41,24 +135,187 @@ class VisualService:
             provider_factory: Provider factory for image generation
             asset_service: Asset service for PayloadCMS integration
             settings: Application settings
+            template_manager: Optional shared template manager
         """
         self.provider_factory = provider_factory
         self.asset_service = asset_service
         self.settings = settings
-        self.template_manager = TemplateManager()
+        self.template_manager = template_manager or TemplateManager()
+        # Per-provider admission shared by every request on this service
+        self._provider_limits: Dict[str, asyncio.Semaphore] = {}
+        self._rate_limiters: Dict[str, Optional[AsyncRateLimiter]] = {}
+        # Seeded generations currently running, keyed by provider and params
+        self._inflight: Dict[str, asyncio.Future[ImageResult]] = {}
+
+    @asynccontextmanager
+    async def _admit(self, provider_name: str) -> AsyncIterator[None]:
+        """Hold one of the provider's generation slots for the block.
+
+        Args:
+            provider_name: Provider whose slot to take
+        """
+        # A semaphore hands a cancelled waiter's wakeup on to the next one,
+        # so cancelled storyboard tasks cannot stall other requests
+        limit = self._provider_limits.get(provider_name)
+        if limit is None:
+            limit = self._provider_limits[provider_name] = asyncio.Semaphore(
+                self.settings.generation_concurrency
+            )
+        async with limit:
+            yield
+
+    async def warmup(self) -> Dict[str, str]:
+        """Prime connections and lookups before the first request arrives.
+
+        Probes every provider and PayloadCMS concurrently so DNS, TCP and TLS
+        setup on the shared clients happen at startup, and renders one prompt
+        to populate the template path.
+
+        Returns:
+            Dictionary mapping provider names to health status
+        """
+        providers_status, cms_ok = await asyncio.gather(
+            self.provider_factory.health_check(),
+            self.asset_service.check_connection(),
+        )
+        if not cms_ok:
+            logger.warning("PayloadCMS not reachable during warmup")
+        self.template_manager.apply_template("cinematic", "warmup")
+        return providers_status
+
+    async def _throttle(self, provider_name: str) -> None:
+        """Wait for the provider's rate limit before issuing a request.
+
+        The limit comes from ``settings.<provider>_requests_per_second``;
+        providers without such a setting are not rate limited.
+
+        Args:
+            provider_name: Provider about to be called
+        """
+        if provider_name not in self._rate_limiters:
+            rps = getattr(self.settings, f"{provider_name}_requests_per_second", None)
+            self._rate_limiters[provider_name] = AsyncRateLimiter(rps) if rps else None
+        limiter = self._rate_limiters[provider_name]
+        if limiter is not None:
+            await limiter.acquire()
+
+    async def _call_provider(
+        self, provider_name: str, call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Issue a rate-limited provider call, retrying transient failures.
+
+        Args:
+            provider_name: Provider being called
+            call: Zero-argument coroutine factory performing the call
+
+        Returns:
+            The provider call's result
+        """
+
+        async def attempt() -> T:
+            await self._throttle(provider_name)
+            return await call()
+
+        return await retry_provider_call(attempt)
+
+    async def _generate_image(
+        self, provider: BaseProvider, params: ImageGenerationParams
+    ) -> ImageResult:
+        """Generate an image, sharing one provider call between duplicates.
+
+        A seeded request identical to one still in flight (typically a client
+        retry) awaits the original call instead of starting a second one. If
+        the original caller is cancelled, a waiting duplicate makes the call
+        itself. The provider result cache covers identical requests made after
+        it finished. Unseeded requests are not reproducible and always run on
+        their own.
+
+        Args:
+            provider: Image generation provider
+            params: Image generation parameters
+
+        Returns:
+            Provider image result
+        """
+        key = cache_key(params)
+        if key is None:
+            return await self._generate_once(provider, params)
+        key = f"{provider.name}:{key}"
+
+        inflight = self._inflight.get(key)
+        while inflight is not None:
+            try:
+                # Shielded so a cancelled duplicate leaves the shared call running
+                return await asyncio.shield(inflight)
+            except ProviderError as e:
+                if e.error_code != "CANCELLED":
+                    raise
+            # The original caller was cancelled, not this one: join whichever
+            # duplicate took over, or make the call here
+            inflight = self._inflight.get(key)
+
+        # Lookup and insert have no await in between, so no lock is needed
+        future: asyncio.Future[ImageResult] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._generate_once(provider, params)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except asyncio.CancelledError:
+            future.set_exception(
+                ProviderError(
+                    "Generation cancelled",
+                    provider=provider.name,
+                    error_code="CANCELLED",
+                )
+            )
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+            # Mark any exception retrieved when no duplicate was waiting on it
+            if future.done() and not future.cancelled():
+                future.exception()
+
+    async def _generate_once(
+        self, provider: BaseProvider, params: ImageGenerationParams
+    ) -> ImageResult:
+        """Generate an image within the provider's concurrency and rate limits.
+
+        Args:
+            provider: Image generation provider
+            params: Image generation parameters
+
+        Returns:
+            Provider image result
+        """
+        async with self._admit(provider.name):
+            return await self._call_provider(
+                provider.name, lambda: provider.generate_image(params)
+            )
 
     async def generate_storyboard(
-        self, request: StoryboardGenerationRequest
+        self,
+        request: StoryboardGenerationRequest,
+        progress_callback: Optional[Callable[[float], None]] = None,
     ) -> StoryboardGenerationResponse:
         """Generate storyboard frames for scenes.
 
+        Frames are collected as they finish, so ``response.progress`` and the
+        optional callback advance per scene. If more than half of the scenes
+        fail, the remaining ones are cancelled and the partial result returned.
+
         Args:
             request: Storyboard generation request
+            progress_callback: Optional callable receiving progress (0.0-1.0)
 
         Returns:
             Storyboard generation response
         """
-        generation_id = str(uuid.uuid4())
+        generation_id = _generation_id()
         logger.info(f"Starting storyboard generation {generation_id} for project {request.project_id}")
 
         try:
@@ -74,31 +331,86 @@ class VisualService:
             # Get provider
             provider = self.provider_factory.get_provider(request.provider_preference)
 
-            # Process scenes in parallel with limited concurrency
-            semaphore = asyncio.Semaphore(3)  # Limit to 3 concurrent generations
-            tasks = [
-                self._generate_scene_frame(
-                    provider,
-                    scene,
-                    request,
-                    generation_id,
-                    scene_idx,
-                    semaphore,
-                )
+            # Process scenes in parallel as a two-stage pipeline: generations
+            # are bounded per provider by _admit and release their slot before
+            # uploading, so uploads (bounded here) overlap later generations
+            # Template, model, size and metadata are the same for every scene
+            template = self.template_manager.get_template(request.style_preset)
+            width, height = _parse_aspect_ratio(request.aspect_ratio, base_size=1024)
+            job = _StoryboardJob(
+                provider=provider,
+                request=request,
+                generation_id=generation_id,
+                template=template,
+                base_params=ImageGenerationParams(
+                    # Request values win over the template's recommendations
+                    **{
+                        **template.recommended_settings,
+                        "prompt": "",
+                        "model": self._select_model(provider, request.quality),
+                        "width": width,
+                        "height": height,
+                        "seed": request.seed,
+                        "negative_prompt": template.negative_prompt,
+                        "quality": request.quality,
+                        "aspect_ratio": request.aspect_ratio,
+                    }
+                ),
+                upload_semaphore=asyncio.Semaphore(self.settings.upload_concurrency),
+                base_metadata={
+                    "type": VisualType.STORYBOARD.value,
+                    "provider": provider.name,
+                    "generation_id": generation_id,
+                    "style_preset": request.style_preset,
+                },
+            )
+            tasks = {
+                asyncio.ensure_future(
+                    self._generate_scene_frame(job, scene, scene_idx)
+                ): scene_idx
                 for scene_idx, scene in enumerate(request.scenes)
-            ]
-
-            # Wait for all generations to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            }
 
-            # Process results
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Scene generation failed: {result}")
-                    continue
-                if result:
-                    response.assets.append(result)
-                    response.completed_scenes += 1
+            # Collect frames as they finish; slots keep the assets in scene order
+            frames: List[Optional[VisualAsset]] = [None] * len(tasks)
+            max_failures = len(tasks) // 2
+            failed = 0
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        result = task.result()
+                        if result is None:
+                            failed += 1
+                        else:
+                            frames[tasks[task]] = result
+                            response.completed_scenes += 1
+                    response.progress = response.completed_scenes / response.total_scenes
+                    if progress_callback is not None:
+                        progress_callback(response.progress)
+                    if pending and failed > max_failures:
+                        logger.warning(
+                            "Storyboard generation %s: %d of %d scenes failed, "
+                            "cancelling the remaining %d",
+                            generation_id,
+                            failed,
+                            len(tasks),
+                            len(pending),
+                        )
+                        response.error_message = (
+                            f"Stopped after {failed} of {len(tasks)} scenes failed"
+                        )
+                        break
+            finally:
+                for task in pending:
+                    task.cancel()
+                # Let the cancelled scenes unwind and release their slots
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            response.assets.extend(frame for frame in frames if frame is not None)
 
             # Update final status
             if response.completed_scenes == response.total_scenes:
@@ -129,113 +441,96 @@ class VisualService:
             )
 
     async def _generate_scene_frame(
-        self,
-        provider: BaseProvider,
-        scene: Scene,
-        request: StoryboardGenerationRequest,
-        generation_id: str,
-        scene_idx: int,
-        semaphore: asyncio.Semaphore,
+        self, job: _StoryboardJob, scene: Scene, scene_idx: int
     ) -> Optional[VisualAsset]:
         """Generate a single scene frame.
 
         Args:
-            provider: Image generation provider
+            job: Values shared by all scenes of the storyboard
             scene: Scene to generate
-            request: Original storyboard request
-            generation_id: Generation ID
             scene_idx: Scene index
-            semaphore: Semaphore for concurrency control
 
         Returns:
             Generated visual asset or None if failed
         """
-        async with semaphore:
-            try:
-                # Apply prompt template
-                template_result = self.template_manager.apply_template(
-                    request.style_preset,
-                    scene.description,
-                    {
-                        "mood": scene.mood or "neutral",
-                        "camera_angle": scene.camera_angle or "medium shot",
-                        "lighting": scene.lighting or "natural lighting",
-                    },
-                )
+        provider = job.provider
+        request = job.request
+        try:
+            # Only the scene-specific part of the prompt is rendered here
+            prompt = job.template.render(
+                scene.description,
+                {
+                    "mood": scene.mood or "neutral",
+                    "camera_angle": scene.camera_angle or "medium shot",
+                    "lighting": scene.lighting or "natural lighting",
+                },
+            )
 
-                # Parse aspect ratio
-                width, height = self._parse_aspect_ratio(
-                    request.aspect_ratio, base_size=1024
-                )
+            # Only the prompt differs per scene, so skip revalidating the rest
+            generation_params = job.base_params.model_copy(update={"prompt": prompt})
 
-                # Prepare generation parameters
-                generation_params = ImageGenerationParams(
-                    prompt=template_result["prompt"],
-                    model=self._select_model(provider, request.quality),
-                    width=width,
-                    height=height,
-                    seed=request.seed,
-                    negative_prompt=template_result["negative_prompt"],
-                    quality=request.quality,
-                    aspect_ratio=request.aspect_ratio,
-                    **template_result["settings"],
-                )
+            # Generate image
+            logger.debug(f"Generating scene {scene_idx} with provider {provider.name}")
+            image_result = await self._generate_image(provider, generation_params)
 
-                # Generate image
-                logger.debug(f"Generating scene {scene_idx} with provider {provider.name}")
-                image_result = await provider.generate_image(generation_params)
+            # JSON-native snapshot, dumped once and stored on the asset as-is so
+            # the response encoder does not walk the params model again
+            params_snapshot = generation_params.model_dump(mode="json", exclude_none=True)
 
-                # Upload to PayloadCMS
-                filename = f"storyboard_{generation_id}_scene_{scene_idx:03d}.png"
-                metadata = {
-                    "type": VisualType.STORYBOARD.value,
-                    "provider": provider.name,
-                    "model": generation_params.model,
-                    "scene_index": scene_idx,
-                    "generation_id": generation_id,
-                    "style_preset": request.style_preset,
-                    "prompt": generation_params.prompt,
-                    **scene.metadata,
-                }
+            # Upload to PayloadCMS
+            filename = f"storyboard_{job.generation_id}_scene_{scene_idx:03d}.png"
+            metadata = {
+                **job.base_metadata,
+                "model": generation_params.model,
+                "scene_index": scene_idx,
+                "prompt": generation_params.prompt,
+                **scene.metadata,
+            }
 
+            # Upload outside the generation slot so the next scene's generation
+            # overlaps with this upload
+            async with job.upload_semaphore:
                 cms_result = await self.asset_service.upload_image(
-                    str(image_result.url),
+                    image_result.url,
                     filename,
                     request.project_id,
                     metadata,
                 )
 
-                # Create visual asset
-                return VisualAsset(
-                    id=cms_result["id"],
-                    url=cms_result["url"],
-                    type=VisualType.STORYBOARD,
-                    width=image_result.width,
-                    height=image_result.height,
-                    file_size=image_result.file_size,
-                    provider=provider.name,
-                    model=generation_params.model,
-                    prompt=generation_params.prompt,
-                    generation_params=generation_params.dict(),
-                    metadata=metadata,
-                )
+            # Create visual asset
+            return VisualAsset(
+                id=cms_result["id"],
+                url=cms_result["url"],
+                type=VisualType.STORYBOARD,
+                width=image_result.width,
+                height=image_result.height,
+                file_size=image_result.file_size,
+                provider=provider.name,
+                model=generation_params.model,
+                prompt=generation_params.prompt,
+                generation_params=params_snapshot,
+                metadata=metadata,
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to generate scene {scene_idx}: {e}")
-                return None
+        except Exception as e:
+            logger.error(f"Failed to generate scene {scene_idx}: {e}")
+            return None
 
     async def generate_concept(
         self, request: ConceptGenerationRequest
     ) -> ConceptGenerationResponse:
         """Generate concept art.
 
+        Providers that support batch generation produce all variations in one
+        call; otherwise each variation is generated separately.
+
         Args:
             request: Concept generation request
 
         Returns:
             Concept generation response
         """
-        generation_id = str(uuid.uuid4())
+        generation_id = _generation_id()
         logger.info(f"Starting concept generation {generation_id}")
 
         try:
@@ -249,18 +544,31 @@ class VisualService:
             # Get provider
             provider = self.provider_factory.get_provider(request.provider_preference)
 
+            # Metadata shared by every variation of this request
+            base_metadata = {
+                "type": VisualType.CONCEPT.value,
+                "provider": provider.name,
+                "generation_id": generation_id,
+                "style_preset": request.style_preset,
+            }
+
             # Generate variations
-            tasks = [
-                self._generate_concept_variation(
-                    provider,
-                    request,
-                    generation_id,
-                    variation_idx,
+            if provider.supports_batch_generation and request.variations > 1:
+                results = await self._generate_concept_batch(
+                    provider, request, generation_id, base_metadata
                 )
-                for variation_idx in range(request.variations)
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            else:
+                tasks = [
+                    self._generate_concept_variation(
+                        provider,
+                        request,
+                        generation_id,
+                        variation_idx,
+                        base_metadata,
+                    )
+                    for variation_idx in range(request.variations)
+                ]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # Process results
             for result in results:
@@ -289,12 +597,101 @@ class VisualService:
                 error_message=str(e),
             )
 
+    def _concept_params(
+        self,
+        provider: BaseProvider,
+        request: ConceptGenerationRequest,
+        seed: int,
+    ) -> ImageGenerationParams:
+        """Build generation parameters for a concept request.
+
+        Args:
+            provider: Image generation provider
+            request: Concept generation request
+            seed: Seed for this generation
+
+        Returns:
+            Image generation parameters
+        """
+        # Apply prompt template
+        template_result = self.template_manager.apply_template(
+            request.style_preset,
+            request.prompt,
+        )
+
+        # Parse aspect ratio
+        width, height = _parse_aspect_ratio(request.aspect_ratio, base_size=1024)
+
+        # Request values win over the template's recommended settings
+        return ImageGenerationParams(
+            **{
+                **template_result["settings"],
+                "prompt": template_result["prompt"],
+                "model": self._select_model(provider, request.quality),
+                "width": width,
+                "height": height,
+                "seed": seed,
+                "negative_prompt": template_result["negative_prompt"],
+                "quality": request.quality,
+                "aspect_ratio": request.aspect_ratio,
+            }
+        )
+
+    async def _generate_concept_batch(
+        self,
+        provider: BaseProvider,
+        request: ConceptGenerationRequest,
+        generation_id: str,
+        base_metadata: Dict[str, Any],
+    ) -> List[Any]:
+        """Generate all concept variations with one batch provider call.
+
+        Only the uploads fan out; the generation is a single request, so it
+        pays one round trip and one queue wait for every variation.
+
+        Args:
+            provider: Image generation provider supporting batch generation
+            request: Concept generation request
+            generation_id: Generation ID
+            base_metadata: Asset metadata shared by all variations of the request
+
+        Returns:
+            Visual assets, None or exceptions, one per returned image
+        """
+        seed = request.seed if request.seed is not None else secrets.randbits(32)
+        generation_params = self._concept_params(provider, request, seed)
+
+        async with self._admit(provider.name):
+            image_results = await self._call_provider(
+                provider.name,
+                lambda: provider.generate_images_batch(
+                    generation_params, request.variations
+                ),
+            )
+
+        return await asyncio.gather(
+            *(
+                self._store_concept_variation(
+                    provider,
+                    request,
+                    generation_id,
+                    variation_idx,
+                    base_metadata,
+                    generation_params,
+                    image_result,
+                )
+                for variation_idx, image_result in enumerate(image_results)
+            ),
+            return_exceptions=True,
+        )
+
     async def _generate_concept_variation(
         self,
         provider: BaseProvider,
         request: ConceptGenerationRequest,
         generation_id: str,
         variation_idx: int,
+        base_metadata: Dict[str, Any],
     ) -> Optional[VisualAsset]:
         """Generate a single concept variation.
 
@@ -303,51 +700,77 @@ class VisualService:
             request: Concept generation request
             generation_id: Generation ID
             variation_idx: Variation index
+            base_metadata: Asset metadata shared by all variations of the request
 
         Returns:
             Generated visual asset or None if failed
         """
         try:
-            # Apply prompt template
-            template_result = self.template_manager.apply_template(
-                request.style_preset,
-                request.prompt,
+            # Give every variation its own seed so they actually differ; seeded
+            # params also hit the provider result cache when a request is retried
+            seed = (
+                request.seed + variation_idx
+                if request.seed is not None
+                else secrets.randbits(32)
             )
+            generation_params = self._concept_params(provider, request, seed)
 
-            # Parse aspect ratio
-            width, height = self._parse_aspect_ratio(
-                request.aspect_ratio, base_size=1024
-            )
+            # Generate image
+            image_result = await self._generate_image(provider, generation_params)
 
-            # Prepare generation parameters
-            generation_params = ImageGenerationParams(
-                prompt=template_result["prompt"],
-                model=self._select_model(provider, request.quality),
-                width=width,
-                height=height,
-                negative_prompt=template_result["negative_prompt"],
-                quality=request.quality,
-                aspect_ratio=request.aspect_ratio,
-                **template_result["settings"],
-            )
+        except Exception as e:
+            logger.error(f"Failed to generate concept variation {variation_idx}: {e}")
+            return None
 
-            # Generate image
-            image_result = await provider.generate_image(generation_params)
+        return await self._store_concept_variation(
+            provider,
+            request,
+            generation_id,
+            variation_idx,
+            base_metadata,
+            generation_params,
+            image_result,
+        )
+
+    async def _store_concept_variation(
+        self,
+        provider: BaseProvider,
+        request: ConceptGenerationRequest,
+        generation_id: str,
+        variation_idx: int,
+        base_metadata: Dict[str, Any],
+        generation_params: ImageGenerationParams,
+        image_result: ImageResult,
+    ) -> Optional[VisualAsset]:
+        """Upload a generated concept variation and build its asset.
+
+        Args:
+            provider: Image generation provider
+            request: Concept generation request
+            generation_id: Generation ID
+            variation_idx: Variation index
+            base_metadata: Asset metadata shared by all variations of the request
+            generation_params: Parameters the image was generated with
+            image_result: Provider image result
+
+        Returns:
+            Uploaded visual asset or None if failed
+        """
+        try:
+            # JSON-native snapshot, dumped once and stored on the asset as-is
+            params_snapshot = generation_params.model_dump(mode="json", exclude_none=True)
 
             # Upload to PayloadCMS
             filename = f"concept_{generation_id}_var_{variation_idx:02d}.png"
             metadata = {
-                "type": VisualType.CONCEPT.value,
-                "provider": provider.name,
+                **base_metadata,
                 "model": generation_params.model,
                 "variation_index": variation_idx,
-                "generation_id": generation_id,
-                "style_preset": request.style_preset,
                 "prompt": generation_params.prompt,
             }
 
             cms_result = await self.asset_service.upload_image(
-                str(image_result.url),
+                image_result.url,
                 filename,
                 request.project_id,
                 metadata,
@@ -363,12 +786,12 @@ class VisualService:
                 provider=provider.name,
                 model=generation_params.model,
                 prompt=generation_params.prompt,
-                generation_params=generation_params.dict(),
+                generation_params=params_snapshot,
                 metadata=metadata,
             )
 
         except Exception as e:
-            logger.error(f"Failed to generate concept variation {variation_idx}: {e}")
+            logger.error(f"Failed to upload concept variation {variation_idx}: {e}")
             return None
 
     async def upscale_image(self, request: UpscaleRequest) -> UpscaleResponse:
@@ -380,7 +803,7 @@ class VisualService:
         Returns:
             Upscale response
         """
-        generation_id = str(uuid.uuid4())
+        generation_id = _generation_id()
         logger.info(f"Starting upscale {generation_id} for media {request.media_id}")
 
         try:
@@ -399,9 +822,11 @@ class VisualService:
             provider = self.provider_factory.get_provider(request.provider_preference)
 
             # Upscale image
-            image_result = await provider.upscale_image(
-                original_media["url"], request.factor
-            )
+            async with self._admit(provider.name):
+                image_result = await self._call_provider(
+                    provider.name,
+                    lambda: provider.upscale_image(original_media["url"], request.factor),
+                )
 
             # Upload upscaled image
             filename = f"upscaled_{generation_id}_{request.factor}x.png"
@@ -414,7 +839,7 @@ class VisualService:
             }
 
             cms_result = await self.asset_service.upload_image(
-                str(image_result.url),
+                image_result.url,
                 filename,
                 request.project_id,
                 metadata,
@@ -464,37 +889,6 @@ class VisualService:
                 original_asset_id=request.media_id,
             )
 
-    def _parse_aspect_ratio(self, aspect_ratio: str, base_size: int = 1024) -> tuple[int, int]:
-        """Parse aspect ratio string to width and height.
-
-        Args:
-            aspect_ratio: Aspect ratio string (e.g., "16:9", "1:1")
-            base_size: Base size for calculations
-
-        Returns:
-            Tuple of (width, height)
-        """
-        try:
-            width_ratio, height_ratio = map(int, aspect_ratio.split(":"))
-            
-            # Calculate dimensions maintaining aspect ratio
-            if width_ratio >= height_ratio:
-                width = base_size
-                height = int(base_size * height_ratio / width_ratio)
-            else:
-                height = base_size
-                width = int(base_size * width_ratio / height_ratio)
-            
-            # Ensure dimensions are multiples of 8 (common requirement)
-            width = (width // 8) * 8
-            height = (height // 8) * 8
-            
-            return width, height
-            
-        except (ValueError, ZeroDivisionError):
-            # Default to square if parsing fails
-            return base_size, base_size
-
     def _select_model(self, provider: BaseProvider, quality: str) -> str:
         """Select appropriate model based on provider and quality.
 
@@ -1,10 +1,10 @@
 """Template manager for prompt templates."""
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
 from enum import Enum
 
-from pydantic import BaseModel
-
 
 class StylePreset(str, Enum):
     """Available style presets."""
@@ -17,14 +17,162 @@ class StylePreset(str, Enum):
     STORYBOARD = "storyboard"
 
 
-class StyleTemplate(BaseModel):
+@dataclass(slots=True, frozen=True)
+class StyleTemplate:
     """Template for a specific visual style."""
-    
+
     name: str
     base_prompt: str
-    style_modifiers: list[str]
-    negative_prompt: Optional[str] = None
+    style_modifiers: Sequence[str]
     recommended_settings: Dict[str, Any]
+    negative_prompt: Optional[str] = None
+    # Style modifiers joined once into the prompt suffix
+    joined_modifiers: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        modifiers = tuple(self.style_modifiers)
+        object.__setattr__(self, "style_modifiers", modifiers)
+        object.__setattr__(self, "joined_modifiers", ", ".join(modifiers))
+
+    def render(self, scene_description: str, context: Dict[str, str]) -> str:
+        """Render the final prompt for one scene.
+
+        Args:
+            scene_description: Scene description to incorporate
+            context: Additional template variables
+
+        Returns:
+            Base prompt followed by the joined style modifiers
+        """
+        prompt = self.base_prompt.format(
+            **{"scene_description": scene_description, **context}
+        )
+        if self.joined_modifiers:
+            return f"{prompt}, {self.joined_modifiers}"
+        return prompt
+
+
+def _build_templates() -> Dict[str, StyleTemplate]:
+    """Build the built-in style templates."""
+    return {
+        StylePreset.CINEMATIC: StyleTemplate(
+            name="Cinematic",
+            base_prompt="A cinematic {scene_description}, professional film quality, dramatic lighting",
+            style_modifiers=[
+                "35mm film",
+                "cinematic composition", 
+                "professional cinematography",
+                "dramatic lighting",
+                "film grain",
+                "depth of field",
+            ],
+            negative_prompt="amateur, low quality, blurry, overexposed, cartoon, anime",
+            recommended_settings={
+                "steps": 30,
+                "guidance_scale": 7.5,
+                "aspect_ratio": "16:9",
+            },
+        ),
+        
+        StylePreset.CONCEPT_ART: StyleTemplate(
+            name="Concept Art",
+            base_prompt="Concept art of {scene_description}, digital painting, detailed illustration",
+            style_modifiers=[
+                "concept art",
+                "digital painting",
+                "detailed illustration",
+                "matte painting",
+                "environment design",
+                "professional concept art",
+            ],
+            negative_prompt="photograph, realistic, amateur, sketch, low quality",
+            recommended_settings={
+                "steps": 25,
+                "guidance_scale": 8.0,
+                "aspect_ratio": "16:9",
+            },
+        ),
+        
+        StylePreset.PHOTOREALISTIC: StyleTemplate(
+            name="Photorealistic", 
+            base_prompt="Photorealistic {scene_description}, high quality photography, realistic lighting",
+            style_modifiers=[
+                "photorealistic",
+                "high quality photography",
+                "realistic lighting",
+                "professional photography",
+                "detailed",
+                "sharp focus",
+            ],
+            negative_prompt="cartoon, anime, painting, illustration, low quality, blurry",
+            recommended_settings={
+                "steps": 35,
+                "guidance_scale": 7.0,
+                "aspect_ratio": "3:2",
+            },
+        ),
+        
+        StylePreset.ANIME: StyleTemplate(
+            name="Anime",
+            base_prompt="Anime style {scene_description}, high quality anime art, detailed animation style",
+            style_modifiers=[
+                "anime style",
+                "high quality anime",
+                "detailed animation",
+                "manga style",
+                "cel shading",
+                "vibrant colors",
+            ],
+            negative_prompt="realistic, photograph, western cartoon, low quality, blurry",
+            recommended_settings={
+                "steps": 25,
+                "guidance_scale": 8.5,
+                "aspect_ratio": "16:9",
+            },
+        ),
+        
+        StylePreset.ARTISTIC: StyleTemplate(
+            name="Artistic",
+            base_prompt="Artistic interpretation of {scene_description}, creative style, expressive artwork",
+            style_modifiers=[
+                "artistic",
+                "creative style",
+                "expressive artwork",
+                "unique style",
+                "artistic vision",
+                "creative composition",
+            ],
+            negative_prompt="boring, generic, low quality, amateur",
+            recommended_settings={
+                "steps": 28,
+                "guidance_scale": 7.5,
+                "aspect_ratio": "1:1",
+            },
+        ),
+        
+        StylePreset.STORYBOARD: StyleTemplate(
+            name="Storyboard",
+            base_prompt="Storyboard frame of {scene_description}, professional storyboard art, clear composition",
+            style_modifiers=[
+                "storyboard",
+                "professional storyboard art",
+                "clear composition",
+                "film pre-production",
+                "sketch style",
+                "black and white",
+            ],
+            negative_prompt="colorful, detailed painting, photorealistic, low quality",
+            recommended_settings={
+                "steps": 20,
+                "guidance_scale": 6.5,
+                "aspect_ratio": "16:9",
+            },
+        ),
+    }
+
+
+# Built-in templates are immutable and shared by every TemplateManager
+_TEMPLATES: Dict[str, StyleTemplate] = _build_templates()
 
 
 class TemplateManager:
@@ -32,125 +180,11 @@ class TemplateManager:
     
     def __init__(self) -> None:
         """Initialize template manager."""
-        self._templates = self._initialize_templates()
-    
-    def _initialize_templates(self) -> Dict[str, StyleTemplate]:
-        """Initialize built-in style templates."""
-        return {
-            StylePreset.CINEMATIC: StyleTemplate(
-                name="Cinematic",
-                base_prompt="A cinematic {scene_description}, professional film quality, dramatic lighting",
-                style_modifiers=[
-                    "35mm film",
-                    "cinematic composition", 
-                    "professional cinematography",
-                    "dramatic lighting",
-                    "film grain",
-                    "depth of field",
-                ],
-                negative_prompt="amateur, low quality, blurry, overexposed, cartoon, anime",
-                recommended_settings={
-                    "steps": 30,
-                    "guidance_scale": 7.5,
-                    "aspect_ratio": "16:9",
-                },
-            ),
-            
-            StylePreset.CONCEPT_ART: StyleTemplate(
-                name="Concept Art",
-                base_prompt="Concept art of {scene_description}, digital painting, detailed illustration",
-                style_modifiers=[
-                    "concept art",
-                    "digital painting",
-                    "detailed illustration",
-                    "matte painting",
-                    "environment design",
-                    "professional concept art",
-                ],
-                negative_prompt="photograph, realistic, amateur, sketch, low quality",
-                recommended_settings={
-                    "steps": 25,
-                    "guidance_scale": 8.0,
-                    "aspect_ratio": "16:9",
-                },
-            ),
-            
-            StylePreset.PHOTOREALISTIC: StyleTemplate(
-                name="Photorealistic", 
-                base_prompt="Photorealistic {scene_description}, high quality photography, realistic lighting",
-                style_modifiers=[
-                    "photorealistic",
-                    "high quality photography",
-                    "realistic lighting",
-                    "professional photography",
-                    "detailed",
-                    "sharp focus",
-                ],
-                negative_prompt="cartoon, anime, painting, illustration, low quality, blurry",
-                recommended_settings={
-                    "steps": 35,
-                    "guidance_scale": 7.0,
-                    "aspect_ratio": "3:2",
-                },
-            ),
-            
-            StylePreset.ANIME: StyleTemplate(
-                name="Anime",
-                base_prompt="Anime style {scene_description}, high quality anime art, detailed animation style",
-                style_modifiers=[
-                    "anime style",
-                    "high quality anime",
-                    "detailed animation",
-                    "manga style",
-                    "cel shading",
-                    "vibrant colors",
-                ],
-                negative_prompt="realistic, photograph, western cartoon, low quality, blurry",
-                recommended_settings={
-                    "steps": 25,
-                    "guidance_scale": 8.5,
-                    "aspect_ratio": "16:9",
-                },
-            ),
-            
-            StylePreset.ARTISTIC: StyleTemplate(
-                name="Artistic",
-                base_prompt="Artistic interpretation of {scene_description}, creative style, expressive artwork",
-                style_modifiers=[
-                    "artistic",
-                    "creative style",
-                    "expressive artwork",
-                    "unique style",
-                    "artistic vision",
-                    "creative composition",
-                ],
-                negative_prompt="boring, generic, low quality, amateur",
-                recommended_settings={
-                    "steps": 28,
-                    "guidance_scale": 7.5,
-                    "aspect_ratio": "1:1",
-                },
-            ),
-            
-            StylePreset.STORYBOARD: StyleTemplate(
-                name="Storyboard",
-                base_prompt="Storyboard frame of {scene_description}, professional storyboard art, clear composition",
-                style_modifiers=[
-                    "storyboard",
-                    "professional storyboard art",
-                    "clear composition",
-                    "film pre-production",
-                    "sketch style",
-                    "black and white",
-                ],
-                negative_prompt="colorful, detailed painting, photorealistic, low quality",
-                recommended_settings={
-                    "steps": 20,
-                    "guidance_scale": 6.5,
-                    "aspect_ratio": "16:9",
-                },
-            ),
-        }
+        self._templates = _TEMPLATES
+        # Custom templates override built-ins of the same name per instance
+        self._custom: Dict[str, StyleTemplate] = {}
+        # Per-instance memo of rendered prompts; cleared when templates change
+        self._render = lru_cache(maxsize=512)(self._render_template)
     
     def get_template(self, style_preset: str) -> StyleTemplate:
         """Get template for a style preset.
@@ -164,10 +198,11 @@ class TemplateManager:
         Raises:
             ValueError: If style preset not found
         """
-        if style_preset not in self._templates:
+        template = self._custom.get(style_preset) or self._templates.get(style_preset)
+        if template is None:
             raise ValueError(f"Unknown style preset: {style_preset}")
-        
-        return self._templates[style_preset]
+
+        return template
     
     def apply_template(
         self,
@@ -183,38 +218,39 @@ class TemplateManager:
             additional_context: Additional context variables
             
         Returns:
-            Dictionary with prompt and settings
+            Dictionary with prompt and settings; shared between identical
+            calls and must not be mutated
+        """
+        context = tuple(sorted(additional_context.items())) if additional_context else ()
+        return self._render(style_preset, scene_description, context)
+
+    def _render_template(
+        self,
+        style_preset: str,
+        scene_description: str,
+        context: Tuple[Tuple[str, str], ...],
+    ) -> Dict[str, Any]:
+        """Render a template for hashable arguments; memoized by ``_render``.
+
+        The returned dict is shared between calls with the same arguments, so
+        callers must treat it as read-only.
         """
         template = self.get_template(style_preset)
-        
-        # Build context for template substitution
-        context = {
-            "scene_description": scene_description,
-            **(additional_context or {}),
-        }
-        
-        # Apply base prompt template
-        final_prompt = template.base_prompt.format(**context)
-        
-        # Add style modifiers
-        if template.style_modifiers:
-            style_text = ", ".join(template.style_modifiers)
-            final_prompt = f"{final_prompt}, {style_text}"
-        
+
         return {
-            "prompt": final_prompt,
+            "prompt": template.render(scene_description, dict(context)),
             "negative_prompt": template.negative_prompt,
             "settings": template.recommended_settings,
             "style_name": template.name,
         }
-    
+
     def get_available_styles(self) -> list[str]:
         """Get list of available style presets.
         
         Returns:
             List of style preset names
         """
-        return list(self._templates.keys())
+        return [*self._templates, *(n for n in self._custom if n not in self._templates)]
     
     def add_custom_template(
         self,
@@ -227,4 +263,5 @@ class TemplateManager:
             name: Template name
             template: Style template
         """
-        self._templates[name] = template
\ No newline at end of file
+        self._custom[name] = template
+        self._render.cache_clear()
\ No newline at end of file
@@ -1,7 +1,8 @@
 """MCP tools for the Visual Design Service."""
 
-from .visual_tools import VisualTools
+from .visual_tools import VisualTools, get_visual_tools
 
 __all__ = [
     "VisualTools",
+    "get_visual_tools",
 ]
\ No newline at end of file
@@ -1,33 +1,56 @@
 """MCP tools for visual generation workflows."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import (
     ConceptGenerationRequest,
-    ConceptGenerationResponse,
     Scene,
     StoryboardGenerationRequest,
-    StoryboardGenerationResponse,
     UpscaleRequest,
-    UpscaleResponse,
 )
-from ..services import AssetService, ProviderFactory, VisualService
-from ..config import settings
+from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Asset fields returned to MCP clients
+_ASSET_FIELDS = frozenset(
+    {"id", "url", "type", "width", "height", "provider", "model", "prompt"}
+)
+_UPSCALED_ASSET_FIELDS = _ASSET_FIELDS - {"prompt"}
+
+# Fixed parts of tool responses; callers overlay the per-call fields
+_SERVICE_INFO = MappingProxyType(
+    {"service": "mcp-visual-design-service", "version": "0.1.0"}
+)
+_GENERATION_ERROR_BASE = MappingProxyType({"success": False, "generation_id": None})
+
 
 class VisualTools:
     """MCP tools for visual generation."""
 
     def __init__(self) -> None:
         """Initialize visual tools."""
+        # Service modules pull in the provider and HTTP stacks, so they are
+        # imported when the tools are first built rather than with this module
+        from ..services.asset_service import AssetService
+        from ..services.provider_factory import ProviderFactory
+        from ..services.visual_service import VisualService
+
+        settings = get_settings()
+        self.settings = settings
         self.provider_factory = ProviderFactory(settings)
         self.asset_service = AssetService(settings)
         self.visual_service = VisualService(
             self.provider_factory, self.asset_service, settings
         )
+        # (expires_at, result) of the last successful health check
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_lock = asyncio.Lock()
 
     async def generate_storyboard(
         self,
@@ -57,12 +80,12 @@ class VisualTools:
             Dictionary with generation results and asset references
         """
         try:
-            logger.info(f"MCP: Generating storyboard for project {project_id}")
+            logger.info("MCP: Generating storyboard for project %s", project_id)
             
-            # Convert scene dictionaries to Scene objects
-            scene_objects = []
-            for scene_dict in scenes:
-                scene = Scene(
+            # Convert scene dictionaries to Scene objects; unknown keys are
+            # ignored and a missing description defaults to ""
+            scene_objects = [
+                Scene(
                     description=scene_dict.get("description", ""),
                     duration=scene_dict.get("duration"),
                     mood=scene_dict.get("mood"),
@@ -70,7 +93,8 @@ class VisualTools:
                     lighting=scene_dict.get("lighting"),
                     metadata=scene_dict.get("metadata", {}),
                 )
-                scene_objects.append(scene)
+                for scene_dict in scenes
+            ]
 
             # Create storyboard generation request
             request = StoryboardGenerationRequest(
@@ -96,27 +120,17 @@ class VisualTools:
                 "total_scenes": response.total_scenes,
                 "completed_scenes": response.completed_scenes,
                 "assets": [
-                    {
-                        "id": asset.id,
-                        "url": str(asset.url),
-                        "type": asset.type,
-                        "width": asset.width,
-                        "height": asset.height,
-                        "provider": asset.provider,
-                        "model": asset.model,
-                        "prompt": asset.prompt,
-                    }
+                    asset.model_dump(mode="json", include=_ASSET_FIELDS)
                     for asset in response.assets
                 ],
                 "error_message": response.error_message,
             }
 
         except Exception as e:
-            logger.error(f"MCP storyboard generation failed: {e}")
+            logger.exception("MCP storyboard generation failed")
             return {
-                "success": False,
+                **_GENERATION_ERROR_BASE,
                 "error": str(e),
-                "generation_id": None,
                 "project_id": project_id,
                 "assets": [],
             }
@@ -151,19 +165,15 @@ class VisualTools:
             Dictionary with generation results and asset references
         """
         try:
-            logger.info(f"MCP: Generating concept art: {prompt[:50]}...")
+            # %.50s truncates only when the record is actually emitted
+            logger.info("MCP: Generating concept art: %.50s...", prompt)
             
-            # Convert reference images to HttpUrl objects if provided
-            reference_urls = []
-            if reference_images:
-                from pydantic import HttpUrl
-                reference_urls = [HttpUrl(url) for url in reference_images]
-
-            # Create concept generation request
+            # Create concept generation request; reference URL strings are
+            # parsed by the model's List[HttpUrl] field
             request = ConceptGenerationRequest(
                 prompt=prompt,
                 project_id=project_id,
-                reference_images=reference_urls,
+                reference_images=reference_images or [],
                 style_preset=style_preset,
                 variations=variations,
                 aspect_ratio=aspect_ratio,
@@ -182,27 +192,17 @@ class VisualTools:
                 "status": response.status,
                 "progress": response.progress,
                 "assets": [
-                    {
-                        "id": asset.id,
-                        "url": str(asset.url),
-                        "type": asset.type,
-                        "width": asset.width,
-                        "height": asset.height,
-                        "provider": asset.provider,
-                        "model": asset.model,
-                        "prompt": asset.prompt,
-                    }
+                    asset.model_dump(mode="json", include=_ASSET_FIELDS)
                     for asset in response.assets
                 ],
                 "error_message": response.error_message,
             }
 
         except Exception as e:
-            logger.error(f"MCP concept generation failed: {e}")
+            logger.exception("MCP concept generation failed")
             return {
-                "success": False,
+                **_GENERATION_ERROR_BASE,
                 "error": str(e),
-                "generation_id": None,
                 "project_id": project_id,
                 "assets": [],
             }
@@ -230,7 +230,7 @@ class VisualTools:
             Dictionary with upscaling results and asset reference
         """
         try:
-            logger.info(f"MCP: Upscaling image {media_id} by {factor}x")
+            logger.info("MCP: Upscaling image %s by %sx", media_id, factor)
             
             # Create upscale request
             request = UpscaleRequest(
@@ -256,26 +256,19 @@ class VisualTools:
             }
 
             if response.upscaled_asset:
-                result["upscaled_asset"] = {
-                    "id": response.upscaled_asset.id,
-                    "url": str(response.upscaled_asset.url),
-                    "type": response.upscaled_asset.type,
-                    "width": response.upscaled_asset.width,
-                    "height": response.upscaled_asset.height,
-                    "provider": response.upscaled_asset.provider,
-                    "model": response.upscaled_asset.model,
-                }
+                result["upscaled_asset"] = response.upscaled_asset.model_dump(
+                    mode="json", include=_UPSCALED_ASSET_FIELDS
+                )
             else:
                 result["upscaled_asset"] = None
 
             return result
 
         except Exception as e:
-            logger.error(f"MCP image upscaling failed: {e}")
+            logger.exception("MCP image upscaling failed")
             return {
-                "success": False,
+                **_GENERATION_ERROR_BASE,
                 "error": str(e),
-                "generation_id": None,
                 "project_id": project_id,
                 "original_asset_id": media_id,
                 "upscaled_asset": None,
@@ -287,48 +280,70 @@ class VisualTools:
         This MCP tool checks the health of image generation providers and
         PayloadCMS connectivity.
 
+        Successful results are reused for ``settings.health_cache_ttl``
+        seconds, and concurrent callers on a miss share one check, so frequent
+        polling does not fan out to the providers and PayloadCMS.
+
         Returns:
             Dictionary with health status information
         """
         try:
-            # Check provider health
-            provider_health = await self.provider_factory.health_check()
-            
-            # Check PayloadCMS connectivity
-            cms_healthy = await self.asset_service.check_connection()
-            
-            # Get available capabilities
-            available_providers = self.provider_factory.get_available_providers()
-            supported_models = self.provider_factory.get_supported_models()
-            supported_styles = self.provider_factory.get_supported_styles()
-            
-            return {
-                "success": True,
-                "service": "mcp-visual-design-service",
-                "version": "0.1.0",
-                "providers": {
-                    "available": available_providers,
-                    "health": provider_health,
-                },
-                "payloadcms": {
-                    "connected": cms_healthy,
-                },
-                "capabilities": {
-                    "supported_models": supported_models,
-                    "supported_styles": supported_styles,
-                    "operations": ["storyboard", "concept", "upscale"],
-                },
-            }
-            
+            cached = self._health_cache
+            if cached is not None and time.monotonic() < cached[0]:
+                return dict(cached[1])
+
+            async with self._health_lock:
+                # Another caller may have refreshed the cache while we waited
+                cached = self._health_cache
+                if cached is not None and time.monotonic() < cached[0]:
+                    return dict(cached[1])
+
+                result = await self._collect_health()
+                self._health_cache = (
+                    time.monotonic() + self.settings.health_cache_ttl,
+                    result,
+                )
+                return dict(result)
+
         except Exception as e:
-            logger.error(f"MCP health check failed: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "service": "mcp-visual-design-service",
-                "version": "0.1.0",
-            }
+            logger.exception("MCP health check failed")
+            return {"success": False, "error": str(e), **_SERVICE_INFO}
 
+    async def _collect_health(self) -> Dict[str, Any]:
+        """Check providers and PayloadCMS and report the service capabilities.
+
+        Returns:
+            Dictionary with health status information
+        """
+        provider_health, cms_healthy = await asyncio.gather(
+            self.provider_factory.health_check(),
+            self.asset_service.check_connection(),
+        )
 
-# Global instance for MCP tool registration
-visual_tools = VisualTools()
\ No newline at end of file
+        return {
+            "success": True,
+            **_SERVICE_INFO,
+            "providers": {
+                "available": self.provider_factory.get_available_providers(),
+                "health": provider_health,
+            },
+            "payloadcms": {
+                "connected": cms_healthy,
+            },
+            "capabilities": {
+                "supported_models": self.provider_factory.get_supported_models(),
+                "supported_styles": self.provider_factory.get_supported_styles(),
+                "operations": ["storyboard", "concept", "upscale"],
+            },
+        }
+
+
+@lru_cache(maxsize=1)
+def get_visual_tools() -> VisualTools:
+    """Return the process-wide tools instance for MCP registration.
+
+    Built on first use rather than at import, so importing this module does
+    not construct the provider factory and service clients. Tests needing a
+    fresh instance can call ``get_visual_tools.cache_clear()``.
+    """
+    return VisualTools()
@@ -4,8 +4,43 @@ import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from fastapi.testclient import TestClient
+
+from src.main import app
 from src.providers.base import ImageResult, ProviderHealth, ProviderStatus
 from src.config import Settings
+from src.services.spec_store import SpecStore
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client shared by the whole session.
+
+    Used without its context manager, so the lifespan (and provider/CMS
+    warmup) does not run; app.state services are created lazily on demand.
+    """
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def _reset_spec_store():
+    """Give every test an empty spec store."""
+    SpecStore._reset_state()
+    yield
+
+
+@pytest.fixture
+def seed_request():
+    """Request created directly in the store, for tests of downstream endpoints."""
+    return SpecStore.create_request(
+        {"projectId": "proj_1", "title": "Brief", "description": "Desc"}
+    )
+
+
+@pytest.fixture
+def seed_board(seed_request):
+    """Board for ``seed_request``, created directly in the store."""
+    return SpecStore.create_board(seed_request["id"], "Initial")
 
 
 @pytest.fixture
@@ -54,6 +89,7 @@ def mock_fal_provider(mock_image_result, mock_provider_health):
     """Mock FAL provider."""
     provider = MagicMock()
     provider.name = "fal"
+    provider.supports_batch_generation = False
     provider.generate_image = AsyncMock(return_value=mock_image_result)
     provider.upscale_image = AsyncMock(return_value=mock_image_result)
     provider.check_health = AsyncMock(return_value=mock_provider_health)
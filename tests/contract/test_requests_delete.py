@@ -1,19 +1,3 @@
-from fastapi.testclient import TestClient
-from src.main import app
-
-client = TestClient(app)
-
-
-def test_delete_request_by_id():
-    created = client.post(
-        "/requests",
-        json={
-            "projectId": "proj_1",
-            "title": "Brief",
-            "description": "Desc",
-        },
-    )
-    rid = created.json()["id"]
-
-    resp = client.delete(f"/requests/{rid}")
+def test_delete_request_by_id(client, seed_request):
+    resp = client.delete(f"/requests/{seed_request['id']}")
     assert resp.status_code == 204
@@ -1,11 +1,4 @@
-import pytest
-from fastapi.testclient import TestClient
-from src.main import app
-
-client = TestClient(app)
-
-
-def test_create_request():
+def test_create_request(client):
     payload = {
         "projectId": "proj_1",
         "title": "Brief",
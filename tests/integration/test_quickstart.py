@@ -1,40 +1,48 @@
-from fastapi.testclient import TestClient
+import asyncio
+
+import httpx
+import pytest
+
 from src.main import app
 
-client = TestClient(app)
-
-
-def test_quickstart_happy_path():
-    # Health
-    r = client.get("/health")
-    assert r.status_code == 200
-
-    # Create request
-    req = client.post(
-        "/requests",
-        json={
-            "projectId": "proj_123",
-            "title": "Visual direction",
-            "description": "Neo-noir mood board",
-            "tags": ["noir", "city"],
-            "references": [{"url": "https://example.com/ref.jpg"}],
-        },
-    ).json()
-
-    # Create board
-    board = client.post(f"/requests/{req['id']}/boards", json={"summary": "Initial"}).json()
-
-    # Add concepts
-    concepts = client.post(
-        f"/boards/{board['id']}/concepts",
-        json={"items": [{"caption": "Concept A", "imageUrls": ["https://example.com/a.jpg"]}]},
-    ).json()
-    assert len(concepts) >= 1
-
-    # Approve board
-    appr = client.post(f"/boards/{board['id']}/approve").json()
-    assert appr["requestId"] == req["id"]
-
-    # Export
-    exp = client.get(f"/requests/{req['id']}/export").json()
-    assert "request" in exp and "boards" in exp and "concepts" in exp
+
+@pytest.mark.asyncio
+async def test_quickstart_happy_path():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        # Health and request creation are independent
+        r, req = await asyncio.gather(
+            ac.get("/health"),
+            ac.post(
+                "/requests",
+                json={
+                    "projectId": "proj_123",
+                    "title": "Visual direction",
+                    "description": "Neo-noir mood board",
+                    "tags": ["noir", "city"],
+                    "references": [{"url": "https://example.com/ref.jpg"}],
+                },
+            ),
+        )
+        assert r.status_code == 200
+        req = req.json()
+
+        # Create board
+        board = (await ac.post(f"/requests/{req['id']}/boards", json={"summary": "Initial"})).json()
+
+        # Add concepts
+        concepts = (
+            await ac.post(
+                f"/boards/{board['id']}/concepts",
+                json={"items": [{"caption": "Concept A", "imageUrls": ["https://example.com/a.jpg"]}]},
+            )
+        ).json()
+        assert len(concepts) >= 1
+
+        # Approve board
+        appr = (await ac.post(f"/boards/{board['id']}/approve")).json()
+        assert appr["requestId"] == req["id"]
+
+        # Export
+        exp = (await ac.get(f"/requests/{req['id']}/export")).json()
+        assert "request" in exp and "boards" in exp and "concepts" in exp
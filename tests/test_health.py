@@ -1,16 +1,5 @@
 """Basic health check tests."""
 
-import pytest
-from fastapi.testclient import TestClient
-
-from src.main import app
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
 
 def test_health_endpoint(client):
     """Test health endpoint."""
@@ -21,6 +10,7 @@ def test_health_endpoint(client):
     assert data["service"] == "mcp-visual-design-service"
     assert data["version"] == "0.1.0"
     assert "providers" in data
+    assert response.headers["cache-control"].startswith("public, max-age=")
 
 
 def test_root_endpoint(client):
@@ -43,4 +33,12 @@ def test_styles_endpoint(client):
     assert "styles" in data
     assert "details" in data
     assert "cinematic" in data["styles"]
-    assert "concept-art" in data["styles"]
\ No newline at end of file
+    assert "concept-art" in data["styles"]
+
+def test_cors_headers_only_for_origin_requests(client):
+    """Test CORS headers are only added when an Origin header is sent."""
+    response = client.get("/health")
+    assert "access-control-allow-origin" not in response.headers
+
+    response = client.get("/health", headers={"Origin": "http://example.com"})
+    assert response.headers["access-control-allow-origin"] == "http://example.com"
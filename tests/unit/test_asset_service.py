@@ -0,0 +1,178 @@
+import asyncio
+import io
+
+import pytest
+from PIL import Image
+from pytest_httpx import IteratorStream
+
+from src.services import asset_service
+from src.services.asset_service import AssetService
+
+
+@pytest.mark.asyncio
+async def test_calls_reuse_one_client(httpx_mock, mock_settings, mock_cms_response):
+    httpx_mock.add_response(
+        url="http://test-cms.local/api/media/test-media-id-123",
+        json=mock_cms_response,
+        is_reusable=True,
+    )
+    service = AssetService(mock_settings)
+
+    first = await service.get_media_by_id("test-media-id-123")
+    client = service._get_client()
+    await service.get_media_by_id("test-media-id-123")
+
+    assert first["id"] == "test-media-id-123"
+    assert service._get_client() is client
+    request = httpx_mock.get_requests()[0]
+    assert request.headers["Authorization"] == "API-Key test-cms-key"
+
+    await service.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_missing_media_returns_none(httpx_mock, mock_settings):
+    httpx_mock.add_response(url="http://test-cms.local/api/media/missing", status_code=404)
+    service = AssetService(mock_settings)
+
+    assert await service.get_media_by_id("missing") is None
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_upload_image_streams_download_into_cms(
+    httpx_mock, mock_settings, mock_cms_response
+):
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 32)).save(buffer, format="PNG")
+    png = buffer.getvalue()
+    httpx_mock.add_response(url="https://cdn.example.com/frame.png", content=png)
+    httpx_mock.add_response(
+        method="POST", url="http://test-cms.local/api/media", json=mock_cms_response
+    )
+    service = AssetService(mock_settings)
+
+    record = await service.upload_image("https://cdn.example.com/frame.png", "frame.png")
+
+    assert record["id"] == "test-media-id-123"
+    upload = httpx_mock.get_requests(method="POST")[0]
+    assert png in upload.content
+    assert b'"width":64' in upload.content
+    assert b"Content-Type: image/png" in upload.content
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_upload_image_spools_download_of_unknown_size(
+    httpx_mock, mock_settings, mock_cms_response
+):
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 32)).save(buffer, format="PNG")
+    png = buffer.getvalue()
+    httpx_mock.add_response(
+        url="https://cdn.example.com/chunked.png",
+        stream=IteratorStream([png[:10], png[10:]]),
+    )
+    httpx_mock.add_response(
+        method="POST", url="http://test-cms.local/api/media", json=mock_cms_response
+    )
+    service = AssetService(mock_settings)
+
+    await service.upload_image("https://cdn.example.com/chunked.png", "chunked.png")
+
+    upload = httpx_mock.get_requests(method="POST")[0]
+    assert png in upload.content
+    assert f'"file_size":{len(png)}'.encode() in upload.content
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_upload_image_streams_spilled_download_from_disk(
+    httpx_mock, mock_settings, mock_cms_response, monkeypatch
+):
+    monkeypatch.setattr(asset_service, "_SPOOL_MAX_SIZE", 16)
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 32)).save(buffer, format="PNG")
+    png = buffer.getvalue()
+    httpx_mock.add_response(
+        url="https://cdn.example.com/large.png",
+        stream=IteratorStream([png[:10], png[10:20], png[20:]]),
+    )
+    httpx_mock.add_response(
+        method="POST", url="http://test-cms.local/api/media", json=mock_cms_response
+    )
+    service = AssetService(mock_settings)
+
+    await service.upload_image("https://cdn.example.com/large.png", "large.png")
+
+    upload = httpx_mock.get_requests(method="POST")[0]
+    assert png in upload.content
+    assert int(upload.headers["Content-Length"]) == len(upload.content)
+    await service.aclose()
+
+
+def test_get_image_info_reads_header_of_large_image(mock_settings):
+    buffer = io.BytesIO()
+    Image.effect_noise((600, 400), 64).convert("RGB").save(buffer, format="PNG")
+    data = buffer.getvalue()
+    assert len(data) > 64 * 1024
+
+    info = AssetService(mock_settings)._get_image_info(data)
+
+    assert info == {"width": 600, "height": 400, "format": "png"}
+
+
+def test_get_image_info_defaults_for_non_image(mock_settings):
+    info = AssetService(mock_settings)._get_image_info(b"not an image")
+
+    assert info == {"width": 0, "height": 0, "format": "png"}
+
+
+@pytest.mark.asyncio
+async def test_get_media_retries_server_errors(
+    httpx_mock, mock_settings, mock_cms_response, monkeypatch
+):
+    monkeypatch.setattr("src.providers._retry.random.uniform", lambda a, b: 0)
+    url = "http://test-cms.local/api/media/test-media-id-123"
+    httpx_mock.add_response(url=url, status_code=503)
+    httpx_mock.add_response(url=url, json=mock_cms_response)
+    service = AssetService(mock_settings)
+
+    record = await service.get_media_by_id("test-media-id-123")
+
+    assert record["id"] == "test-media-id-123"
+    assert len(httpx_mock.get_requests()) == 2
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_repeat_uploads_of_same_url_are_shared(
+    httpx_mock, mock_settings, mock_cms_response
+):
+    httpx_mock.add_response(url="https://cdn.example.com/frame.png", content=b"png")
+    httpx_mock.add_response(
+        method="POST", url="http://test-cms.local/api/media", json=mock_cms_response
+    )
+    service = AssetService(mock_settings)
+    url = "https://cdn.example.com/frame.png"
+
+    first, second = await asyncio.gather(
+        service.upload_image(url, "frame.png"), service.upload_image(url, "frame.png")
+    )
+    third = await service.upload_image(url, "frame_retry.png")
+
+    assert first == second == third
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_check_connection_uses_head(httpx_mock, mock_settings):
+    httpx_mock.add_response(
+        method="HEAD", url="http://test-cms.local/api/media", status_code=405
+    )
+    service = AssetService(mock_settings)
+
+    assert await service.check_connection() is True
+    await service.aclose()
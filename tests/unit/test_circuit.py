@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.providers._circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.providers.base import ProviderError
+
+
+def test_opens_after_threshold_and_half_opens_after_cooldown():
+    breaker = CircuitBreaker("fal", fail_threshold=2, reset_after=0)
+
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    # Cooldown of zero lets the next call through as a trial
+    assert not breaker.is_open()
+    assert breaker.state == HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_half_open_lets_exactly_one_trial_through():
+    breaker = CircuitBreaker("fal", fail_threshold=1, reset_after=0)
+    breaker.record_failure()
+
+    assert not breaker.is_open()
+    # Concurrent callers are rejected while the trial is outstanding
+    assert breaker.is_open()
+    assert breaker.is_open()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert not breaker.is_open()
+    assert not breaker.is_open()
+
+
+@pytest.mark.asyncio
+async def test_abandoned_trial_is_handed_to_the_next_caller():
+    breaker = CircuitBreaker("fal", fail_threshold=1, reset_after=0)
+    breaker.record_failure()
+
+    async def cancelled():
+        raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        await breaker.call(cancelled)
+
+    assert breaker.state == HALF_OPEN
+    assert not breaker.is_open()
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast():
+    breaker = CircuitBreaker("fal", fail_threshold=1, reset_after=60)
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        return httpx.Response(503)
+
+    await breaker.call(fn)
+    with pytest.raises(ProviderError) as exc_info:
+        await breaker.call(fn)
+
+    assert exc_info.value.error_code == "CIRCUIT_OPEN"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_client_errors_count_as_success():
+    breaker = CircuitBreaker("fal", fail_threshold=1)
+
+    async def fn():
+        return httpx.Response(422)
+
+    await breaker.call(fn)
+    assert breaker.state == CLOSED
@@ -0,0 +1,204 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.providers import _http
+from src.providers._image_cache import image_cache, pending_requests
+from src.providers.base import ProviderError
+from src.providers.base import ImageGenerationParams
+from src.providers.fal_provider import FalProvider
+
+
+QUEUE = "https://queue.fal.run/fal-ai/flux/schnell"
+
+
+def mock_queue(httpx_mock, images, status="COMPLETED", request_id="req-1"):
+    httpx_mock.add_response(method="POST", url=QUEUE, json={"request_id": request_id})
+    httpx_mock.add_response(
+        url=f"{QUEUE}/requests/{request_id}/status", json={"status": status}
+    )
+    if status == "COMPLETED":
+        httpx_mock.add_response(
+            url=f"{QUEUE}/requests/{request_id}", json={"images": images}
+        )
+
+
+@pytest.fixture
+def params():
+    return ImageGenerationParams(prompt="A foggy harbour", model="fal-ai/flux/schnell")
+
+
+@pytest.mark.asyncio
+async def test_generate_image_parses_result(httpx_mock, params):
+    mock_queue(httpx_mock, [{"url": "https://cdn.example.com/a.png", "width": 512}])
+    provider = FalProvider(api_key="test-key")
+
+    result = await provider.generate_image(params)
+
+    assert result.url == "https://cdn.example.com/a.png"
+    assert result.width == 512
+    assert result.provider == "fal"
+    assert result.metadata["fal_request_id"] == "req-1"
+    assert not pending_requests
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_provider_calls_share_one_client():
+    first = await _http.get_client()
+    second = await _http.get_client()
+    assert first is second
+
+    await _http.close_client()
+    assert first.is_closed
+    assert await _http.get_client() is not first
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_seeded_generation_is_served_from_cache(httpx_mock):
+    image_cache.clear()
+    mock_queue(httpx_mock, [{"url": "https://cdn.example.com/seeded.png"}])
+    provider = FalProvider(api_key="test-key")
+    params = ImageGenerationParams(
+        prompt="A foggy harbour", model="fal-ai/flux/schnell", seed=7
+    )
+
+    first = await provider.generate_image(params)
+    second = await provider.generate_image(params)
+
+    assert first is second
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    image_cache.clear()
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_generation_is_resumed(httpx_mock):
+    image_cache.clear()
+    pending_requests.clear()
+    mock_queue(httpx_mock, [], status="IN_PROGRESS")
+    params = ImageGenerationParams(
+        prompt="A foggy harbour", model="fal-ai/flux/schnell", seed=7
+    )
+    provider = FalProvider(api_key="test-key", timeout=0)
+
+    with pytest.raises(ProviderError) as exc_info:
+        await provider.generate_image(params)
+    assert exc_info.value.error_code == "TIMEOUT"
+    assert exc_info.value.details["resumable"] is True
+    assert len(pending_requests) == 1
+
+    httpx_mock.add_response(url=f"{QUEUE}/requests/req-1/status", json={"status": "COMPLETED"})
+    httpx_mock.add_response(
+        url=f"{QUEUE}/requests/req-1",
+        json={"images": [{"url": "https://cdn.example.com/late.png"}]},
+    )
+    result = await FalProvider(api_key="test-key").generate_image(params)
+
+    assert result.url == "https://cdn.example.com/late.png"
+    # Only the first call submitted to the queue
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    assert not pending_requests
+    image_cache.clear()
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_unseeded_generations_are_never_merged(httpx_mock, params):
+    pending_requests.clear()
+    mock_queue(httpx_mock, [{"url": "https://cdn.example.com/1.png"}], request_id="req-1")
+    mock_queue(httpx_mock, [{"url": "https://cdn.example.com/2.png"}], request_id="req-2")
+    provider = FalProvider(api_key="test-key")
+
+    results = await asyncio.gather(
+        provider.generate_image(params), provider.generate_image(params)
+    )
+
+    assert {r.url for r in results} == {
+        "https://cdn.example.com/1.png",
+        "https://cdn.example.com/2.png",
+    }
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+    assert not pending_requests
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_failed_status_poll_drops_pending_request(httpx_mock):
+    image_cache.clear()
+    pending_requests.clear()
+    httpx_mock.add_response(method="POST", url=QUEUE, json={"request_id": "req-1"})
+    httpx_mock.add_response(url=f"{QUEUE}/requests/req-1/status", status_code=404)
+    params = ImageGenerationParams(
+        prompt="A foggy harbour", model="fal-ai/flux/schnell", seed=7
+    )
+
+    with pytest.raises(ProviderError) as exc_info:
+        await FalProvider(api_key="test-key").generate_image(params)
+
+    assert exc_info.value.error_code == "404"
+    assert not pending_requests
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_submission_is_not_resent(httpx_mock, params):
+    pending_requests.clear()
+    httpx_mock.add_exception(httpx.ReadTimeout("slow"), method="POST", url=QUEUE)
+
+    with pytest.raises(ProviderError) as exc_info:
+        await FalProvider(api_key="test-key").generate_image(params)
+
+    assert exc_info.value.error_code == "TIMEOUT"
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_batch_generation_uses_one_queue_request(httpx_mock, params):
+    pending_requests.clear()
+    mock_queue(
+        httpx_mock,
+        [{"url": f"https://cdn.example.com/{i}.png"} for i in range(3)],
+    )
+    provider = FalProvider(api_key="test-key")
+
+    results = await provider.generate_images_batch(params, 3)
+
+    assert [r.url for r in results] == [f"https://cdn.example.com/{i}.png" for i in range(3)]
+    assert [r.metadata["batch_index"] for r in results] == [0, 1, 2]
+    submit = httpx_mock.get_requests(method="POST")
+    assert len(submit) == 1
+    assert b'"num_images":3' in submit[0].content
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_rejected_submission_raises_provider_error(httpx_mock, params):
+    pending_requests.clear()
+    httpx_mock.add_response(method="POST", url=QUEUE, status_code=401, json={"detail": "bad key"})
+    provider = FalProvider(api_key="test-key")
+
+    with pytest.raises(ProviderError) as exc_info:
+        await provider.generate_image(params)
+
+    assert exc_info.value.error_code == "401"
+    assert exc_info.value.details == {"detail": "bad key"}
+    assert not pending_requests
+    await _http.close_client()
+
+
+@pytest.mark.asyncio
+async def test_health_result_is_reused_within_ttl(httpx_mock):
+    httpx_mock.add_response(url="https://fal.run/fal-ai/flux/schnell", status_code=422)
+    provider = FalProvider(api_key="test-key")
+
+    first = await provider.check_health()
+    second = await provider.check_health()
+
+    assert first.status == "healthy"
+    assert second is first
+    assert len(httpx_mock.get_requests()) == 1
+    await _http.close_client()
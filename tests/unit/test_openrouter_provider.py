@@ -0,0 +1,17 @@
+from src.providers.openrouter_provider import OpenRouterProvider
+
+
+def test_extract_image_url_returns_first_url_with_path():
+    provider = OpenRouterProvider(api_key="test-key")
+    content = "Here: https://cdn.example.com/img/a.png?x=1 and https://other.example.com/b.png"
+
+    assert (
+        provider._extract_image_url_from_response(content)
+        == "https://cdn.example.com/img/a.png?x=1"
+    )
+
+
+def test_extract_image_url_without_url():
+    provider = OpenRouterProvider(api_key="test-key")
+
+    assert provider._extract_image_url_from_response("no image here") is None
@@ -0,0 +1,62 @@
+import asyncio
+
+from src.services.provider_factory import ProviderFactory
+
+
+def test_health_check_is_cached_within_ttl(mock_settings, mock_fal_provider):
+    factory = ProviderFactory(mock_settings)
+    factory._providers = {"fal": mock_fal_provider}
+
+    async def probe_twice():
+        first = await factory.health_check()
+        second = await factory.health_check()
+        return first, second
+
+    first, second = asyncio.run(probe_twice())
+    assert first == second == {"fal": "healthy"}
+    assert mock_fal_provider.check_health.await_count == 1
+
+
+def test_providers_share_the_configured_health_ttl(mock_settings):
+    mock_settings.health_cache_ttl = 2.0
+    factory = ProviderFactory(mock_settings)
+
+    assert {p._health_ttl for p in factory._providers.values()} == {2.0}
+
+
+def test_health_check_refreshes_after_ttl(mock_settings, mock_fal_provider):
+    mock_settings.health_cache_ttl = 0
+    factory = ProviderFactory(mock_settings)
+    factory._providers = {"fal": mock_fal_provider}
+
+    async def probe_twice():
+        await factory.health_check()
+        await factory.health_check()
+
+    asyncio.run(probe_twice())
+    assert mock_fal_provider.check_health.await_count == 2
+
+
+def test_health_check_times_out_hung_provider(mock_settings, mock_fal_provider):
+    mock_settings.health_check_timeout = 0.01
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    mock_fal_provider.check_health.side_effect = hang
+    factory = ProviderFactory(mock_settings)
+    factory._providers = {"fal": mock_fal_provider}
+
+    assert asyncio.run(factory.health_check()) == {"fal": "unhealthy"}
+
+
+def test_supported_models_are_deduplicated_in_provider_order(mock_settings):
+    factory = ProviderFactory(mock_settings)
+    fal_models = factory._providers["fal"].get_supported_models()
+    openrouter_models = factory._providers["openrouter"].get_supported_models()
+
+    models = factory.get_supported_models()
+
+    assert models == tuple(dict.fromkeys(fal_models + openrouter_models))
+    assert factory.get_supported_models("fal") == fal_models
+    assert factory.get_supported_models("missing") == ()
@@ -0,0 +1,17 @@
+import asyncio
+
+import pytest
+
+from src.services.rate_limiter import AsyncRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_acquire_spaces_calls_by_interval():
+    limiter = AsyncRateLimiter(rps=50)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+    # First call is immediate, the other three wait one 20ms interval each
+    assert loop.time() - start >= 0.055
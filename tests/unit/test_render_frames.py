@@ -1,7 +1,13 @@
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
+from fastapi.testclient import TestClient
 
+from src.main import app
+from src.providers.base import ProviderError
 from src.routers.visual import _size_from_aspect_ratio, _build_prompt
-from src.models.visual import (
+from src.models.render import (
     RenderStoryboardFramesRequest,
     StoryboardFrameInput,
     CharacterProfile,
@@ -46,3 +52,113 @@ def test_request_model_defaults():
     assert req.render_settings.aspect_ratio == "16:9"
     assert req.render_settings.model == "fal-ai/flux-pro"
 
+
+
+@pytest.fixture
+def render_client(mock_settings, mock_fal_provider):
+    factory = MagicMock()
+    factory.settings = mock_settings
+    factory.get_provider.return_value = mock_fal_provider
+    app.state.provider_factory = factory
+    yield TestClient(app), mock_fal_provider
+    del app.state.provider_factory
+
+
+def _frames_payload(count):
+    return {
+        "storyboard_frames": [
+            {"frame_id": f"F{i}", "description": f"Scene {i}"} for i in range(count)
+        ],
+        "character_profiles": [],
+    }
+
+
+def test_render_frames_generates_all_frames_in_order(render_client):
+    client, provider = render_client
+
+    resp = client.post("/api/v1/visual/render-frames", json=_frames_payload(3))
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [f["frame_id"] for f in data["generated_frames"]] == ["F0", "F1", "F2"]
+    assert data["failed_frames"] == []
+    assert provider.generate_image.await_count == 3
+
+
+def test_render_frames_reports_provider_failure(render_client, mock_image_result):
+    client, provider = render_client
+    provider.generate_image.side_effect = [
+        mock_image_result,
+        ProviderError("boom", provider="fal", error_code="TIMEOUT"),
+    ]
+
+    resp = client.post("/api/v1/visual/render-frames", json=_frames_payload(2))
+
+    data = resp.json()
+    assert [f["frame_id"] for f in data["generated_frames"]] == ["F0"]
+    assert data["failed_frames"] == [{"frame_id": "F1", "error": "TIMEOUT"}]
+
+
+def test_render_frames_drops_frames_after_first_failure_in_frame_order(
+    render_client, mock_image_result
+):
+    client, provider = render_client
+
+    async def generate(params):
+        if params.prompt == "Scene 1":
+            await asyncio.sleep(0.01)
+            raise ProviderError("boom", provider="fal", error_code="TIMEOUT")
+        return mock_image_result
+
+    provider.generate_image.side_effect = generate
+
+    resp = client.post("/api/v1/visual/render-frames", json=_frames_payload(3))
+
+    data = resp.json()
+    # F2 finished before F1 failed but comes after it, so it is left out
+    assert [f["frame_id"] for f in data["generated_frames"]] == ["F0"]
+    assert data["failed_frames"] == [{"frame_id": "F1", "error": "TIMEOUT"}]
+
+
+def test_render_frames_reports_shared_failure_once(render_client):
+    client, provider = render_client
+    provider.generate_image.side_effect = ProviderError(
+        "boom", provider="fal", error_code="TIMEOUT"
+    )
+    payload = _frames_payload(2)
+    payload["storyboard_frames"][1]["description"] = "Scene 0"
+    payload["render_settings"] = {"seed": 42}
+
+    resp = client.post("/api/v1/visual/render-frames", json=payload)
+
+    data = resp.json()
+    assert data["generated_frames"] == []
+    assert data["failed_frames"] == [{"frame_id": "F0", "error": "TIMEOUT"}]
+
+
+def test_render_frames_shares_calls_for_identical_seeded_frames(render_client):
+    client, provider = render_client
+    payload = _frames_payload(2)
+    payload["storyboard_frames"][1]["description"] = "Scene 0"
+    payload["render_settings"] = {"seed": 42}
+
+    resp = client.post("/api/v1/visual/render-frames", json=payload)
+
+    assert len(resp.json()["generated_frames"]) == 2
+    assert provider.generate_image.await_count == 1
+
+
+def test_render_frames_renders_identical_unseeded_frames_separately(render_client):
+    client, provider = render_client
+    payload = _frames_payload(2)
+    payload["storyboard_frames"][1]["description"] = "Scene 0"
+
+    resp = client.post("/api/v1/visual/render-frames", json=payload)
+
+    assert len(resp.json()["generated_frames"]) == 2
+    assert provider.generate_image.await_count == 2
+
+
+def test_size_from_aspect_ratio_invalid_falls_back():
+    assert _size_from_aspect_ratio("wide") == (1280, 720)
+    assert _size_from_aspect_ratio("0:9") == (1280, 720)
@@ -0,0 +1,98 @@
+import httpx
+import pytest
+
+from src.providers._retry import retry, retry_provider_call
+from src.providers.base import ProviderError
+
+
+def responder(*outcomes):
+    calls = []
+
+    async def fn():
+        outcome = outcomes[len(calls)]
+        calls.append(outcome)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome)
+
+    return fn, calls
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_status_then_succeeds():
+    fn, calls = responder(503, 429, 200)
+
+    response = await retry(fn, base=0)
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    fn, calls = responder(401, 200)
+
+    response = await retry(fn, base=0)
+
+    assert response.status_code == 401
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_reraised_when_budget_exhausted():
+    fn, calls = responder(*[httpx.ReadTimeout("slow")] * 2)
+
+    with pytest.raises(httpx.TimeoutException):
+        await retry(fn, max_tries=2, base=0)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_call_retries_rate_limit_but_not_circuit_open():
+    errors = [ProviderError("busy", provider="fal", error_code="429")]
+
+    async def flaky():
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert await retry_provider_call(flaky, base=0) == "ok"
+
+    calls = []
+
+    async def open_circuit():
+        calls.append(1)
+        raise ProviderError("fal circuit open", provider="fal", error_code="CIRCUIT_OPEN")
+
+    with pytest.raises(ProviderError):
+        await retry_provider_call(open_circuit, base=0)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_call_retries_timeout_only_when_resumable():
+    calls = []
+
+    async def timed_out():
+        calls.append(1)
+        raise ProviderError("timeout", provider="openrouter", error_code="TIMEOUT")
+
+    with pytest.raises(ProviderError):
+        await retry_provider_call(timed_out, base=0)
+    assert len(calls) == 1
+
+    errors = [
+        ProviderError(
+            "timeout",
+            provider="fal",
+            error_code="TIMEOUT",
+            details={"request_id": "req-1", "resumable": True},
+        )
+    ]
+
+    async def resumed():
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert await retry_provider_call(resumed, base=0) == "ok"
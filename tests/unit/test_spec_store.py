@@ -1,13 +1,9 @@
+import asyncio
 from time import perf_counter
-from src.services.spec_store import SpecStore
 
+import pytest
 
-def setup_module(module):
-    # reset state for isolation
-    SpecStore.state.requests.clear()
-    SpecStore.state.boards.clear()
-    SpecStore.state.board_by_request.clear()
-    SpecStore.state.concepts_by_board.clear()
+from src.services.spec_store import SpecStore
 
 
 def test_create_and_get_request():
@@ -37,3 +33,64 @@ def test_pagination_perf_under_threshold():
     assert len(items) <= 200
     # threshold ~500ms per requirement
     assert elapsed_ms < 500
+
+
+def test_add_concepts_batch_inserts_all_items():
+    req = SpecStore.create_request({"projectId": "p1", "title": "t", "description": "d"})
+    board = SpecStore.create_board(req["id"], "s")
+    items = [{"caption": f"c{i}"} for i in range(3)]
+
+    concepts = asyncio.run(SpecStore.add_concepts_batch(board["id"], items))
+
+    assert [c["caption"] for c in concepts] == ["c0", "c1", "c2"]
+    assert SpecStore.state.boards[board["id"]].conceptCount == 3
+
+
+def test_add_concepts_skips_identical_content_on_same_board():
+    req = SpecStore.create_request({"projectId": "p1", "title": "t", "description": "d"})
+    board = SpecStore.create_board(req["id"], "s")
+    item = {"caption": "c", "tags": ["b", "a"], "imageUrls": ["https://x/1.png"]}
+
+    SpecStore.add_concepts(board["id"], [item])
+    concepts = SpecStore.add_concepts(board["id"], [item, {**item, "tags": ["a", "b"]}])
+
+    assert len(concepts) == 1
+    assert SpecStore.state.boards[board["id"]].conceptCount == 1
+
+
+def test_list_requests_pages_newest_first_with_filters():
+    for i in range(5):
+        SpecStore.create_request({"projectId": "paged", "title": f"t{i}", "description": "d"})
+
+    first, cursor = SpecStore.list_requests(project_id="paged", status=None, limit=2, cursor=None)
+    second, cursor2 = SpecStore.list_requests(project_id="paged", status=None, limit=2, cursor=cursor)
+    last, cursor3 = SpecStore.list_requests(project_id="paged", status=None, limit=2, cursor=cursor2)
+
+    assert [i["title"] for i in first + second + last] == ["t4", "t3", "t2", "t1", "t0"]
+    assert cursor3 is None
+
+
+def test_delete_request_drops_it_from_indexes():
+    item = SpecStore.create_request({"projectId": "gone", "title": "t", "description": "d"})
+
+    SpecStore.delete_request(item["id"])
+
+    assert "gone" not in SpecStore.state.requests_by_project
+    assert item["id"] not in SpecStore.state.requests_by_status["Submitted"]
+    assert SpecStore.list_requests(project_id="gone", status=None, limit=10, cursor=None) == ([], None)
+
+
+def test_list_requests_cursor_survives_deleting_last_seen_item():
+    for i in range(4):
+        SpecStore.create_request({"projectId": "keyset", "title": f"k{i}", "description": "d"})
+
+    first, cursor = SpecStore.list_requests(project_id="keyset", status=None, limit=2, cursor=None)
+    SpecStore.delete_request(first[-1]["id"])
+    second, _ = SpecStore.list_requests(project_id="keyset", status=None, limit=2, cursor=cursor)
+
+    assert [i["title"] for i in second] == ["k1", "k0"]
+
+
+def test_approve_unknown_board_raises_key_error():
+    with pytest.raises(KeyError):
+        SpecStore.approve_board("missing-board")
@@ -0,0 +1,31 @@
+from src.templates import StyleTemplate, TemplateManager
+
+
+def test_apply_template_reuses_rendered_result():
+    manager = TemplateManager()
+
+    first = manager.apply_template("cinematic", "a harbor at dawn", {"mood": "calm"})
+    second = manager.apply_template("cinematic", "a harbor at dawn", {"mood": "calm"})
+
+    assert first is second
+    assert first["prompt"].startswith("A cinematic a harbor at dawn")
+    assert first["prompt"].endswith("film grain, depth of field")
+
+
+def test_add_custom_template_invalidates_rendered_prompts():
+    manager = TemplateManager()
+    manager.apply_template("cinematic", "an alley")
+
+    manager.add_custom_template(
+        "cinematic",
+        StyleTemplate(
+            name="Noir",
+            base_prompt="Film noir {scene_description}",
+            style_modifiers=["high contrast"],
+            recommended_settings={},
+        ),
+    )
+
+    assert manager.apply_template("cinematic", "an alley")["prompt"] == (
+        "Film noir an alley, high contrast"
+    )
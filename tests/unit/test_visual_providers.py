@@ -0,0 +1,27 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+
+def test_providers_snapshot_is_reused_until_stale(mock_settings):
+    factory = MagicMock()
+    factory.settings = mock_settings
+    factory.get_available_providers.return_value = ["fal"]
+    factory.get_supported_models.return_value = ("fal-ai/flux/schnell",)
+    factory.get_supported_styles.return_value = ["cinematic"]
+    factory.health_check = AsyncMock(return_value={"fal": "healthy"})
+    app.state.provider_factory = factory
+    try:
+        client = TestClient(app)
+        first = client.get("/api/v1/visual/providers").json()
+        second = client.get("/api/v1/visual/providers").json()
+    finally:
+        del app.state.provider_factory
+        del app.state.providers_snapshot
+
+    assert first == second
+    assert first["models"] == {"fal": ["fal-ai/flux/schnell"]}
+    assert first["health"] == {"fal": "healthy"}
+    assert factory.health_check.await_count == 1
@@ -0,0 +1,317 @@
+import asyncio
+import time
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models import ConceptGenerationRequest, Scene, StoryboardGenerationRequest
+from src.providers.base import ImageGenerationParams, ProviderError
+from src.services.visual_service import VisualService, _generation_id
+from src.templates import StyleTemplate, TemplateManager
+
+
+def plain_templates():
+    templates = TemplateManager()
+    templates.add_custom_template(
+        "plain",
+        StyleTemplate(
+            name="Plain",
+            base_prompt="{scene_description}",
+            style_modifiers=[],
+            recommended_settings={"steps": 20},
+        ),
+    )
+    return templates
+
+
+@pytest.mark.asyncio
+async def test_admit_bounds_generations_per_provider(mock_settings):
+    mock_settings.generation_concurrency = 2
+    service = VisualService(MagicMock(), MagicMock(), mock_settings)
+    active = peak = 0
+
+    async def generate(provider_name):
+        nonlocal active, peak
+        async with service._admit(provider_name):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(generate("fal") for _ in range(6)))
+
+    assert peak == 2
+    assert not service._provider_limits["fal"].locked()
+
+
+@pytest.mark.asyncio
+async def test_admit_passes_slot_on_when_woken_waiter_is_cancelled(mock_settings):
+    mock_settings.generation_concurrency = 1
+    service = VisualService(MagicMock(), MagicMock(), mock_settings)
+
+    async def enter():
+        async with service._admit("fal"):
+            return True
+
+    async with service._admit("fal"):
+        cancelled = asyncio.create_task(enter())
+        waiter = asyncio.create_task(enter())
+        await asyncio.sleep(0)
+    # Releasing the slot woke `cancelled`; cancel it before it gets to run
+    cancelled.cancel()
+
+    assert await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_concept_variations_get_distinct_seeds(
+    mock_settings, mock_fal_provider, mock_cms_response
+):
+    factory = MagicMock()
+    factory.get_provider.return_value = mock_fal_provider
+    assets = MagicMock()
+    assets.upload_image = AsyncMock(return_value=mock_cms_response)
+    service = VisualService(
+        factory, assets, mock_settings, template_manager=plain_templates()
+    )
+
+    response = await service.generate_concept(
+        ConceptGenerationRequest(
+            prompt="a lighthouse", style_preset="plain", variations=3, seed=10
+        )
+    )
+
+    seeds = sorted(
+        call.args[0].seed for call in mock_fal_provider.generate_image.await_args_list
+    )
+    assert seeds == [10, 11, 12]
+    assert len(response.assets) == 3
+
+
+@pytest.mark.asyncio
+async def test_warmup_probes_providers_and_cms(mock_settings):
+    factory = MagicMock()
+    factory.health_check = AsyncMock(return_value={"fal": "healthy"})
+    assets = MagicMock()
+    assets.check_connection = AsyncMock(return_value=True)
+    service = VisualService(factory, assets, mock_settings)
+
+    assert await service.warmup() == {"fal": "healthy"}
+    assets.check_connection.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_storyboard_keeps_scene_order_and_reports_progress(
+    mock_settings, mock_fal_provider, mock_image_result, mock_cms_response
+):
+    async def generate(params):
+        if params.prompt == "scene 0":
+            raise ProviderError("rejected", provider="fal", error_code="400")
+        await asyncio.sleep(0.01 if params.prompt == "scene 1" else 0)
+        return mock_image_result
+
+    mock_fal_provider.generate_image.side_effect = generate
+    factory = MagicMock()
+    factory.get_provider.return_value = mock_fal_provider
+    assets = MagicMock()
+    assets.upload_image = AsyncMock(return_value=mock_cms_response)
+    service = VisualService(
+        factory, assets, mock_settings, template_manager=plain_templates()
+    )
+    progress = []
+
+    response = await service.generate_storyboard(
+        StoryboardGenerationRequest(
+            project_id="p1",
+            style_preset="plain",
+            scenes=[Scene(description=f"scene {i}") for i in range(3)],
+        ),
+        progress_callback=progress.append,
+    )
+
+    assert [a.metadata["scene_index"] for a in response.assets] == [1, 2]
+    assert response.completed_scenes == 2
+    assert progress == sorted(progress) and progress[-1] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_storyboard_failure_budget_awaits_cancelled_scenes(
+    mock_settings, mock_fal_provider, mock_cms_response
+):
+    cancelled = []
+
+    async def generate(params):
+        if params.prompt != "scene 0":
+            raise ProviderError("rejected", provider="fal", error_code="400")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(params.prompt)
+            raise
+
+    mock_fal_provider.generate_image.side_effect = generate
+    factory = MagicMock()
+    factory.get_provider.return_value = mock_fal_provider
+    service = VisualService(
+        factory, MagicMock(), mock_settings, template_manager=plain_templates()
+    )
+
+    response = await service.generate_storyboard(
+        StoryboardGenerationRequest(
+            project_id="p1",
+            style_preset="plain",
+            scenes=[Scene(description=f"scene {i}") for i in range(4)],
+        )
+    )
+
+    assert response.completed_scenes == 0
+    # The hanging scene was cancelled and awaited before the response returned
+    assert cancelled == ["scene 0"]
+
+
+@pytest.mark.asyncio
+async def test_identical_seeded_generations_share_one_provider_call(
+    mock_settings, mock_fal_provider, mock_image_result
+):
+    async def generate(params):
+        await asyncio.sleep(0.01)
+        return mock_image_result
+
+    mock_fal_provider.generate_image.side_effect = generate
+    service = VisualService(MagicMock(), MagicMock(), mock_settings)
+    params = ImageGenerationParams(prompt="a lighthouse", model="flux", seed=7)
+
+    results = await asyncio.gather(
+        service._generate_image(mock_fal_provider, params),
+        service._generate_image(mock_fal_provider, params),
+    )
+
+    assert results == [mock_image_result, mock_image_result]
+    assert mock_fal_provider.generate_image.await_count == 1
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_unseeded_generations_are_not_shared(
+    mock_settings, mock_fal_provider, mock_image_result
+):
+    mock_fal_provider.generate_image.return_value = mock_image_result
+    service = VisualService(MagicMock(), MagicMock(), mock_settings)
+    params = ImageGenerationParams(prompt="a lighthouse", model="flux")
+
+    await asyncio.gather(
+        service._generate_image(mock_fal_provider, params),
+        service._generate_image(mock_fal_provider, params),
+    )
+
+    assert mock_fal_provider.generate_image.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_generation_failure_reaches_every_caller(
+    mock_settings, mock_fal_provider
+):
+    async def generate(params):
+        await asyncio.sleep(0.01)
+        raise ProviderError("rejected", provider="fal", error_code="400")
+
+    mock_fal_provider.generate_image.side_effect = generate
+    service = VisualService(MagicMock(), MagicMock(), mock_settings)
+    params = ImageGenerationParams(prompt="a lighthouse", model="flux", seed=7)
+
+    results = await asyncio.gather(
+        service._generate_image(mock_fal_provider, params),
+        service._generate_image(mock_fal_provider, params),
+        return_exceptions=True,
+    )
+
+    assert [r.error_code for r in results] == ["400", "400"]
+    assert mock_fal_provider.generate_image.await_count == 1
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_original_caller_does_not_fail_waiters(
+    mock_settings, mock_fal_provider, mock_image_result
+):
+    async def generate(params):
+        await asyncio.sleep(0.01)
+        return mock_image_result
+
+    mock_fal_provider.generate_image.side_effect = generate
+    service = VisualService(MagicMock(), MagicMock(), mock_settings)
+    params = ImageGenerationParams(prompt="a lighthouse", model="flux", seed=7)
+
+    original = asyncio.create_task(service._generate_image(mock_fal_provider, params))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(service._generate_image(mock_fal_provider, params))
+    await asyncio.sleep(0)
+    original.cancel()
+
+    assert await waiter == mock_image_result
+    assert original.cancelled()
+    # The waiter made its own call once the original was cancelled
+    assert mock_fal_provider.generate_image.await_count == 2
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_concept_uses_batch_generation_when_supported(
+    mock_settings, mock_fal_provider, mock_image_result, mock_cms_response
+):
+    mock_fal_provider.supports_batch_generation = True
+    mock_fal_provider.generate_images_batch = AsyncMock(
+        return_value=[mock_image_result] * 3
+    )
+    factory = MagicMock()
+    factory.get_provider.return_value = mock_fal_provider
+    assets = MagicMock()
+    assets.upload_image = AsyncMock(return_value=mock_cms_response)
+    service = VisualService(
+        factory, assets, mock_settings, template_manager=plain_templates()
+    )
+
+    response = await service.generate_concept(
+        ConceptGenerationRequest(
+            prompt="a lighthouse", style_preset="plain", variations=3, seed=10
+        )
+    )
+
+    mock_fal_provider.generate_images_batch.assert_awaited_once()
+    mock_fal_provider.generate_image.assert_not_awaited()
+    assert [a.metadata["variation_index"] for a in response.assets] == [0, 1, 2]
+
+
+def test_generation_ids_are_time_ordered_uuid7():
+    first = _generation_id()
+    time.sleep(0.002)
+    second = _generation_id()
+
+    assert uuid.UUID(first).version == 7
+    assert first[:13] < second[:13]
+
+
+@pytest.mark.asyncio
+async def test_builtin_template_settings_do_not_clash_with_request(
+    mock_settings, mock_fal_provider, mock_cms_response
+):
+    factory = MagicMock()
+    factory.get_provider.return_value = mock_fal_provider
+    assets = MagicMock()
+    assets.upload_image = AsyncMock(return_value=mock_cms_response)
+    service = VisualService(factory, assets, mock_settings)
+
+    response = await service.generate_storyboard(
+        StoryboardGenerationRequest(
+            project_id="p1",
+            style_preset="cinematic",
+            aspect_ratio="1:1",
+            scenes=[Scene(description="a harbour"), Scene(description="a pier")],
+        )
+    )
+
+    assert response.completed_scenes == 2
+    params = [c.args[0] for c in mock_fal_provider.generate_image.await_args_list]
+    assert {p.aspect_ratio for p in params} == {"1:1"}
+    assert sorted("harbour" in p.prompt for p in params) == [False, True]
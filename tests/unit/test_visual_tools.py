@@ -0,0 +1,98 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.models import (
+    ConceptGenerationResponse,
+    GenerationStatus,
+    VisualAsset,
+    VisualType,
+)
+from src.tools import VisualTools
+
+
+@pytest.mark.asyncio
+async def test_generate_concepts_returns_asset_summaries():
+    tools = VisualTools()
+    asset = VisualAsset(
+        id="a1",
+        url="https://cdn.example.com/a1.png",
+        type=VisualType.CONCEPT,
+        width=1024,
+        height=576,
+        provider="fal",
+        model="fal-ai/flux/schnell",
+        prompt="a lighthouse",
+        metadata={"variation_index": 0},
+    )
+    tools.visual_service.generate_concept = AsyncMock(
+        return_value=ConceptGenerationResponse(
+            generation_id="g1",
+            status=GenerationStatus.COMPLETED,
+            assets=[asset],
+        )
+    )
+
+    result = await tools.generate_concepts(
+        "a lighthouse", reference_images=["https://example.com/ref.jpg"]
+    )
+
+    assert result["success"] is True
+    assert result["assets"] == [
+        {
+            "id": "a1",
+            "url": "https://cdn.example.com/a1.png",
+            "type": "concept",
+            "width": 1024,
+            "height": 576,
+            "provider": "fal",
+            "model": "fal-ai/flux/schnell",
+            "prompt": "a lighthouse",
+        }
+    ]
+    request = tools.visual_service.generate_concept.await_args.args[0]
+    assert str(request.reference_images[0]) == "https://example.com/ref.jpg"
+
+
+@pytest.mark.asyncio
+async def test_health_check_reuses_recent_result():
+    tools = VisualTools()
+    tools.provider_factory.health_check = AsyncMock(return_value={"fal": "healthy"})
+    tools.asset_service.check_connection = AsyncMock(return_value=True)
+
+    first = await tools.health_check()
+    second = await tools.health_check()
+
+    assert first == second
+    assert first["payloadcms"]["connected"] is True
+    tools.asset_service.check_connection.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_storyboard_returns_error_shape():
+    tools = VisualTools()
+    tools.visual_service.generate_storyboard = AsyncMock(side_effect=RuntimeError("boom"))
+
+    result = await tools.generate_storyboard("p1", [{"description": "a pier"}])
+
+    assert result == {
+        "success": False,
+        "generation_id": None,
+        "error": "boom",
+        "project_id": "p1",
+        "assets": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_storyboard_scenes_ignore_unknown_keys():
+    tools = VisualTools()
+    tools.visual_service.generate_storyboard = AsyncMock(side_effect=RuntimeError("stop"))
+
+    await tools.generate_storyboard(
+        "p1", [{"description": "a pier", "title": "Opening"}, {"mood": "dark"}]
+    )
+
+    request = tools.visual_service.generate_storyboard.await_args.args[0]
+    assert [scene.description for scene in request.scenes] == ["a pier", ""]
+    assert request.scenes[1].mood == "dark"